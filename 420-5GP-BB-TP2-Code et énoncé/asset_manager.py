@@ -0,0 +1,158 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator
+
+import pygame
+
+from sound_cache import SoundCache
+from sprite_bundle import SpriteBundle
+from tracer import Tracer
+
+
+class AssetManager:
+    """
+    Singleton pour le chargement et le partage des ressources (images, masques et sons).
+
+    Chaque ressource n'est décodée qu'une seule fois par processus. Les ressources sont comptabilisées par
+    portée (scope) : une portée (habituellement une scène) qui charge une ressource en devient détentrice et
+    la ressource est libérée lorsque plus aucune portée ne la détient.
+
+    Le chargement peut se faire à partir d'un thread de travail (décodage en mode RAW). La conversion au format
+    de l'affichage (CONVERT_ALPHA ou CONVERT) doit toutefois se faire dans le thread principal.
+    """
+
+    GLOBAL_SCOPE = "global"  # portée des ressources qui vivent aussi longtemps que le programme
+
+    # modes de conversion des images
+    CONVERT_ALPHA = "alpha"  # Surface.convert_alpha()
+    CONVERT = "opaque"       # Surface.convert()
+    RAW = "raw"              # image telle que décodée, sans conversion
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(AssetManager, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, '_initialized'):
+            self._assets = {}      # clé -> ressource décodée
+            self._ref_counts = {}  # clé -> nombre de portées qui détiennent la ressource
+            self._scopes = {}      # portée -> ensemble des clés détenues
+            self._local = threading.local()  # chaque thread a sa propre pile de portées
+            self._lock = threading.RLock()
+
+            self._initialized = True
+
+    @contextmanager
+    def scope(self, scope: Hashable) -> Iterator[None]:
+        """
+        Attribue à la portée fournie toutes les ressources chargées à l'intérieur du bloc.
+        :param scope: identifiant de la portée (par exemple, la scène qui charge les ressources)
+        """
+        self._scope_stack().append(scope)
+        try:
+            yield
+        finally:
+            self._scope_stack().pop()
+
+    def load_image(self, filename: str, mode: str = CONVERT_ALPHA) -> pygame.Surface:
+        """
+        Charge une image (ou la récupère du cache). La surface retournée est partagée : la copier avant de la modifier.
+        :param filename: chemin du fichier image
+        :param mode: mode de conversion (CONVERT_ALPHA, CONVERT ou RAW)
+        :return: la surface
+        """
+        key = ('image', filename, mode)
+        return self._get_or_create(key, lambda: self._decode_image(filename, mode))
+
+    def load_mask(self, filename: str, mode: str = CONVERT_ALPHA) -> pygame.Mask:
+        """
+        Construit le masque d'une image (ou le récupère du cache).
+        :param filename: chemin du fichier image
+        :param mode: mode de conversion de l'image à partir de laquelle le masque est construit
+        :return: le masque
+        """
+        key = ('mask', filename, mode)
+        return self._get_or_create(key, lambda: pygame.mask.from_surface(self.load_image(filename, mode)))
+
+    def load_sound(self, filename: str) -> pygame.mixer.Sound:
+        """
+        Charge un son (ou le récupère du cache). Le son est partagé : utiliser le canal retourné par play()
+        pour en ajuster le volume d'une seule instance. Les échantillons décodés sont aussi conservés sur disque
+        (voir SoundCache).
+        :param filename: chemin du fichier son
+        :return: le son
+        """
+        key = ('sound', filename)
+        return self._get_or_create(key, lambda: SoundCache().load(filename))
+
+    def load_bundle(self, filename: str) -> SpriteBundle:
+        """
+        Ouvre un paquet de sprites précompilé (ou le récupère du cache).
+        :param filename: chemin du paquet (voir sprite_bundle.py)
+        :return: le paquet
+        """
+        key = ('bundle', filename)
+        return self._get_or_create(key, lambda: SpriteBundle(filename))
+
+    def release(self, scope: Hashable) -> None:
+        """
+        Libère les ressources détenues par une portée. Une ressource est évincée du cache lorsque plus
+        aucune portée ne la détient.
+        :param scope: identifiant de la portée
+        """
+        if scope == AssetManager.GLOBAL_SCOPE:
+            return
+
+        with self._lock:
+            for key in self._scopes.pop(scope, ()):
+                self._ref_counts[key] -= 1
+                if self._ref_counts[key] == 0:
+                    del self._ref_counts[key]
+                    del self._assets[key]
+
+    def _get_or_create(self, key: tuple, create: Callable[[], Any]) -> Any:
+        """
+        Retourne la ressource associée à la clé en la créant au besoin. Le décodage se fait hors du verrou
+        afin qu'un thread de travail ne bloque pas le thread principal.
+        :param key: clé de la ressource
+        :param create: fonction qui décode la ressource
+        :return: la ressource
+        """
+        with self._lock:
+            asset = self._assets.get(key)
+        if asset is None:
+            with Tracer().span(f"load {key[0]} {key[1]}", "assets"):
+                asset = create()
+        with self._lock:
+            asset = self._assets.setdefault(key, asset)
+            self._acquire(key)
+        return asset
+
+    def _decode_image(self, filename: str, mode: str) -> pygame.Surface:
+        """ Décode une image et la convertit selon le mode demandé (en réutilisant l'image RAW si disponible). """
+        if mode == AssetManager.RAW:
+            return pygame.image.load(filename)
+
+        with self._lock:
+            raw = self._assets.get(('image', filename, AssetManager.RAW))
+        if raw is None:
+            raw = pygame.image.load(filename)
+        if mode == AssetManager.CONVERT_ALPHA:
+            return raw.convert_alpha()
+        return raw.convert()
+
+    def _scope_stack(self) -> list:
+        """ Retourne la pile de portées du thread courant. """
+        if not hasattr(self._local, 'scope_stack'):
+            self._local.scope_stack = [AssetManager.GLOBAL_SCOPE]
+        return self._local.scope_stack
+
+    def _acquire(self, key: tuple) -> None:
+        """ Inscrit la ressource auprès de la portée active (une seule fois par portée). """
+        keys = self._scopes.setdefault(self._scope_stack()[-1], set())
+        if key not in keys:
+            keys.add(key)
+            self._ref_counts[key] = self._ref_counts.get(key, 0) + 1
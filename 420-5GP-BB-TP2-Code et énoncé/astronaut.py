@@ -1,13 +1,16 @@
 import pygame
 import random
-import time
 
 from enum import Enum, auto
 
 
 
+from asset_manager import AssetManager
 from pad import Pad
+from game_clock import GameClock
 from game_settings import FILES
+from sprite_bundle import SpriteBundle
+from tracer import traced
 
 
 class AstronautState(Enum):
@@ -39,15 +42,18 @@ class Astronaut(pygame.sprite.Sprite):
                      AstronautState.JUMPING_LEFT : 0.15,
                      AstronautState.JUMPING_RIGHT : 0.15}
 
-    def __init__(self, source_pad: Pad, target_pad: Pad, trip_money: float) -> None:
+    def __init__(self, source_pad: Pad, target_pad: Pad, trip_money: float, clock: GameClock) -> None:
         """
         Initialise une instance d'astronaute.
         :param source_pad: le pad sur lequel apparaîtra l'astronaute
         :param target_pad: le pad où souhaite se rendre l'astronaute
         :param trip_money: le montant de départ pour la course (diminue avec le temps)
+        :param clock: l'horloge du jeu (animations et diminution du montant de la course)
         """
         super(Astronaut, self).__init__()
 
+        self._clock = clock
+
         self._source_pad = source_pad
         self._target_pad = target_pad
 
@@ -70,6 +76,7 @@ class Astronaut(pygame.sprite.Sprite):
         self.rect.y = self._source_pad.astronaut_start.y
 
         self._pos_x = float(self.rect.x)  # sert pour les calculs de position, plus précis qu'un entier
+        self._previous_pos_x = self._pos_x  # position au pas de simulation précédent (pour l'interpolation)
         self._target_x = 0.0  # position horizontale où l'astronaute tente de se rendre lorsqu'il saute
         self._velocity = 0.0
 
@@ -79,7 +86,7 @@ class Astronaut(pygame.sprite.Sprite):
         self._frames = self._all_frames[self._state]
         self._state_time = 0  # temps écoulé dans l'état actuel
         self._current_frame = 0
-        self._last_frame_time = time.time()
+        self._last_frame_time = self._clock.time()
 
         source = self._source_pad.astronaut_start
         end = 0
@@ -88,10 +95,7 @@ class Astronaut(pygame.sprite.Sprite):
         except:
             # en cas de go up
             end = [640,720]
-        print(source)
-        print(end)
         distance = source.distance_to(end)
-        print(distance)
         # distance = 0
         self.set_trip_money(distance)
 
@@ -103,10 +107,16 @@ class Astronaut(pygame.sprite.Sprite):
     def target_pad(self) -> Pad:
         return self._target_pad
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """ Dessine l'astronaute, sauf s'il est à bord du taxi. """
+    def draw(self, surface: pygame.Surface, interpolation: float = 1.0) -> list:
+        """
+        Dessine l'astronaute, sauf s'il est à bord du taxi.
+        :param interpolation: position entre le pas de simulation précédent (0.0) et le dernier (1.0)
+        :return: les zones de la surface modifiées
+        """
         if self._state != AstronautState.ONBOARD:
-            surface.blit(self.image, self.rect)
+            x = self._previous_pos_x + (self._pos_x - self._previous_pos_x) * interpolation
+            return [surface.blit(self.image, (round(x), self.rect.y))]
+        return []
 
     def get_trip_money(self) -> float:
         return self._trip_money
@@ -164,6 +174,7 @@ class Astronaut(pygame.sprite.Sprite):
         self.rect.y = y
 
         self._pos_x = float(self.rect.x)
+        self._previous_pos_x = self._pos_x
 
     def set_trip_money(self, trip_money: float) -> None:
 
@@ -175,7 +186,8 @@ class Astronaut(pygame.sprite.Sprite):
         :param args: inutilisé
         :param kwargs: inutilisé
         """
-        current_time = time.time()
+        current_time = self._clock.time()
+        self._previous_pos_x = self._pos_x
 
         # ÉTAPE 1 - diminuer le montant de la course si le moment est venu
         if self._last_saved_time is None:
@@ -252,58 +264,80 @@ class Astronaut(pygame.sprite.Sprite):
             self._pad_please_clips[self._target_pad.number].play()
 
     @staticmethod
+    @traced()
     def _load_and_build_frames() -> tuple:
         """
-        Charge et découpe la feuille de sprites (sprite sheet) pour un astronaute.
+        Charge les trames d'un astronaute (à partir du paquet de sprites s'il est à jour, sinon à partir de la
+        feuille de sprites) et construit les séquences d'animation.
         :return: un tuple contenant dans l'ordre:
                      - une liste de trames (image, masque) pour attendre
                      - une liste de trames (image, masque) pour envoyer la main
                      - une liste de trames (image, masque) pour se déplacer vers la gauche
                      - une liste de trames (image, masque) pour se déplacer vers la droite
         """
-        nb_images = Astronaut._NB_WAITING_IMAGES + Astronaut._NB_WAVING_IMAGES + Astronaut._NB_JUMPING_IMAGES
-        sprite_sheet = pygame.image.load(Astronaut._ASTRONAUT_FILENAME).convert_alpha()
-        sheet_width = sprite_sheet.get_width()
-        sheet_height = sprite_sheet.get_height()
-        image_size = (sheet_width / nb_images, sheet_height)
-
-        def create_surface(current_frame) -> pygame.Surface :
-            surface = pygame.Surface(image_size, flags=pygame.SRCALPHA)
-            source_rect = surface.get_rect()
-            source_rect.x = current_frame * source_rect.width
-            surface.blit(sprite_sheet, (0, 0), source_rect)
-            return surface
-
-        def create_mask(current_frame) -> pygame.Mask:
-            mask = pygame.mask.from_surface(create_surface(current_frame))
-            return mask
+        if SpriteBundle.is_fresh(FILES['sprite_bundle'], (Astronaut._ASTRONAUT_FILENAME,)):
+            bundle = AssetManager().load_bundle(FILES['sprite_bundle'])
+            frames = {name: bundle.frame(name) for name in Astronaut._bundle_frame_names()}
+        else:
+            frames = {name: (surface, pygame.mask.from_surface(surface))
+                      for name, surface in Astronaut._build_bundle_frames().items()}
 
         # astronaute qui attend
-        waiting_frames = [(create_surface(Astronaut._NB_WAITING_IMAGES), create_mask(Astronaut._NB_WAITING_IMAGES))]
+        waiting_frames = [frames[f"astronaut/{Astronaut._NB_WAITING_IMAGES}"]]
 
         # astronaute qui envoie la main (les _NB_WAVING_IMAGES prochaines images)
-        waving_frames = []
         first_frame = Astronaut._NB_WAITING_IMAGES
-        for frame in range(first_frame, first_frame + Astronaut._NB_WAVING_IMAGES):
-            waving_frames.append((create_surface(frame), create_mask(frame)))
+        waving_frames = [frames[f"astronaut/{frame}"]
+                         for frame in range(first_frame, first_frame + Astronaut._NB_WAVING_IMAGES)]
         added_frames = waiting_frames[-3:]
         waving_frames.extend(added_frames * 2)
         waving_frames.extend(waving_frames[:2][::-1])
 
-
         # astronaute qui se déplace en sautant (les _NB_JUMPING_IMAGES prochaines images)
-        jumping_left_frames = []
-        jumping_right_frames = []
         first_frame = Astronaut._NB_WAITING_IMAGES + Astronaut._NB_WAVING_IMAGES
-        for frame in range(first_frame, first_frame + Astronaut._NB_JUMPING_IMAGES):
-            jumping_right_frames.append((create_surface(frame), create_mask(frame)))
-
-            flipped_surface = pygame.transform.flip(create_surface(frame), True, False)
-            flipped_mask = pygame.mask.from_surface(flipped_surface)
-            jumping_left_frames.append((flipped_surface, flipped_mask))
+        jumping_frames = range(first_frame, first_frame + Astronaut._NB_JUMPING_IMAGES)
+        jumping_right_frames = [frames[f"astronaut/{frame}"] for frame in jumping_frames]
+        jumping_left_frames = [frames[f"astronaut/{frame}/flipped"] for frame in jumping_frames]
 
         return waiting_frames, waving_frames, jumping_left_frames, jumping_right_frames
 
+    @staticmethod
+    def _bundle_frame_names() -> list:
+        """ Retourne les noms des trames de l'astronaute dans le paquet de sprites. """
+        nb_images = Astronaut._NB_WAITING_IMAGES + Astronaut._NB_WAVING_IMAGES + Astronaut._NB_JUMPING_IMAGES
+        first_jumping_frame = Astronaut._NB_WAITING_IMAGES + Astronaut._NB_WAVING_IMAGES
+        names = [f"astronaut/{frame}" for frame in range(nb_images)]
+        names.extend(f"astronaut/{frame}/flipped" for frame in range(first_jumping_frame, nb_images))
+        return names
+
+    @staticmethod
+    def _build_bundle_frames() -> dict:
+        """
+        Charge et découpe la feuille de sprites (sprite sheet) pour un astronaute.
+        :return: un dictionnaire nom de trame -> image (voir _bundle_frame_names)
+        """
+        nb_images = Astronaut._NB_WAITING_IMAGES + Astronaut._NB_WAVING_IMAGES + Astronaut._NB_JUMPING_IMAGES
+        sprite_sheet = AssetManager().load_image(Astronaut._ASTRONAUT_FILENAME)
+        sheet_width = sprite_sheet.get_width()
+        sheet_height = sprite_sheet.get_height()
+        image_size = (sheet_width / nb_images, sheet_height)
+
+        def create_surface(current_frame) -> pygame.Surface :
+            surface = pygame.Surface(image_size, flags=pygame.SRCALPHA)
+            source_rect = surface.get_rect()
+            source_rect.x = current_frame * source_rect.width
+            surface.blit(sprite_sheet, (0, 0), source_rect)
+            return surface
+
+        frames = {}
+        for name in Astronaut._bundle_frame_names():
+            parts = name.split("/")
+            surface = create_surface(int(parts[1]))
+            if len(parts) == 3:
+                surface = pygame.transform.flip(surface, True, False)
+            frames[name] = surface
+        return frames
+
     @staticmethod
     def _load_clips() -> tuple:
         """
@@ -313,17 +347,17 @@ class Astronaut(pygame.sprite.Sprite):
                      - une liste de clips (pygame.mixer.Sound) "Pad # please" ou "Up please"
                      - une liste de clips (pygame.mixer.Sound) "Hey!"
         """
-        hey_taxis = [pygame.mixer.Sound(FILES['hey_taxi_sound_1']),
-                     pygame.mixer.Sound(FILES['hey_taxi_sound_2']),
-                     pygame.mixer.Sound(FILES['hey_taxi_sound_3'])]
-
-        pad_pleases = [pygame.mixer.Sound(FILES['up_pls_sound']),
-                       pygame.mixer.Sound(FILES['pad_1_pls_sound']),
-                       pygame.mixer.Sound(FILES['pad_2_pls_sound']),
-                       pygame.mixer.Sound(FILES['pad_3_pls_sound']),
-                       pygame.mixer.Sound(FILES['pad_4_pls_sound']),
-                       pygame.mixer.Sound(FILES['pad_5_pls_sound'])]
-
-        heys = [pygame.mixer.Sound(FILES['gary_hey_sound'])]
+        hey_taxis = [AssetManager().load_sound(FILES['hey_taxi_sound_1']),
+                     AssetManager().load_sound(FILES['hey_taxi_sound_2']),
+                     AssetManager().load_sound(FILES['hey_taxi_sound_3'])]
+
+        pad_pleases = [AssetManager().load_sound(FILES['up_pls_sound']),
+                       AssetManager().load_sound(FILES['pad_1_pls_sound']),
+                       AssetManager().load_sound(FILES['pad_2_pls_sound']),
+                       AssetManager().load_sound(FILES['pad_3_pls_sound']),
+                       AssetManager().load_sound(FILES['pad_4_pls_sound']),
+                       AssetManager().load_sound(FILES['pad_5_pls_sound'])]
+
+        heys = [AssetManager().load_sound(FILES['gary_hey_sound'])]
         
         return hey_taxis, pad_pleases, heys
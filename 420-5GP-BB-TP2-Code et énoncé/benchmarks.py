@@ -0,0 +1,313 @@
+"""
+  Bancs d'essai (benchmarks) du jeu.
+
+  Utilisation :  python benchmarks.py <banc> [options]
+  Chaque banc s'exécute sans fenêtre (pilote vidéo SDL « dummy ») à partir du dossier du jeu. Pour mesurer un
+  affichage réel (le banc render avec un GPU par exemple), définir SDL_VIDEODRIVER (x11, wayland, windows, etc.).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+import pygame
+
+import game_settings
+from asset_manager import AssetManager
+from game_settings import GameSettings
+
+
+def _init_display() -> None:
+    """ Initialise pygame et un affichage (nécessaire pour convert_alpha). """
+    pygame.init()
+    pygame.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+
+
+def _measure(function, repetitions: int) -> list:
+    """
+    Mesure la durée d'exécution d'une fonction.
+    :param function: fonction à mesurer (sans argument)
+    :param repetitions: nombre de mesures
+    :return: la liste des durées (en millisecondes)
+    """
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def _report(label: str, durations: list) -> None:
+    print(f"{label:<40} médiane {statistics.median(durations):8.3f} ms   "
+          f"min {min(durations):8.3f} ms   max {max(durations):8.3f} ms")
+
+
+def bench_loaders(args: argparse.Namespace) -> None:
+    """ Compare le chargement des sprites du taxi et de l'astronaute : feuilles PNG vs paquet de sprites. """
+    import sprite_bundle
+    from astronaut import Astronaut
+    from taxi import Taxi
+
+    _init_display()
+
+    directory = tempfile.mkdtemp()
+    bundle_filename = os.path.join(directory, "sprites.bundle")
+    frames = {}
+    with AssetManager().scope("benchmark"):
+        frames.update(Taxi._build_bundle_frames())
+        frames.update(Astronaut._build_bundle_frames())
+    AssetManager().release("benchmark")
+    sprite_bundle.write_bundle(bundle_filename, frames)
+
+    def cold(loader):
+        # chaque mesure repart d'un cache vide (décodage ou projection en mémoire compris)
+        def run():
+            with AssetManager().scope("benchmark"):
+                loader()
+            AssetManager().release("benchmark")
+        return run
+
+    for label, filename in (("feuilles PNG", os.path.join(directory, "absent.bundle")),
+                            ("paquet de sprites", bundle_filename)):
+        game_settings.FILES['sprite_bundle'] = filename
+        _report(f"Taxi ({label})", _measure(cold(Taxi._load_and_build_surfaces), args.repetitions))
+        _report(f"Astronaut ({label})", _measure(cold(Astronaut._load_and_build_frames), args.repetitions))
+
+
+def _time_to_first_frame(lazy: bool) -> float:
+    """
+    Démarre le jeu comme space_taxi.main() et affiche la première trame.
+    :param lazy: si True, les scènes sont construites au premier usage
+    :return: la durée (en millisecondes) entre pygame.init() et le premier display.flip()
+    """
+    import space_taxi
+    from scene_manager import SceneManager
+
+    start = time.perf_counter()
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+
+    scene_manager = SceneManager()
+    space_taxi.add_scenes(scene_manager, lazy)
+    scene_manager.set_scene("blank")
+    scene_manager.update(1 / GameSettings.FPS)
+    scene_manager.render(screen)
+    pygame.display.flip()
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_startup(args: argparse.Namespace) -> None:
+    """ Compare le temps avant la première trame : scènes construites d'avance vs au premier usage. """
+    if args.child:
+        print(_time_to_first_frame(args.child == "lazy"))
+        return
+
+    # chaque mesure se fait dans un nouveau processus pour reproduire un démarrage à froid
+    for mode in ("eager", "lazy"):
+        durations = []
+        for _ in range(args.repetitions):
+            output = subprocess.run([sys.executable, __file__, "startup", "--child", mode],
+                                    capture_output=True, text=True, check=True).stdout
+            durations.append(float(output.split()[-1]))
+        _report(f"Première trame ({mode})", durations)
+
+
+def _render_frame_times(backend: str, frames: int) -> dict:
+    """
+    Dessine et présente des trames de l'écran d'accueil et du niveau 1 avec un affichage.
+    :param backend: l'affichage (voir display_backend)
+    :param frames: nombre de trames par scène
+    :return: un dictionnaire scène -> liste des durées (en millisecondes) de rendu et de présentation des trames
+    """
+    from display_backend import create_display
+    from level_loader import LevelLoader
+    from level_scene import LevelScene
+    from scene_manager import SceneManager
+    from splash_scene import SplashScene
+
+    pygame.init()
+    pygame.mixer.init()
+    display = create_display((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT), "benchmark", backend=backend)
+
+    loader = LevelLoader(1, game_settings.FILES['level1'])
+    loader.start()
+    while not loader.is_ready():
+        loader.update()
+        time.sleep(0.001)
+    clock = SceneManager().clock
+    level = LevelScene(1, clock)
+    level.initialize_with_resources(loader.resources())
+
+    durations = {}
+    for name, scene in (("splash", SplashScene(clock)), ("level1", level)):
+        durations[name] = []
+        for _ in range(frames):
+            scene.update(1 / GameSettings.FPS)
+            start = time.perf_counter()
+            display.present(scene.render(display.screen))
+            durations[name].append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def bench_render(args: argparse.Namespace) -> None:
+    """ Compare les affichages (surface de la fenêtre vs Renderer SDL2) sur les mêmes scènes. """
+    from display_backend import RENDERER, SOFTWARE, SURFACE
+
+    if args.child:
+        print(json.dumps(_render_frame_times(args.child, args.frames)))
+        return
+
+    # chaque affichage est mesuré dans un nouveau processus (une seule fenêtre par processus)
+    for backend in (SURFACE, RENDERER, SOFTWARE):
+        output = subprocess.run([sys.executable, __file__, "render", "--frames", str(args.frames), "--child", backend],
+                                capture_output=True, text=True, check=True).stdout
+        for scene, durations in json.loads(output.splitlines()[-1]).items():
+            _report(f"{scene} ({backend})", durations)
+
+
+def bench_replay(args: argparse.Namespace) -> None:
+    """ Rejoue une partie enregistrée (space_taxi.py --record) sans affichage : durée de la simulation seule. """
+    import headless
+    from input_log import InputLog
+
+    log = InputLog.load(args.log)
+    durations = []
+    for _ in range(args.repetitions):
+        report = headless.replay(log)
+        if not report['identical']:
+            sys.exit(f"{args.log} : le rejeu n'aboutit pas à l'état enregistré")
+        durations.append(report['wall_time'] * 1000 / report['steps'])
+    _report(f"Pas de simulation ({len(log)} pas)", durations)
+
+
+def _random_controls(rng, steps: int, count: int):
+    """
+    Tire des commandes au hasard (mots de bits de Controls), changées tous les 20 pas : touches pour la première
+    moitié des taxis, manette (axes près des seuils de Taxi._handle_keys compris) pour l'autre, pressions rares.
+    :return: un tableau NumPy (pas, taxis)
+    """
+    import numpy as np
+    from controls import Controls
+
+    held = -(-steps // 20)
+    keys = rng.integers(0, 1 << len(Controls.KEYS), (held, count))
+    positions = np.array((-127, -13, -12, -1, 0, 1, 12, 13, 127)) + Controls.AXIS_RESOLUTION
+    axes = rng.choice(positions, (held, count)) << Controls.AXIS_SHIFT
+    axes |= rng.choice(positions, (held, count)) << (Controls.AXIS_SHIFT + 8)
+    joystick = np.arange(count) >= count // 2
+    words = np.where(joystick, axes | Controls.JOYSTICK_BIT, keys).repeat(20, axis=0)[:steps]
+    words |= (rng.random((steps, count)) < 0.01) << Controls.SPACE_SHIFT
+    words |= ((rng.random((steps, count)) < 0.01) & joystick) << Controls.BUTTON_SHIFT
+    return words
+
+
+def _check_taxi_batch_parity(count: int, steps: int) -> list:
+    """
+    Simule les mêmes taxis avec Taxi et avec TaxiBatch et vérifie que leurs états restent identiques au bit près.
+    Certains taxis partent posés sur une plateforme, d'autres presque sans carburant.
+    :return: la durée (en millisecondes) de Taxi.update pour chaque pas de chaque taxi
+    """
+    import numpy as np
+    from controls import Controls
+    from taxi import Taxi
+    from taxi_batch import TaxiBatch
+
+    taxis = [Taxi((GameSettings.SCREEN_WIDTH / 2, GameSettings.SCREEN_HEIGHT / 2)) for _ in range(count)]
+    for taxi in taxis[::3]:
+        taxi._pad_landed_on = object()  # seul compte le fait d'être posé
+        taxi._flags = Taxi._FLAG_GEAR_OUT
+        taxi._last_pos_y_land = taxi.rect.y
+    for taxi in taxis[1::4]:
+        taxi.fuel_remaining = 0.02
+    batch = TaxiBatch.from_taxis(taxis)
+
+    controls = Controls()
+    durations = []
+    for step, words in enumerate(_random_controls(np.random.default_rng(0), steps, count)):
+        for taxi, word in zip(taxis, words):
+            start = time.perf_counter()
+            for event in controls.set_word(int(word)):
+                taxi.handle_event(event)
+            taxi.update()
+            durations.append((time.perf_counter() - start) * 1000)
+        batch.step(words)
+
+        for index, taxi in enumerate(taxis):
+            position, velocity, acceleration, flags, fuel = taxi.state()
+            expected = [list(position), list(velocity), list(acceleration), flags, fuel, list(taxi.rect.topleft),
+                        taxi.pad_landed_on is not None, taxi._taking_off]
+            actual = [batch.positions[index].tolist(), batch.velocities[index].tolist(),
+                      batch.accelerations[index].tolist(), int(batch.flags[index]), float(batch.fuel[index]),
+                      batch.rects[index].tolist(), bool(batch.landed[index]), bool(batch.taking_off[index])]
+            if expected != actual:
+                sys.exit(f"TaxiBatch diffère de Taxi au pas {step}, taxi {index} :\n  {expected}\n  {actual}")
+    return durations
+
+
+def bench_physics(args: argparse.Namespace) -> None:
+    """ Compare Taxi.update et TaxiBatch.step, après avoir vérifié que leurs résultats sont identiques. """
+    import numpy as np
+    from taxi_batch import TaxiBatch
+
+    _init_display()
+    pygame.mixer.init()
+    scalar = _check_taxi_batch_parity(32, args.steps)
+    print(f"Parité Taxi / TaxiBatch : 32 taxis identiques sur {args.steps} pas")
+
+    batch = TaxiBatch(args.taxis, (GameSettings.SCREEN_WIDTH / 2, GameSettings.SCREEN_HEIGHT / 2))
+    durations = []
+    for words in _random_controls(np.random.default_rng(1), args.steps, args.taxis):
+        start = time.perf_counter()
+        batch.step(words)
+        durations.append((time.perf_counter() - start) * 1000)
+
+    _report("Taxi.update (1 taxi)", scalar)
+    _report(f"TaxiBatch.step ({args.taxis} taxis)", durations)
+    print(f"{'Pas de taxi par seconde':<40} Taxi {1000 / statistics.median(scalar):12,.0f}   "
+          f"TaxiBatch {args.taxis * 1000 / statistics.median(durations):12,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bancs d'essai de Tribute to Space Taxi!")
+    benches = parser.add_subparsers(dest="bench", required=True)
+
+    loaders = benches.add_parser("loaders", help=bench_loaders.__doc__)
+    loaders.add_argument("-n", "--repetitions", type=int, default=50)
+    loaders.set_defaults(run=bench_loaders)
+
+    startup = benches.add_parser("startup", help=bench_startup.__doc__)
+    startup.add_argument("-n", "--repetitions", type=int, default=5)
+    startup.add_argument("--child", choices=("eager", "lazy"), help=argparse.SUPPRESS)
+    startup.set_defaults(run=bench_startup)
+
+    render = benches.add_parser("render", help=bench_render.__doc__)
+    render.add_argument("-f", "--frames", type=int, default=300)
+    render.add_argument("--child", choices=("surface", "renderer", "software"), help=argparse.SUPPRESS)
+    render.set_defaults(run=bench_render)
+
+    replay = benches.add_parser("replay", help=bench_replay.__doc__)
+    replay.add_argument("log", help="journal des commandes (space_taxi.py --record)")
+    replay.add_argument("-n", "--repetitions", type=int, default=5)
+    replay.set_defaults(run=bench_replay)
+
+    physics = benches.add_parser("physics", help=bench_physics.__doc__)
+    physics.add_argument("-t", "--taxis", type=int, default=10000)
+    physics.add_argument("-s", "--steps", type=int, default=900)
+    physics.set_defaults(run=bench_physics)
+
+    args = parser.parse_args()
+    args.run(args)
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
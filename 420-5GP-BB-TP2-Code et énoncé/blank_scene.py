@@ -1,7 +1,11 @@
 import pygame
 
+from asset_manager import AssetManager
+from game_clock import GameClock
+from game_settings import FILES
 from scene import Scene
 from scene_manager import SceneManager
+from tracer import traced
 
 
 class BlankScene(Scene):
@@ -9,13 +13,16 @@ class BlankScene(Scene):
 
     _FADE_OUT_DURATION: int = 1500  # ms
 
-    def __init__(self) -> None:
-        super().__init__()
+    @traced()
+    def __init__(self, clock: GameClock) -> None:
+        super().__init__(clock)
         self._surface = pygame.Surface((1280,720)).convert()
         self._surface.fill((0,0,0))
-        self._music = pygame.mixer.Sound("snd/371516__mrthenoronha__space-game-theme-loop.wav")
-        self._music.play(loops=-1, fade_ms=1000)
-        self._fade_out_start_time = pygame.time.get_ticks()
+        with AssetManager().scope(self.asset_scope()):
+            self._music = AssetManager().load_sound(FILES['music_splash'])
+        # la musique est partagée avec la scène titre : le volume est ajusté sur le canal de cette scène
+        self._music_channel = self._music.play(loops=-1, fade_ms=1000)
+        self._fade_out_start_time = self._clock.ticks()
         self.time_passed = 0
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -25,22 +32,21 @@ class BlankScene(Scene):
     #     if int(self.time_passed*1000) >= 1500:
     #         self._fade_out_start_time = pygame.time.get_ticks()
     #         SceneManager().change_scene("splash", BlankScene._FADE_OUT_DURATION)
-    def unload(self):
-        return
     def update(self, delta_time: float) -> None:
         # if self._fade_out_start_time:
-        elapsed_time = pygame.time.get_ticks() - self._fade_out_start_time
+        elapsed_time = self._clock.ticks() - self._fade_out_start_time
         volume = max(0.0, 1.0 - (elapsed_time / BlankScene._FADE_OUT_DURATION))
-        self._fade_out_start_time = pygame.time.get_ticks()
-        if self.time_passed <=1.5:
+        self._fade_out_start_time = self._clock.ticks()
+        if self.time_passed >= 1.5:
             SceneManager().change_scene("splash", BlankScene._FADE_OUT_DURATION)
 
-        self._music.set_volume(volume)
+        if self._music_channel:
+            self._music_channel.set_volume(volume)
         if volume == 0:
             self._fade_out_start_time = None
         self.time_passed+=delta_time
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, interpolation: float = 1.0) -> None:
         screen.blit(self._surface, (0, 0))
 
     def surface(self) -> pygame.Surface:
@@ -0,0 +1,219 @@
+import atexit
+import random
+import zlib
+from typing import Callable
+
+import pygame
+
+from game_clock import GameClock
+from game_settings import GameSettings
+from input_log import InputLog
+
+
+class Controls:
+    """
+    Singleton pour l'état des commandes lu par la simulation d'un niveau (touches, manette, train d'atterrissage).
+
+    L'état est relevé une fois par pas de simulation (next_step) et reste le même durant tout le pas. Il est résumé
+    dans un mot de bits : les touches de direction, la présence d'une manette, le nombre de pressions de la barre
+    d'espacement et du bouton 1 de la manette depuis le pas précédent (au plus 3 par pas) et la position des deux
+    axes de la manette (arrondie au 1/127e). La simulation ne lit que ce mot : c'est ce qui permet d'enregistrer
+    une partie dans un journal (voir InputLog) et de la rejouer à l'identique.
+
+    Par défaut, l'état est celui du clavier et de la manette. Il peut être imposé (set_pressed), par exemple par une
+    séquence de touches scriptée lorsque le jeu est simulé sans affichage, ou lu dans un journal (play).
+    """
+
+    # disposition du mot de bits (voir aussi TaxiBatch, qui lit les mêmes mots)
+    KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)  # bits 0 à 3
+    AXES = (3, 4)  # axes de la manette lus par le taxi
+    JOYSTICK_BIT = 1 << 4
+    SPACE_SHIFT = 5    # 2 bits
+    BUTTON_SHIFT = 7   # 2 bits
+    AXIS_SHIFT = 9     # 8 bits par axe
+    AXIS_RESOLUTION = 127
+
+    _MAX_PRESSES = 3
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(Controls, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, '_initialized'):
+            self._pressed = None      # touches imposées (None : le clavier)
+            self._space_presses = 0   # pressions depuis le pas précédent
+            self._button_presses = 0
+            self._word = 0            # état des commandes du pas en cours
+
+            self._seed = None         # graine des générateurs aléatoires (enregistrement)
+            self._filename = None     # fichier du journal enregistré
+            self._recording = None    # journal en cours d'enregistrement
+            self._playback = None     # journal à rejouer
+            self._words = None        # mots du journal à rejouer
+            self._fingerprint = None  # fonction qui décrit l'état du niveau
+            self._checksum = 0        # empreinte des états relevés jusqu'ici (voir fingerprint)
+            self._steps = 0           # pas depuis le début du niveau
+
+            self._initialized = True
+
+    def record(self, filename: str) -> None:
+        """
+        Enregistre les commandes du prochain niveau joué ; le journal est écrit à la fin du programme. Une graine est
+        tirée pour les générateurs aléatoires (balles de l'écran de chargement, salutations des astronautes) : elle
+        est appliquée dès maintenant, puis de nouveau au début du niveau.
+        :param filename: nom du fichier du journal
+        """
+        self._filename = filename
+        self._seed = random.getrandbits(32)
+        random.seed(self._seed)
+        atexit.register(self.save)
+
+    def play(self, log: InputLog) -> None:
+        """
+        Rejoue les commandes d'un journal au prochain niveau joué (à la place du clavier et de la manette).
+        :param log: le journal
+        """
+        if log.rate != GameSettings.SIMULATION_RATE:
+            raise ValueError(f"Journal enregistré à {log.rate} pas par seconde "
+                             f"(simulation à {GameSettings.SIMULATION_RATE})")
+        self._playback = log
+        self._words = None
+
+    def begin(self, level: int, clock: GameClock, fingerprint: Callable[[], str]) -> None:
+        """
+        Signale le premier pas d'un niveau : l'enregistrement ou le rejeu commence. Lors d'un rejeu, le temps du jeu
+        et la graine des générateurs aléatoires sont ramenés à ceux de l'enregistrement.
+        :param level: le numéro du niveau
+        :param clock: l'horloge du jeu
+        :param fingerprint: fonction qui décrit l'état du niveau (comparé à la fin d'un rejeu)
+        """
+        self._space_presses = self._button_presses = 0
+        self._checksum = self._steps = 0
+        if self._filename and self._recording is None:
+            self._recording = InputLog(level, self._seed, GameSettings.SIMULATION_RATE, clock.time())
+            self._fingerprint = fingerprint
+            random.seed(self._seed)
+        elif self._playback and self._words is None:
+            clock.set_time(self._playback.start_time)
+            random.seed(self._playback.seed)
+            self._words = iter(self._playback)
+            self._fingerprint = fingerprint
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """ Compte les pressions qui agissent sur la simulation (appliquées au pas suivant, voir next_step). """
+        if self._words is not None:
+            return  # rejeu : les pressions viennent du journal
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self._space_presses = min(self._space_presses + 1, Controls._MAX_PRESSES)
+        elif event.type == pygame.JOYBUTTONDOWN and event.button == 1:
+            self._button_presses = min(self._button_presses + 1, Controls._MAX_PRESSES)
+
+    def next_step(self) -> list:
+        """
+        Relève l'état des commandes pour le pas de simulation qui commence (et l'enregistre s'il y a lieu).
+        :return: les événements reçus depuis le pas précédent, à appliquer au début de ce pas
+        """
+        if self._fingerprint is not None:
+            if self._steps % GameSettings.SIMULATION_RATE == 0:
+                self._checksum = zlib.crc32(self._fingerprint().encode("utf-8"), self._checksum)
+            self._steps += 1
+
+        if self._words is not None:
+            return self.set_word(next(self._words, 0))
+
+        word = self._read_devices()
+        self._space_presses = self._button_presses = 0
+        if self._recording is not None:
+            self._recording.append(word)
+        return self.set_word(word)
+
+    def set_word(self, word: int) -> list:
+        """
+        Impose l'état des commandes du pas en cours.
+        :param word: l'état des commandes, sous la forme d'un mot de bits
+        :return: les pressions contenues dans le mot, sous la forme d'événements
+        """
+        self._word = word
+        events = []
+        for _ in range(self._word >> Controls.SPACE_SHIFT & 3):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" ", scancode=0))
+        for _ in range(self._word >> Controls.BUTTON_SHIFT & 3):
+            events.append(pygame.event.Event(pygame.JOYBUTTONDOWN, button=1, instance_id=0, joy=0))
+        return events
+
+    def get_pressed(self):
+        """
+        Retourne l'état des touches du pas en cours, à indexer comme pygame.key.get_pressed() (par exemple
+        keys[pygame.K_UP]). Seules les touches de KEYS sont relevées.
+        """
+        return _PressedKeys(key for bit, key in enumerate(Controls.KEYS) if self._word >> bit & 1)
+
+    def get_axis(self, axis: int) -> float:
+        """
+        Retourne la position d'un axe de la manette durant le pas en cours.
+        :param axis: un des axes de AXES
+        :return: la position, entre -1.0 et 1.0 (0.0 sans manette)
+        """
+        if not self.has_joystick():
+            return 0.0
+        shift = Controls.AXIS_SHIFT + 8 * Controls.AXES.index(axis)
+        return ((self._word >> shift & 0xFF) - Controls.AXIS_RESOLUTION) / Controls.AXIS_RESOLUTION
+
+    def has_joystick(self) -> bool:
+        """ Indique si une manette était branchée durant le pas en cours. """
+        return bool(self._word & Controls.JOYSTICK_BIT)
+
+    def set_pressed(self, keys: frozenset | None) -> None:
+        """
+        Impose les touches enfoncées.
+        :param keys: les touches enfoncées (constantes pygame.K_*), ou None pour revenir au clavier
+        """
+        self._pressed = None if keys is None else _PressedKeys(keys)
+
+    def fingerprint(self) -> int:
+        """
+        Retourne l'empreinte du niveau enregistré ou rejoué (0 si aucun niveau n'a commencé) : elle couvre l'état du
+        niveau relevé à chaque seconde de jeu et l'état actuel. Un écrasement remet le taxi dans un état connu ;
+        l'état final seul ne suffirait donc pas à révéler une divergence survenue avant.
+        """
+        if self._fingerprint is None:
+            return 0
+        return zlib.crc32(self._fingerprint().encode("utf-8"), self._checksum)
+
+    def save(self) -> None:
+        """ Écrit le journal enregistré (sans effet si aucun niveau n'a été joué). """
+        if self._recording is None:
+            return
+        self._recording.fingerprint = self.fingerprint()
+        self._recording.save(self._filename)
+
+    def _read_devices(self) -> int:
+        """ Résume l'état du clavier (ou des touches imposées) et de la manette dans un mot de bits. """
+        keys = pygame.key.get_pressed() if self._pressed is None else self._pressed
+        word = 0
+        for bit, key in enumerate(Controls.KEYS):
+            if keys[key]:
+                word |= 1 << bit
+        word |= self._space_presses << Controls.SPACE_SHIFT | self._button_presses << Controls.BUTTON_SHIFT
+
+        if GameSettings.JOYSTICK:
+            word |= Controls.JOYSTICK_BIT
+            for index, axis in enumerate(Controls.AXES):
+                position = round(GameSettings.JOYSTICK[0].get_axis(axis) * Controls.AXIS_RESOLUTION)
+                position = max(-Controls.AXIS_RESOLUTION, min(position, Controls.AXIS_RESOLUTION))
+                word |= (position + Controls.AXIS_RESOLUTION) << (Controls.AXIS_SHIFT + 8 * index)
+        return word
+
+
+class _PressedKeys:
+    """ État des touches imposé : indexable comme le résultat de pygame.key.get_pressed(). """
+
+    def __init__(self, keys) -> None:
+        self._keys = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._keys
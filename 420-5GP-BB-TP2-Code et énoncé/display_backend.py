@@ -0,0 +1,106 @@
+"""
+  Affichage du jeu.
+
+  Les scènes dessinent toujours dans une surface (screen) ; l'affichage se charge ensuite de présenter cette surface
+  dans la fenêtre. Trois affichages sont offerts :
+
+    - surface :   la surface de la fenêtre de pygame.display (display.flip / display.update), comme à l'origine ;
+    - renderer :  un Renderer SDL2 (pygame._sdl2.video). La trame est conservée dans une texture ; seules les zones
+                  modifiées y sont copiées, si bien que le décor statique reste dans la texture d'une trame à l'autre.
+                  Le Renderer est accéléré lorsque possible et se rabat sinon sur le rendu logiciel de SDL ;
+    - software :  le même Renderer, en forçant le rendu logiciel de SDL (machines sans GPU).
+
+  L'affichage est choisi au démarrage par la variable d'environnement SPACE_TAXI_RENDERER (surface par défaut).
+
+  Exemple :  SPACE_TAXI_RENDERER=renderer python space_taxi.py
+"""
+import os
+
+import pygame
+from pygame._sdl2.video import Renderer, Texture, Window
+
+ENVIRONMENT_VARIABLE = "SPACE_TAXI_RENDERER"
+
+SURFACE = "surface"
+RENDERER = "renderer"
+SOFTWARE = "software"
+
+
+class SurfaceDisplay:
+    """ Affichage par la surface de la fenêtre (pygame.display). """
+
+    def __init__(self, size: tuple, caption: str) -> None:
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+
+    def present(self, dirty_rects: list | None) -> None:
+        """
+        Présente la trame dessinée dans screen.
+        :param dirty_rects: les zones modifiées (voir Scene.render), ou None si toute la trame a changé
+        """
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
+
+class RendererDisplay:
+    """ Affichage par un Renderer SDL2 : la trame est conservée dans une texture. """
+
+    def __init__(self, size: tuple, caption: str, icon: pygame.Surface = None, software: bool = False) -> None:
+        """
+        Initialise l'affichage.
+        :param size: taille (largeur, hauteur) de la trame
+        :param caption: titre de la fenêtre
+        :param icon: icône de la fenêtre
+        :param software: si True, le rendu logiciel de SDL est imposé ; sinon, le Renderer est accéléré si possible
+        """
+        # convert() et convert_alpha() exigent un affichage pygame.display : une fenêtre cachée en tient lieu (la
+        # fenêtre d'un Renderer ne peut pas aussi avoir une surface)
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self._window = Window(caption, size)
+        if icon:
+            self._window.set_icon(icon)
+        self._renderer = Renderer(self._window, accelerated=0 if software else -1)
+        self._renderer.logical_size = size  # la trame est mise à l'échelle si la fenêtre change de taille
+
+        self.screen = pygame.Surface(size).convert()
+        self._screen_rect = self.screen.get_rect()
+        self._texture = Texture(self._renderer, size, streaming=True)
+
+    def present(self, dirty_rects: list | None) -> None:
+        """
+        Présente la trame dessinée dans screen (seules les zones modifiées sont copiées dans la texture).
+        :param dirty_rects: les zones modifiées (voir Scene.render), ou None si toute la trame a changé
+        """
+        if dirty_rects is None:
+            self._texture.update(self.screen)
+        else:
+            for rect in dirty_rects:
+                rect = self._screen_rect.clip(rect)
+                if rect:
+                    self._texture.update(self.screen.subsurface(rect), rect)
+
+        self._renderer.clear()
+        self._texture.draw()
+        self._renderer.present()
+
+
+def create_display(size: tuple, caption: str, icon: pygame.Surface = None,
+                   backend: str = None) -> SurfaceDisplay | RendererDisplay:
+    """
+    Crée l'affichage du jeu.
+    :param size: taille (largeur, hauteur) de la trame
+    :param caption: titre de la fenêtre
+    :param icon: icône de la fenêtre (pour SURFACE, voir plutôt pygame.display.set_icon)
+    :param backend: SURFACE, RENDERER ou SOFTWARE (par défaut, la variable d'environnement SPACE_TAXI_RENDERER)
+    :return: l'affichage
+    """
+    if backend is None:
+        backend = os.environ.get(ENVIRONMENT_VARIABLE) or SURFACE
+
+    if backend == SURFACE:
+        return SurfaceDisplay(size, caption)
+    if backend in (RENDERER, SOFTWARE):
+        return RendererDisplay(size, caption, icon, software=backend == SOFTWARE)
+    raise ValueError(f"Affichage inconnu : {backend!r}")
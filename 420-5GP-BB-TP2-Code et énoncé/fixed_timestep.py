@@ -0,0 +1,45 @@
+class FixedTimestep:
+    """
+    Pas de temps fixe de la simulation.
+
+    Le temps réellement écoulé entre deux trames est accumulé ; la simulation avance ensuite d'autant de pas fixes que
+    l'accumulateur en contient. Le temps restant (moins d'un pas) sert à interpoler l'affichage entre les deux derniers
+    états simulés. La vitesse du jeu ne dépend donc plus de la cadence d'affichage : si une trame est lente, les pas
+    manqués sont rattrapés à la trame suivante, jusqu'à concurrence de max_steps pas (au-delà, le jeu ralentit plutôt
+    que de consacrer chaque trame à rattraper un retard qui ne cesse de croître).
+    """
+
+    def __init__(self, step: float, max_steps: int) -> None:
+        """
+        Initialise le pas de temps.
+        :param step: durée (en secondes) d'un pas de simulation
+        :param max_steps: nombre maximal de pas de simulation par trame
+        """
+        self.step = step
+        self._max_steps = max_steps
+        self._accumulator = 0.0
+
+    @property
+    def interpolation(self) -> float:
+        """
+        Position de l'affichage entre les deux derniers états simulés (l'affichage a donc un pas de retard sur la
+        simulation, mais il ne saccade pas).
+        :return: fraction entre 0.0 (avant-dernier état) et 1.0 (dernier état)
+        """
+        return self._accumulator / self.step
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Accumule le temps écoulé.
+        :param elapsed: temps écoulé (en secondes) depuis la trame précédente
+        :return: le nombre de pas de simulation à effectuer
+        """
+        self._accumulator += elapsed
+        steps = int(self._accumulator / self.step)
+        if steps > self._max_steps:
+            # le retard au-delà de la limite est abandonné
+            steps = self._max_steps
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= steps * self.step
+        return steps
@@ -0,0 +1,191 @@
+"""
+  Profileur des trames.
+
+  Chaque trame de la boucle principale est découpée en phases (événements, mise à jour, rendu, présentation) dont
+  la durée est mesurée. Les percentiles (p50, p95, p99) et le maximum des dernières trames sont affichés dans un
+  encadré par-dessus le jeu : ce sont les pointes, plus que la moyenne, qui rendent le jeu saccadé.
+
+  Le profileur est activé par la touche F3 ou par la variable d'environnement SPACE_TAXI_PROFILE. Si elle contient
+  un nom de fichier .csv, la durée des phases de chaque trame y est écrite à la fin du programme.
+
+  Exemple :  SPACE_TAXI_PROFILE=frames.csv python space_taxi.py
+"""
+import atexit
+import csv
+import os
+import time
+from collections import deque
+
+import pygame
+
+from game_settings import GameSettings
+from glyph_atlas import GlyphAtlas
+from text_cache import TextCache
+
+ENVIRONMENT_VARIABLE = "SPACE_TAXI_PROFILE"
+
+PHASES = ("events", "update", "render", "present")
+
+
+class FrameProfiler:
+    """ Singleton pour la mesure de la durée des phases de chaque trame. """
+
+    HOTKEY = pygame.K_F3
+
+    _WINDOW = 600               # nombre de trames sur lesquelles les statistiques sont calculées
+    _REFRESH_INTERVAL = 0.5     # secondes entre deux mises à jour de l'encadré
+    _PERCENTILES = (0.50, 0.95, 0.99)
+
+    _FONT_SIZE = 20
+    _COLOR = (255, 255, 255)
+    _SPIKE_COLOR = (255, 64, 64)     # travail qui dépasse le temps alloué à une trame (1 / FPS)
+    _BACKGROUND_COLOR = (0, 0, 0)
+    _COLUMN_WIDTH = 64
+    _PADDING = 6
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(FrameProfiler, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, '_initialized'):
+            value = os.environ.get(ENVIRONMENT_VARIABLE) or None
+            self._filename = value if value and value.lower().endswith(".csv") else None
+            self.enabled = value is not None
+            self._budget = 1000 / GameSettings.FPS  # millisecondes
+
+            # colonnes : intervalle entre deux trames, chaque phase, puis le travail (somme des phases)
+            self._columns = ("frame",) + PHASES + ("work",)
+            self._samples = {column: deque(maxlen=FrameProfiler._WINDOW) for column in self._columns}
+            self._rows = []  # trames enregistrées pour le fichier CSV
+
+            self._frame = 0
+            self._frame_start = None
+            self._last_mark = None
+            self._durations = {}
+
+            self._glyphs = None
+            self._spike_glyphs = None
+            self._overlay = None
+            self._overlay_rect = None
+            self._last_refresh = 0.0
+
+            if self._filename:
+                atexit.register(self.save)
+
+            self._initialized = True
+
+    def toggle(self) -> None:
+        """ Active ou désactive le profileur (les statistiques repartent de zéro). """
+        self.enabled = not self.enabled
+        for samples in self._samples.values():
+            samples.clear()
+        self._frame_start = None
+        self._overlay = None
+
+    def begin_frame(self) -> None:
+        """ Marque le début d'une trame (juste après l'attente de Clock.tick). """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._durations = {'frame': (now - self._frame_start) * 1000 if self._frame_start is not None else None}
+        self._frame_start = self._last_mark = now
+
+    def mark(self, phase: str) -> None:
+        """
+        Marque la fin d'une phase : sa durée est le temps écoulé depuis la marque précédente.
+        :param phase: une des phases de PHASES
+        """
+        if not self.enabled or self._frame_start is None:
+            return
+        now = time.perf_counter()
+        self._durations[phase] = (now - self._last_mark) * 1000
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        """ Marque la fin d'une trame et enregistre la durée de ses phases. """
+        if not self.enabled or self._frame_start is None:
+            return
+        durations = self._durations
+        durations['work'] = sum(durations.get(phase, 0.0) for phase in PHASES)
+        for column, samples in self._samples.items():
+            if durations.get(column) is not None:
+                samples.append(durations[column])
+        if self._filename:
+            self._rows.append([self._frame] + [durations.get(column) for column in self._columns])
+        self._frame += 1
+
+    def statistics(self, column: str) -> tuple:
+        """
+        Calcule les statistiques des dernières trames.
+        :param column: "frame" (intervalle entre deux trames), une des phases de PHASES ou "work" (somme des phases)
+        :return: un tuple (p50, p95, p99, max) en millisecondes, ou None si aucune trame n'a été mesurée
+        """
+        samples = sorted(self._samples[column])
+        if not samples:
+            return None
+        last = len(samples) - 1
+        return tuple(samples[min(last, int(p * len(samples)))] for p in FrameProfiler._PERCENTILES) + (samples[-1],)
+
+    def render(self, screen: pygame.Surface) -> pygame.Rect | None:
+        """
+        Dessine l'encadré des statistiques (recomposé au plus toutes les _REFRESH_INTERVAL secondes). Son fond est
+        opaque : il peut être redessiné à chaque trame sans que la scène ne redessine ce qu'il recouvre. Le temps
+        passé ici n'est compté dans aucune phase.
+        :return: la zone de l'écran modifiée, ou None si le profileur est désactivé
+        """
+        if not self.enabled:
+            return None
+        start = time.perf_counter()
+        if self._overlay is None or start - self._last_refresh >= FrameProfiler._REFRESH_INTERVAL:
+            self._compose()
+            self._last_refresh = start
+        rect = screen.blit(self._overlay, self._overlay_rect)
+        if self._last_mark is not None:
+            self._last_mark += time.perf_counter() - start
+        return rect
+
+    def save(self) -> None:
+        """ Écrit la durée des phases de chaque trame dans le fichier CSV (sans effet s'il n'y en a pas). """
+        if self._filename is None:
+            return
+        with open(self._filename, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame_number",) + tuple(f"{column}_ms" for column in self._columns))
+            for row in self._rows:
+                writer.writerow([row[0]] + ["" if value is None else f"{value:.3f}" for value in row[1:]])
+
+    def _compose(self) -> None:
+        """ Recompose l'encadré : une ligne par colonne mesurée, une colonne par statistique. """
+        if self._glyphs is None:
+            font = TextCache().get_font(None, FrameProfiler._FONT_SIZE)
+            self._glyphs = GlyphAtlas(font, FrameProfiler._COLOR, "0123456789.- ")
+            self._spike_glyphs = GlyphAtlas(font, FrameProfiler._SPIKE_COLOR, "0123456789.")
+
+        padding = FrameProfiler._PADDING
+        width = FrameProfiler._COLUMN_WIDTH
+        height = self._glyphs.height
+        if self._overlay is None:
+            self._overlay = pygame.Surface((5 * width + 2 * padding, (len(self._columns) + 2) * height + 2 * padding))
+            self._overlay_rect = self._overlay.get_rect(topleft=(10, 10))
+        self._overlay.fill(FrameProfiler._BACKGROUND_COLOR)
+
+        frame = self.statistics('frame')
+        fps = f"{1000 / frame[0]:.1f}" if frame and frame[0] > 0 else "-"
+        blits = self._glyphs.layout(f"FPS {fps}", (padding, padding))
+
+        y = padding + height
+        for x, title in enumerate(("ms", "p50", "p95", "p99", "max")):
+            blits += self._glyphs.layout(title, (padding + x * width, y))
+        for column in self._columns:
+            y += height
+            blits += self._glyphs.layout(column, (padding, y))
+            for x, value in enumerate(self.statistics(column) or (), start=1):
+                # l'intervalle entre deux trames comprend l'attente de Clock.tick : seul le travail est comparé
+                spike = column != 'frame' and value > self._budget
+                glyphs = self._spike_glyphs if spike else self._glyphs
+                blits += glyphs.layout(f"{value:.2f}", (padding + x * width, y))
+        self._overlay.blits(blits, doreturn=False)
@@ -0,0 +1,95 @@
+class GameClock:
+    """
+    Horloge du jeu.
+
+    Le temps du jeu n'avance qu'avec la simulation (d'un pas fixe à chaque mise à jour, voir SceneManager.update) et
+    non avec l'horloge murale : les minuteries et les animations qui le lisent restent correctes quelle que soit la
+    vitesse à laquelle les pas sont simulés (en temps réel ou aussi vite que possible, sans affichage).
+
+    L'horloge appartient au gestionnaire de scènes, qui la remet aux scènes. Son mode détermine combien de temps de
+    jeu est à simuler pour un temps réel écoulé (voir frame_time) :
+        REAL_TIME : autant que le temps réel ;
+        PAUSED :    aucun (le jeu est figé) ;
+        SCALED :    le temps réel multiplié par un facteur (ralenti si < 1, accéléré si > 1) ;
+        STEPPED :   seulement les pas demandés un à un (voir step).
+    """
+
+    REAL_TIME = "real-time"
+    PAUSED = "paused"
+    SCALED = "scaled"
+    STEPPED = "stepped"
+
+    def __init__(self, mode: str = REAL_TIME, scale: float = 1.0) -> None:
+        """
+        Initialise l'horloge.
+        :param mode: REAL_TIME, PAUSED, SCALED ou STEPPED
+        :param scale: facteur appliqué au temps réel en mode SCALED
+        """
+        self._time = 0.0
+        self._requested = 0.0  # temps demandé en mode STEPPED, pas encore simulé
+        self.mode = None
+        self.scale = scale
+        self.set_mode(mode)
+
+    def set_mode(self, mode: str, scale: float = None) -> None:
+        """
+        Change le mode de l'horloge.
+        :param mode: REAL_TIME, PAUSED, SCALED ou STEPPED
+        :param scale: facteur appliqué au temps réel en mode SCALED (inchangé si None)
+        """
+        if mode not in (GameClock.REAL_TIME, GameClock.PAUSED, GameClock.SCALED, GameClock.STEPPED):
+            raise ValueError(f"Mode d'horloge inconnu : {mode!r}")
+        if scale is not None:
+            if scale <= 0:
+                raise ValueError(f"Facteur d'horloge invalide : {scale!r}")
+            self.scale = scale
+        self.mode = mode
+        self._requested = 0.0
+
+    def is_paused(self) -> bool:
+        return self.mode == GameClock.PAUSED
+
+    def step(self, duration: float) -> None:
+        """
+        Demande de simuler du temps en mode STEPPED (par exemple un pas de simulation).
+        :param duration: durée (en secondes) à simuler
+        """
+        if self.mode == GameClock.STEPPED:
+            self._requested += duration
+
+    def frame_time(self, real_time: float) -> float:
+        """
+        Convertit le temps réel écoulé depuis la trame précédente en temps de jeu à simuler.
+        :param real_time: temps réel écoulé (en secondes)
+        :return: temps de jeu à simuler (en secondes)
+        """
+        if self.mode == GameClock.REAL_TIME:
+            return real_time
+        if self.mode == GameClock.SCALED:
+            return real_time * self.scale
+        if self.mode == GameClock.STEPPED:
+            requested, self._requested = self._requested, 0.0
+            return requested
+        return 0.0
+
+    def advance(self, delta_time: float) -> None:
+        """
+        Fait avancer le temps du jeu.
+        :param delta_time: durée (en secondes) du pas de simulation
+        """
+        self._time += delta_time
+
+    def set_time(self, time: float) -> None:
+        """
+        Impose le temps du jeu (pour rejouer une partie enregistrée, par exemple).
+        :param time: le temps du jeu en secondes
+        """
+        self._time = time
+
+    def time(self) -> float:
+        """ Retourne le temps du jeu en secondes (remplace time.time). """
+        return self._time
+
+    def ticks(self) -> int:
+        """ Retourne le temps du jeu en millisecondes (remplace pygame.time.get_ticks). """
+        return int(self._time * 1000)
@@ -1,15 +1,23 @@
 import pygame
 
+from text_cache import TextCache
+
 
 class GameSettings:
     """ Singleton pour les paramètres de jeu. """
 
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
-    FPS = 90
+    FPS = 90  # cadence maximale d'affichage
+    SIMULATION_RATE = 90  # pas de simulation par seconde (les constantes physiques du taxi sont exprimées par pas)
+    MAX_SIMULATION_STEPS = 8  # nombre maximal de pas de simulation par trame affichée
 
     NB_PLAYER_LIVES = 5
 
+    DIRTY_RECT_RENDERING = True  # si False, les niveaux sont entièrement redessinés à chaque trame
+
+    INTERACTIVE = True  # si False (simulation sans affichage), l'écran de fin de partie n'est pas affiché
+
     JOYSTICK = []
 
     _instance = None
@@ -22,7 +30,7 @@ class GameSettings:
     def __init__(self) -> None:
         if not hasattr(self, '_initialized'):
             self.screen = None
-            self.pad_font = pygame.font.Font("fonts/boombox2.ttf", 11)
+            self.pad_font = TextCache().get_font("fonts/boombox2.ttf", 11)
             self._initialized = True
 
 
@@ -63,6 +71,7 @@ FILES = {
     "spawn_jingle" : "voices/taxi_spawn_jingle.mp3",
 
     "taxis_splash" : "img/taxis.png",
+    "sprite_bundle" : "img/sprites.bundle",
     "pump" : "img/pump.png",
     "level1" : "level1.cfg",
 
@@ -11,7 +11,9 @@ class Gate(Obstacle):
         self._closed = True
 
     def close(self) -> None:
-        self._closed = True
+        if not self._closed:
+            self._closed = True
+            self.dirty = 1
 
     def draw(self, surface: pygame.Surface) -> None:
         if self._closed:
@@ -21,4 +23,6 @@ class Gate(Obstacle):
         return self._closed
 
     def open(self) -> True:
-        self._closed = False
+        if self._closed:
+            self._closed = False
+            self.dirty = 1
@@ -0,0 +1,54 @@
+import pygame
+
+
+class GlyphAtlas:
+    """
+    Caractères prérasterisés d'une police, dans une couleur.
+
+    Un texte composé de ces caractères (par exemple un montant) est dessiné en plaçant les caractères côte à côte,
+    sans appel à Font.render : la liste retournée par layout() se dessine d'un seul appel à Surface.blits().
+    """
+
+    def __init__(self, font: pygame.font.Font, color: tuple, characters: str) -> None:
+        """
+        Prérasterise les caractères.
+        :param font: la police (voir TextCache.get_font)
+        :param color: couleur des caractères
+        :param characters: caractères à prérasteriser (les autres le sont au premier usage)
+        """
+        self._font = font
+        self._color = color
+        self._glyphs = {}  # caractère -> image
+        self.height = font.get_height()
+
+        for character in characters:
+            self._glyph(character)
+
+    def size(self, text: str) -> tuple:
+        """
+        Calcule la taille d'un texte.
+        :param text: le texte
+        :return: un tuple (largeur, hauteur)
+        """
+        return sum(self._glyph(character).get_width() for character in text), self.height
+
+    def layout(self, text: str, pos: tuple) -> list:
+        """
+        Place les caractères d'un texte.
+        :param text: le texte
+        :param pos: position (x, y) du coin supérieur gauche du texte
+        :return: une liste de paires (image, position) à passer à Surface.blits()
+        """
+        x, y = pos
+        glyphs = []
+        for character in text:
+            glyph = self._glyph(character)
+            glyphs.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return glyphs
+
+    def _glyph(self, character: str) -> pygame.Surface:
+        glyph = self._glyphs.get(character)
+        if glyph is None:
+            glyph = self._glyphs[character] = self._font.render(character, True, self._color)
+        return glyph
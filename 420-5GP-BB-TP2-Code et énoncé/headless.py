@@ -0,0 +1,192 @@
+"""
+  Simulation d'un niveau sans affichage, plus rapide que le temps réel.
+
+  Le niveau est simulé pas à pas (pilotes SDL « dummy », sans rendu ni limite de cadence) aussi vite que le
+  processeur le permet. Les touches enfoncées sont lues dans un script ; à la fin, un bilan de la partie est affiché
+  (courses, écrasements, carburant consommé, temps simulé). Sert aux essais d'équilibrage en lot.
+
+  Utilisation :  python space_taxi.py --headless script.txt [--level 1] [--max-time 300]
+
+  Format du script : une ligne par changement de touches, « temps (s) touches... » ; les touches (noms des
+  constantes pygame sans le préfixe K_) restent enfoncées jusqu'à la ligne suivante. Une touche qui passe à l'état
+  enfoncé produit aussi un événement KEYDOWN (SPACE pour repartir après un écrasement, par exemple).
+
+      # décollage, puis vers la gauche
+      0.0   UP
+      1.2   UP LEFT
+      2.0
+      8.0   SPACE
+
+  Une partie enregistrée (python space_taxi.py --record partie.stx) peut aussi être rejouée à l'identique :
+  python space_taxi.py --replay partie.stx. Le bilan indique alors si le niveau est passé par les mêmes états
+  que lors de l'enregistrement (sinon, le code de sortie est 1).
+"""
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import pygame
+
+from controls import Controls
+from game_settings import FILES, GameSettings
+from hud import HUD
+from input_log import InputLog
+from level_loader import LevelLoader
+from level_scene import LevelScene
+from scene_manager import SceneManager
+
+
+def load_script(filename: str) -> list:
+    """
+    Lit un script de touches.
+    :param filename: nom du fichier
+    :return: liste de paires (temps en secondes, ensemble des touches enfoncées), triée par temps
+    """
+    script = []
+    with open(filename) as file:
+        for number, line in enumerate(file, start=1):
+            fields = line.split("#")[0].split()
+            if not fields:
+                continue
+            try:
+                keys = frozenset(getattr(pygame, f"K_{name}") for name in fields[1:])
+                script.append((float(fields[0]), keys))
+            except (AttributeError, ValueError):
+                raise ValueError(f"{filename}, ligne {number} : {line.strip()!r}") from None
+    return sorted(script, key=lambda entry: entry[0])
+
+
+def run(script: list, level: int = 1, max_time: float = 300.0) -> dict:
+    """
+    Simule un niveau.
+    :param script: les touches à enfoncer (voir load_script)
+    :param level: le numéro de niveau
+    :param max_time: durée maximale (en secondes de temps du jeu) de la simulation
+    :return: le bilan de la partie
+    """
+    scene_manager, scene, taxi = _load_level(level)
+    clock = scene_manager.clock
+    start_time = clock.time()
+    next_entry = 0
+    pressed = frozenset()
+
+    def before_step() -> bool:
+        nonlocal next_entry, pressed
+        while next_entry < len(script) and script[next_entry][0] <= clock.time() - start_time:
+            keys = script[next_entry][1]
+            for key in keys - pressed:
+                scene_manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+            pressed = keys
+            Controls().set_pressed(pressed)
+            next_entry += 1
+        return clock.time() - start_time < max_time
+
+    report = _simulate(scene_manager, scene, taxi, before_step, "temps écoulé")
+    Controls().set_pressed(None)
+    return report
+
+
+def replay(log: InputLog) -> dict:
+    """
+    Rejoue une partie enregistrée.
+    :param log: le journal des commandes de la partie
+    :return: le bilan de la partie ; report['identical'] indique si le niveau est passé par les mêmes états que lors
+             de l'enregistrement (voir Controls.fingerprint)
+    """
+    Controls().play(log)
+    scene_manager, scene, taxi = _load_level(log.level)
+    steps = 0
+
+    def before_step() -> bool:
+        nonlocal steps
+        steps += 1
+        return steps <= len(log)
+
+    report = _simulate(scene_manager, scene, taxi, before_step, "fin de l'enregistrement")
+    report['identical'] = Controls().fingerprint() == log.fingerprint
+    return report
+
+
+def _load_level(level: int) -> tuple:
+    """
+    Prépare la simulation d'un niveau.
+    :param level: le numéro de niveau
+    :return: un tuple (gestionnaire de scènes, scène du niveau, taxi)
+    """
+    pygame.init()
+    pygame.mixer.init()
+    pygame.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))  # requis par convert()
+    GameSettings.INTERACTIVE = False
+
+    loader = LevelLoader(level, FILES['level1'])
+    loader.start()
+    while not loader.is_ready():
+        loader.update()
+        time.sleep(0.001)
+    resources = loader.resources()
+    taxi = resources['taxi']
+
+    scene_manager = SceneManager()
+    scene = LevelScene(level, scene_manager.clock)
+    scene.initialize_with_resources(resources)
+    scene_manager.add_scene(f"level{level}", scene)
+    scene_manager.set_scene(f"level{level}")
+
+    return scene_manager, scene, taxi
+
+
+def _simulate(scene_manager: SceneManager, scene: LevelScene, taxi, before_step, interrupted: str) -> dict:
+    """
+    Simule le niveau pas à pas jusqu'à la fin de la partie.
+    :param before_step: fonction appelée avant chaque pas ; la simulation s'arrête lorsqu'elle retourne False
+    :param interrupted: l'issue de la partie si la simulation est arrêtée par before_step
+    :return: le bilan de la partie
+    """
+    hud = HUD()
+    step = 1 / GameSettings.SIMULATION_RATE
+
+    steps = fares = crashes = 0
+    fuel_used = 0.0
+    wall_start = time.perf_counter()
+
+    while not scene.is_over() and before_step():
+        money, lives, fuel = hud.get_bank_money(), hud.get_lives(), taxi.fuel_remaining
+        scene_manager.update(step)
+        steps += 1
+
+        fares += hud.get_bank_money() > money
+        crashes += hud.get_lives() < lives
+        fuel_used += max(0.0, fuel - taxi.fuel_remaining)
+
+    wall_time = time.perf_counter() - wall_start
+
+    if hud.get_lives() == 0:
+        outcome = "plus de vies"
+    elif scene.is_over():
+        outcome = "niveau terminé"
+    else:
+        outcome = interrupted
+
+    return {'outcome': outcome,
+            'fares': fares,
+            'money': hud.get_bank_money(),
+            'crashes': crashes,
+            'lives': hud.get_lives(),
+            'fuel_used': fuel_used,
+            'simulated_time': steps * step,
+            'steps': steps,
+            'wall_time': wall_time}
+
+
+def print_report(report: dict) -> None:
+    """ Affiche le bilan d'une partie (voir run). """
+    speed = report['simulated_time'] / report['wall_time'] if report['wall_time'] else float('inf')
+    print(f"Issue              {report['outcome']}")
+    print(f"Courses            {report['fares']} (${report['money']:.2f})")
+    print(f"Écrasements        {report['crashes']} ({report['lives']} vies restantes)")
+    print(f"Carburant consommé {report['fuel_used'] * 100:.1f} % d'un réservoir")
+    print(f"Temps simulé       {report['simulated_time']:.2f} s ({report['steps']} pas)")
+    print(f"Temps réel         {report['wall_time']:.2f} s ({speed:.0f} x le temps réel)")
+    if 'identical' in report:
+        print(f"Rejeu              {'identique' if report['identical'] else 'DIFFÉRENT'} de l'enregistrement")
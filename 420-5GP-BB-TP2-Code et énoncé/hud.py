@@ -1,15 +1,27 @@
 import pygame
 
+from asset_manager import AssetManager
 from game_settings import GameSettings, FILES
+from glyph_atlas import GlyphAtlas
+from text_cache import TextCache
 
 
 
 class HUD:
-    """ Singleton pour l'affichage tête haute (HUD). """
+    """
+    Singleton pour l'affichage tête haute (HUD).
+
+    Les montants et le carburant sont dessinés à partir de caractères prérasterisés (voir GlyphAtlas). Le HUD est
+    composé dans une seule surface qui n'est recomposée que lorsqu'une valeur affichée change.
+    """
 
     _LIVES_ICONS_FILENAME = FILES['lives_icons']
     _LIVES_ICONS_SPACING = 10
 
+    _FONT_FILENAME = "fonts/boombox2.ttf"
+    _MONEY_COLOR = (51, 51, 51)
+    _FUEL_COLOR = (0, 0, 0)
+
     _instance = None
 
     def __new__(cls, *args, **kwargs):
@@ -21,37 +33,50 @@ class HUD:
         if not hasattr(self, '_initialized'):
             self._settings = GameSettings()
 
-            self._money_font = pygame.font.Font("fonts/boombox2.ttf", 36)
+            self._money_glyphs = GlyphAtlas(TextCache().get_font(HUD._FONT_FILENAME, 36), HUD._MONEY_COLOR,
+                                            "$0123456789. ")
+            self._fuel_glyphs = GlyphAtlas(TextCache().get_font(HUD._FONT_FILENAME, 20), HUD._FUEL_COLOR,
+                                           "Fuel: 0123456789%")
 
             self._bank_money = 0
-            self._bank_money_surface = self._render_bank_money_surface()
-            self._bank_money_pos = pygame.Vector2(20, self._settings.SCREEN_HEIGHT - (self._bank_money_surface.get_height() + 10))
+            self._bank_money_pos = pygame.Vector2(20, self._settings.SCREEN_HEIGHT - (self._money_glyphs.height + 10))
 
             self._trip_money = 0
-            self._trip_money_surface = self._render_trip_money_surface()
+
+            self._fuel_percentage = None  # le carburant n'est affiché qu'une fois fourni par le taxi (set_fuel)
+            self._fuel_center = pygame.Vector2(self._settings.SCREEN_WIDTH // 2, self._settings.SCREEN_HEIGHT - 50)
 
             self._lives = self._settings.NB_PLAYER_LIVES
-            self._lives_icon = pygame.image.load(HUD._LIVES_ICONS_FILENAME).convert_alpha()
+            # le HUD vit aussi longtemps que le programme : ses ressources ne sont jamais libérées
+            with AssetManager().scope(AssetManager.GLOBAL_SCOPE):
+                self._lives_icon = AssetManager().load_image(HUD._LIVES_ICONS_FILENAME)
             self._lives_pos= pygame.Vector2(20, self._settings.SCREEN_HEIGHT - (self._lives_icon.get_height() + 40))
 
+            # bande au bas de l'écran qui contient tous les éléments du HUD
+            top = min(self._lives_pos.y, self._bank_money_pos.y, self._fuel_center.y - self._fuel_glyphs.height // 2)
+            self._composite_rect = pygame.Rect(0, top, self._settings.SCREEN_WIDTH, self._settings.SCREEN_HEIGHT - top)
+            self._composite = pygame.Surface(self._composite_rect.size, pygame.SRCALPHA)
+            self._changed = True
+
             self.visible = False
 
             self._initialized = True
 
-    def render(self, screen: pygame.Surface) -> None:
-        spacing = self._lives_icon.get_width() + HUD._LIVES_ICONS_SPACING
-        for n in range(self._lives):
-            screen.blit(self._lives_icon, (self._lives_pos.x + (n * spacing), self._lives_pos.y))
-
-        screen.blit(self._bank_money_surface, (self._bank_money_pos.x, self._bank_money_pos.y))
-
-        x = self._settings.SCREEN_WIDTH - self._trip_money_surface.get_width() - 20
-        y = self._settings.SCREEN_HEIGHT - self._trip_money_surface.get_height() - 10
-        screen.blit(self._trip_money_surface, (x, y))
+    def render(self, screen: pygame.Surface) -> list:
+        """
+        Dessine le HUD (la surface composée n'est recomposée que si une valeur a changé).
+        :return: les zones de l'écran modifiées
+        """
+        if self._changed:
+            self._compose()
+        return [screen.blit(self._composite, self._composite_rect)]
 
     def add_bank_money(self, amount: float) -> None:
         self._bank_money += round(amount, 2)
-        self._bank_money_surface = self._render_bank_money_surface()
+        self._changed = True
+
+    def get_bank_money(self) -> float:
+        return self._bank_money
 
     def get_lives(self) -> int:
         return self._lives
@@ -59,21 +84,53 @@ class HUD:
     def loose_live(self) -> None:
         if self._lives > 0:
             self._lives -= 1
+            self._changed = True
 
     def reset(self) -> None:
         self._bank_money = 0
-        self._bank_money_surface = self._render_bank_money_surface()
         self._lives = self._settings.NB_PLAYER_LIVES
+        self._changed = True
+
+    def set_fuel(self, fuel_remaining: float) -> None:
+        """
+        Met à jour le carburant affiché.
+        :param fuel_remaining: carburant restant, entre 0.0 et 1.0
+        """
+        fuel_percentage = int(fuel_remaining * 100)
+        if self._fuel_percentage != fuel_percentage:
+            self._fuel_percentage = fuel_percentage
+            self._changed = True
 
     def set_trip_money(self, trip_money: float) -> None:
         if self._trip_money != trip_money:
             self._trip_money = trip_money
-            self._trip_money_surface = self._render_trip_money_surface()
+            self._changed = True
 
-    def _render_bank_money_surface(self) -> pygame.Surface:
-        money_str = f"{self._bank_money:.2f}"
-        return self._money_font.render(f"${money_str: >8}", True, (51, 51, 51))
+    def _compose(self) -> None:
+        """ Recompose la surface du HUD : icônes des vies et caractères des valeurs, en un seul appel à blits(). """
+        origin = self._composite_rect.topleft
+        blits = []
 
-    def _render_trip_money_surface(self) -> pygame.Surface:
-        money_str = f"{self._trip_money:.2f}"
-        return self._money_font.render(f"${money_str: >5}", True, (51, 51, 51))
+        spacing = self._lives_icon.get_width() + HUD._LIVES_ICONS_SPACING
+        for n in range(self._lives):
+            blits.append((self._lives_icon, (self._lives_pos.x + (n * spacing), self._lives_pos.y - origin[1])))
+
+        bank_money_str = f"{self._bank_money:.2f}"
+        blits += self._money_glyphs.layout(f"${bank_money_str: >8}",
+                                           (self._bank_money_pos.x, self._bank_money_pos.y - origin[1]))
+
+        trip_money_str = f"{self._trip_money:.2f}"
+        trip_money_text = f"${trip_money_str: >5}"
+        width, height = self._money_glyphs.size(trip_money_text)
+        blits += self._money_glyphs.layout(trip_money_text, (self._settings.SCREEN_WIDTH - width - 20,
+                                                             self._settings.SCREEN_HEIGHT - height - 10 - origin[1]))
+
+        if self._fuel_percentage is not None:
+            fuel_text = f"Fuel: {self._fuel_percentage}%"
+            width, height = self._fuel_glyphs.size(fuel_text)
+            blits += self._fuel_glyphs.layout(fuel_text, (self._fuel_center.x - width // 2,
+                                                          self._fuel_center.y - height // 2 - origin[1]))
+
+        self._composite.fill((0, 0, 0, 0))
+        self._composite.blits(blits, doreturn=False)
+        self._changed = False
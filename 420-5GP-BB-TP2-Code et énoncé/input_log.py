@@ -0,0 +1,127 @@
+"""
+  Journal des commandes d'une partie.
+
+  Le journal contient, pour chaque pas de simulation d'un niveau, l'état des commandes lues par la simulation, sous
+  la forme d'un mot de bits (voir Controls), ainsi que ce qu'il faut pour rejouer la partie à l'identique : le
+  numéro du niveau, la graine des générateurs aléatoires, la fréquence de simulation et le temps du jeu au début du
+  niveau. L'empreinte des états du niveau durant l'enregistrement permet de vérifier qu'un rejeu aboutit au
+  même état (voir headless.py) : un journal sert ainsi de test de non-régression et de charge pour les bancs d'essai.
+
+  Les commandes changent rarement d'un pas à l'autre : les mots sont codés par plages (mot, nombre de pas répétés)
+  en entiers de longueur variable, puis compressés (zlib). Une heure de jeu au clavier tient en quelques kilo-octets.
+"""
+import struct
+import zlib
+
+_MAGIC = b"STXI"
+_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIHdQI")  # magique, version, niveau, graine, fréquence, temps initial, nb pas, empreinte
+
+
+class InputLog:
+    """ Journal des commandes d'une partie, codé par plages. """
+
+    def __init__(self, level: int, seed: int, rate: int, start_time: float = 0.0) -> None:
+        """
+        Initialise un journal vide.
+        :param level: le numéro du niveau joué
+        :param seed: la graine des générateurs aléatoires
+        :param rate: la fréquence de simulation (pas par seconde)
+        :param start_time: le temps du jeu (en secondes) au premier pas du niveau
+        """
+        self.level = level
+        self.seed = seed
+        self.rate = rate
+        self.start_time = start_time
+        self.fingerprint = 0  # empreinte des états du niveau (voir Controls.fingerprint)
+        self._runs = []       # plages [mot, nombre de pas]
+        self._length = 0
+
+    def __len__(self) -> int:
+        """ Retourne le nombre de pas enregistrés. """
+        return self._length
+
+    def __iter__(self):
+        """ Parcourt les mots des pas enregistrés, dans l'ordre. """
+        for word, count in self._runs:
+            for _ in range(count):
+                yield word
+
+    def append(self, word: int) -> None:
+        """
+        Ajoute un pas au journal.
+        :param word: l'état des commandes durant ce pas
+        """
+        if self._runs and self._runs[-1][0] == word:
+            self._runs[-1][1] += 1
+        else:
+            self._runs.append([word, 1])
+        self._length += 1
+
+    def to_bytes(self) -> bytes:
+        """ Code le journal (voir le format en tête du module). """
+        runs = bytearray()
+        for word, count in self._runs:
+            _write_varint(runs, word)
+            _write_varint(runs, count)
+        header = _HEADER.pack(_MAGIC, _VERSION, self.level, self.seed, self.rate, self.start_time, self._length,
+                              self.fingerprint)
+        return header + zlib.compress(bytes(runs), 9)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'InputLog':
+        """
+        Décode un journal.
+        :param data: le journal codé par to_bytes
+        :return: le journal
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("journal des commandes tronqué")
+        magic, version, level, seed, rate, start_time, length, fingerprint = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("journal des commandes invalide")
+
+        log = InputLog(level, seed, rate, start_time)
+        log.fingerprint = fingerprint
+        runs = zlib.decompress(data[_HEADER.size:])
+        offset = 0
+        while offset < len(runs):
+            word, offset = _read_varint(runs, offset)
+            count, offset = _read_varint(runs, offset)
+            log._runs.append([word, count])
+            log._length += count
+        if log._length != length:
+            raise ValueError("journal des commandes corrompu")
+        return log
+
+    def save(self, filename: str) -> None:
+        with open(filename, "wb") as file:
+            file.write(self.to_bytes())
+
+    @staticmethod
+    def load(filename: str) -> 'InputLog':
+        with open(filename, "rb") as file:
+            return InputLog.from_bytes(file.read())
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """ Ajoute un entier positif codé sur 7 bits par octet (le bit de poids fort indique qu'un octet suit). """
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple:
+    """ Lit un entier codé par _write_varint ; retourne un tuple (valeur, position suivante). """
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("journal des commandes tronqué")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
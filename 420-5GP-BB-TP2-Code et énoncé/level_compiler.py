@@ -0,0 +1,201 @@
+"""
+  Compilateur de niveaux.
+
+  Un fichier de niveau (.cfg) est validé une seule fois puis compilé dans une forme compacte (JSON) : les expressions
+  des positions sont résolues par un évaluateur arithmétique sûr (sans eval) et la géométrie des plateformes est
+  précalculée. La forme compilée est conservée en mémoire et sur disque, et réutilisée tant que la date de
+  modification du fichier source (et des images de plateformes) ne change pas.
+
+  Pour compiler un niveau à l'avance :  python level_compiler.py level1.cfg
+"""
+import ast
+import configparser
+import json
+import operator
+import os
+import re
+import sys
+
+import pygame
+
+from pad import Pad
+
+_CACHE_DIRECTORY = ".cache/levels"
+_FORMAT_VERSION = 1
+
+_OPERATORS = {ast.Add: operator.add,
+              ast.Sub: operator.sub,
+              ast.Mult: operator.mul,
+              ast.Div: operator.truediv,
+              ast.FloorDiv: operator.floordiv,
+              ast.Mod: operator.mod,
+              ast.UAdd: operator.pos,
+              ast.USub: operator.neg}
+
+_compiled_levels = {}  # fichier source -> forme compilée
+
+
+def evaluate(expression: str, variables: dict) -> float:
+    """
+    Évalue une expression arithmétique simple (nombres, variables, + - * / // % et parenthèses).
+    :param expression: l'expression (par exemple "screen_height - 141")
+    :param variables: les variables permises et leurs valeurs
+    :return: la valeur de l'expression
+    """
+    def visit(node: ast.AST) -> float:
+        if isinstance(node, ast.Expression):
+            return visit(node.body)
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+        if isinstance(node, ast.Name) and node.id in variables:
+            return variables[node.id]
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](visit(node.left), visit(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](visit(node.operand))
+        raise ValueError(f"Expression invalide : {expression!r}")
+
+    try:
+        return visit(ast.parse(expression.strip(), mode='eval'))
+    except (SyntaxError, ZeroDivisionError) as e:
+        raise ValueError(f"Expression invalide : {expression!r}") from e
+
+
+def load_level(filename: str) -> dict:
+    """
+    Retourne la forme compilée d'un niveau, en la compilant seulement si elle est absente ou périmée.
+    :param filename: fichier de configuration du niveau (.cfg)
+    :return: la forme compilée (voir compile_level)
+    """
+    compiled = _compiled_levels.get(filename)
+    if compiled is None:
+        compiled = _read_cache(filename)
+    if compiled is None or not _is_fresh(compiled):
+        compiled = compile_level(filename)
+        _write_cache(filename, compiled)
+    _compiled_levels[filename] = compiled
+    return compiled
+
+
+def compile_level(filename: str) -> dict:
+    """
+    Valide et compile un fichier de niveau.
+    :param filename: fichier de configuration du niveau (.cfg)
+    :return: un dictionnaire contenant:
+                 - background_image, background_music : fichiers de l'arrière-plan et de la musique
+                 - taxi : position (x, y) de départ du taxi
+                 - gate : image et position (x, y) du portail
+                 - obstacles, pumps : listes de (image, x, y)
+                 - pads : liste de (numéro, image, x, y, départ x astronaute, arrivée x astronaute, espace d'atterrissage)
+                 - sources : dates de modification des fichiers dont dépend la forme compilée
+    """
+    config = configparser.ConfigParser()
+    if not config.read(filename):
+        raise FileNotFoundError(f"No such file or directory: '{filename}'")
+
+    def field(section: str, key: str) -> str:
+        if not config.has_option(section, key):
+            raise ValueError(f"{filename} : [{section}] {key} est manquant")
+        return config[section][key].strip()
+
+    def values(section: str, key: str, count: int) -> list:
+        parts = [part.strip() for part in config[section][key].split(',')]
+        if len(parts) != count:
+            raise ValueError(f"{filename} : [{section}] {key} doit contenir {count} valeurs")
+        return parts
+
+    def resource(name: str) -> str:
+        if not os.path.exists(name):
+            raise FileNotFoundError(f"No such file or directory: '{name}'")
+        return name
+
+    variables = {'screen_width': int(evaluate(field('settings', 'screen_width'), {})),
+                 'screen_height': int(evaluate(field('settings', 'screen_height'), {}))}
+
+    def position(x: str, y: str) -> list:
+        return [int(evaluate(x, variables)), int(evaluate(y, variables))]
+
+    for section in ('obstacles', 'pumps', 'pads'):
+        if not config.has_section(section):
+            raise ValueError(f"{filename} : la section [{section}] est manquante")
+
+    field('taxi', 'position')
+    field('gate', 'position')
+    compiled = {
+        'version': _FORMAT_VERSION,
+        'background_image': resource(field('general', 'background_image')),
+        'background_music': resource(field('general', 'background_music')),
+        'taxi': position(*values('taxi', 'position', 2)),
+        'gate': [resource(field('gate', 'image')), *position(*values('gate', 'position', 2))],
+        'obstacles': [],
+        'pumps': [],
+        'pads': []
+    }
+
+    for section in ('obstacles', 'pumps'):
+        for key in config[section]:
+            image, x, y = values(section, key, 3)
+            compiled[section].append([resource(image), *position(x, y)])
+
+    sources = {filename: os.stat(filename).st_mtime_ns}
+    for key in config['pads']:
+        match = re.fullmatch(r"pad(\d+)", key)
+        if not match:
+            raise ValueError(f"{filename} : [pads] {key} doit être nommé padN")
+        image, x, y, start_x, end_x = values('pads', key, 5)
+        sources[resource(image)] = os.stat(image).st_mtime_ns
+
+        # l'espace d'atterrissage ne dépend que de l'image : il est calculé une fois pour toutes
+        surface_bounds = Pad.compute_surface_bounds(pygame.image.load(image))
+        compiled['pads'].append([int(match.group(1)), image, *position(x, y),
+                                 int(evaluate(start_x, variables)), int(evaluate(end_x, variables)),
+                                 list(surface_bounds)])
+
+    compiled['sources'] = sources
+    return compiled
+
+
+def _is_fresh(compiled: dict) -> bool:
+    """ Vérifie que les fichiers dont dépend la forme compilée n'ont pas été modifiés. """
+    if compiled.get('version') != _FORMAT_VERSION:
+        return False
+    try:
+        return all(os.stat(source).st_mtime_ns == mtime for source, mtime in compiled['sources'].items())
+    except OSError:
+        return False
+
+
+def _cache_filename(filename: str) -> str:
+    return os.path.join(_CACHE_DIRECTORY, os.path.basename(filename) + ".json")
+
+
+def _read_cache(filename: str) -> dict or None:
+    try:
+        with open(_cache_filename(filename), "rb") as file:
+            return json.loads(file.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(filename: str, compiled: dict) -> None:
+    """ Écrit la forme compilée sur disque de façon atomique. Un cache impossible à écrire est simplement ignoré. """
+    try:
+        os.makedirs(_CACHE_DIRECTORY, exist_ok=True)
+        temporary_filename = f"{_cache_filename(filename)}.{os.getpid()}.tmp"
+        with open(temporary_filename, "w") as file:
+            json.dump(compiled, file, separators=(',', ':'))
+        os.replace(temporary_filename, _cache_filename(filename))
+    except OSError:
+        pass
+
+
+def main() -> None:
+    """ Compile les niveaux fournis en arguments. """
+    for filename in sys.argv[1:]:
+        compiled = compile_level(filename)
+        _write_cache(filename, compiled)
+        print(f"{filename} -> {_cache_filename(filename)}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
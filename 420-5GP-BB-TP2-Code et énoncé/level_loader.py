@@ -0,0 +1,182 @@
+import threading
+
+import pygame
+
+import level_compiler
+from asset_manager import AssetManager
+from gate import Gate
+from obstacle import Obstacle
+from pad import Pad
+from pump import Pump
+from taxi import Taxi
+from tracer import Tracer, traced
+
+
+class LevelLoader:
+    """
+    Charge les ressources d'un niveau en arrière-plan.
+
+    Le thread de travail lit le niveau compilé (voir level_compiler.py) et décode les fichiers (images et sons).
+    La conversion des images au format de l'affichage et la construction des sprites se font ensuite dans le thread
+    principal, une étape à la fois, à chaque appel de update().
+    """
+
+    def __init__(self, level: int, filename: str) -> None:
+        """
+        Initialise un chargeur de niveau.
+        :param level: le numéro de niveau
+        :param filename: le fichier de configuration du niveau
+        """
+        self._level = level
+        self._filename = filename
+
+        self._thread = None
+        self._lock = threading.Lock()
+        self._error = None
+
+        self._nb_files = 0        # nombre de fichiers à décoder (thread de travail)
+        self._nb_decoded = 0
+        self._decoded = False
+
+        self._build_steps = []    # étapes de construction (thread principal)
+        self._nb_built = 0
+
+        self._built = {'obstacles': [], 'pumps': [], 'pads': []}
+        self._resources = None
+
+    def start(self) -> None:
+        """ Démarre le chargement (sans effet s'il est déjà démarré). """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._decode, daemon=True)
+            self._thread.start()
+
+    def update(self) -> None:
+        """
+        Poursuit le chargement dans le thread principal. Cette méthode est appelée à chaque itération de la boucle
+        de jeu par la scène de chargement.
+        """
+        if self._error:
+            raise self._error
+
+        with self._lock:
+            decoded = self._decoded
+        if not decoded or self._resources is not None:
+            return
+
+        with AssetManager().scope(self.asset_scope()), Tracer().span(f"level{self._level} build step"):
+            self._build_steps[self._nb_built]()
+        self._nb_built += 1
+
+        if self._nb_built == len(self._build_steps):
+            self._resources = {
+                'surface': self._built['surface'],
+                'music': self._built['music'],
+                'taxi': self._built['taxi'],
+                'gate': self._built['gate'],
+                'obstacle_sprites': pygame.sprite.Group(self._built['obstacles']),
+                'pump_sprites': pygame.sprite.Group(self._built['pumps']),
+                'pad_sprites': pygame.sprite.Group(self._built['pads']),
+                'pads': self._built['pads'],
+                'obstacles': self._built['obstacles'],
+                'pumps': self._built['pumps']
+            }
+
+    def asset_scope(self) -> str:
+        """ Les ressources appartiennent au niveau et non à la scène de chargement. """
+        return f"level{self._level}"
+
+    def is_ready(self) -> bool:
+        return self._resources is not None
+
+    def progress(self) -> float:
+        """
+        Retourne l'avancement du chargement.
+        :return: fraction entre 0.0 et 1.0
+        """
+        with self._lock:
+            total = self._nb_files + len(self._build_steps)
+            done = self._nb_decoded + self._nb_built
+        if total == 0:
+            return 0.0
+        return done / total
+
+    def resources(self) -> dict:
+        """
+        Retourne les ressources du niveau (voir LevelScene.initialize_with_resources).
+        :return: un dictionnaire des ressources, ou None si le chargement n'est pas terminé
+        """
+        return self._resources
+
+    @traced()
+    def _decode(self) -> None:
+        """ Lit la configuration et décode tous les fichiers du niveau (thread de travail). """
+        try:
+            images, sounds, build_steps = self._plan(level_compiler.load_level(self._filename))
+            with self._lock:
+                self._nb_files = len(images) + len(sounds)
+                self._build_steps = build_steps
+
+            with AssetManager().scope(self.asset_scope()):
+                for filename in images:
+                    AssetManager().load_image(filename, AssetManager.RAW)
+                    with self._lock:
+                        self._nb_decoded += 1
+                for filename in sounds:
+                    AssetManager().load_sound(filename)
+                    with self._lock:
+                        self._nb_decoded += 1
+
+            with self._lock:
+                self._decoded = True
+        except Exception as e:
+            self._error = e
+
+    def _plan(self, level: dict) -> tuple:
+        """
+        Planifie le chargement d'un niveau.
+        :param level: la forme compilée du niveau (voir level_compiler.compile_level)
+        :return: un tuple contenant dans l'ordre:
+                     - la liste des images à décoder
+                     - la liste des sons à décoder
+                     - la liste des étapes de construction à exécuter dans le thread principal
+        """
+        images = []
+        sounds = []
+        steps = []
+
+        # Charger les données générales
+        background_image = level['background_image']
+        background_music = level['background_music']
+        images.append(background_image)
+        sounds.append(background_music)
+        steps.append(lambda: self._built.update(surface=AssetManager().load_image(background_image),
+                                                music=AssetManager().load_sound(background_music)))
+
+        # Charger le taxi
+        taxi_x, taxi_y = level['taxi']
+        images.append(Taxi._TAXIS_FILENAME)
+        steps.append(lambda: self._built.update(taxi=Taxi((taxi_x, taxi_y))))
+
+        # Charger le portail
+        gate_image, gate_x, gate_y = level['gate']
+        images.append(gate_image)
+        steps.append(lambda: self._built.update(gate=Gate(gate_image, (gate_x, gate_y))))
+
+        # Charger les obstacles
+        for image, x, y in level['obstacles']:
+            images.append(image)
+            steps.append(lambda image=image, pos=(x, y): self._built['obstacles'].append(Obstacle(image, pos)))
+
+        # Charger les pompes
+        for image, x, y in level['pumps']:
+            images.append(image)
+            steps.append(lambda image=image, pos=(x, y): self._built['pumps'].append(Pump(image, pos)))
+
+        # Charger les pads
+        for id_, image, x, y, start_x, end_x, surface_bounds in level['pads']:
+            images.append(image)
+            steps.append(lambda id_=id_, image=image, pos=(x, y), start_x=start_x, end_x=end_x,
+                         surface_bounds=tuple(surface_bounds):
+                         self._built['pads'].append(Pad(id_, image, pos, start_x, end_x, surface_bounds)))
+
+        return images, sounds, steps
@@ -1,28 +1,30 @@
-import configparser
-
 import pygame
-import random
 
-from gate import Gate
-from obstacle import Obstacle
-from pad import Pad
-from pump import Pump
+from asset_manager import AssetManager
+from game_clock import GameClock
+from level_loader import LevelLoader
+from particles import ParticleSystem
+from rotation_cache import RotationCache
 from scene import Scene
 from scene_manager import SceneManager
+from tracer import traced
 from game_settings import FILES, GameSettings
 from taxi import Taxi
+from text_cache import TextCache
 
 
 class LevelLoadingScene(Scene):
     """ Scène de chargement d'un niveau. """
 
-    def unload(self) -> None:
-        pass
-
     _FADE_OUT_DURATION: int = 500  # ms
 
-    def __init__(self, level: int) -> None:
-        super().__init__()
+    _BALL_CAPACITY: int = 1024
+    _BALL_LIFETIME: float = 10.0  # secondes (les balles lentes ne sortent de l'écran qu'après longtemps)
+    _BALL_SPEED: float = 200.0  # vitesse maximale sur chaque axe, en pixels/s
+
+    @traced()
+    def __init__(self, level: int, clock: GameClock) -> None:
+        super().__init__(clock)
         self._settings = GameSettings()
         self._screen_width = GameSettings.SCREEN_WIDTH
         self._screen_height = GameSettings.SCREEN_HEIGHT
@@ -30,17 +32,29 @@ class LevelLoadingScene(Scene):
         self._surface = pygame.Surface((self._screen_width, self._screen_height))
         self._surface.fill((0, 0, 0))
 
-        self._music = pygame.mixer.Sound(FILES['music_loading'])
+        with AssetManager().scope(self.asset_scope()):
+            self._music = AssetManager().load_sound(FILES['music_loading'])
+            self._taxi = Taxi((self._screen_width // 2, self._screen_height - 30))
+
         self._music_started = False
         self._fade_out_start_time = None
 
-        self._loading_text = pygame.font.Font(None, 36).render(f"Level {self._level}", True, (255, 255, 255))
+        self._loading_text = TextCache().render(TextCache().get_font(None, 36), f"Level {self._level}",
+                                                 (255, 255, 255))
         self._loading_text_rect = self._loading_text.get_rect(center=(self._screen_width // 2, self._screen_height // 2))
 
+        # Chargement du niveau en arrière-plan
+        self._loader = LevelLoader(self._level, FILES['level1'])
+        self._progress_rect = pygame.Rect(0, 0, 300, 12)
+        self._progress_rect.center = (self._screen_width // 2, self._screen_height // 2 + 40)
+        self._ready_text = TextCache().render(TextCache().get_font(None, 36), "Press SPACE or RETURN to start",
+                                               (255, 255, 0))
+        self._ready_text_rect = self._ready_text.get_rect(center=(self._screen_width // 2, self._progress_rect.centery))
+
         # Taxi animation values
         self._taxi_animation_time = 5000  # milliseconds
         self._taxi_update_time = 100  # milliseconds
-        self._taxi_last_updated = pygame.time.get_ticks()
+        self._taxi_last_updated = self._clock.ticks()
         self._taxi_y_jump = (self._screen_height // 2 - self._screen_height - 30) / (self._taxi_animation_time / self._taxi_update_time)
         self._taxi_x_jump = 24  # horizontal movement
         self._taxi_y_destination = self._screen_height // 2
@@ -48,13 +62,13 @@ class LevelLoadingScene(Scene):
         self._taxi_x_moved_distance = self._taxi_x_max_distance // 2
         self._taxi_go_left = False
         self._taxi_angle = 0
-
-        self._taxi = Taxi((self._screen_width // 2, self._screen_height - 30))
+        self._taxi_angle_step = 5  # degrés
 
         # Contient les balles
-        self._balls = []
+        self._balls = ParticleSystem(LevelLoadingScene._BALL_CAPACITY, self._surface.get_rect(),
+                                     ParticleSystem.dot_sprite(2, (255, 255, 0)))
         self._ball_spawn_interval = 20 # Vitesse spawn balles
-        self._last_ball_spawn_time = pygame.time.get_ticks()
+        self._last_ball_spawn_time = self._clock.ticks()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if self._settings.JOYSTICK:
@@ -67,8 +81,11 @@ class LevelLoadingScene(Scene):
                 self.start_level()
 
     def start_level(self) -> None:
-        self._fade_out_start_time = pygame.time.get_ticks()
-        resources = self.load_level()
+        if not self._loader.is_ready() or self._fade_out_start_time is not None:
+            return
+
+        self._fade_out_start_time = self._clock.ticks()
+        resources = self._loader.resources()
 
         from scene_manager import SceneManager
         SceneManager().change_scene(f"level{self._level}", LevelLoadingScene._FADE_OUT_DURATION, resources)
@@ -77,12 +94,15 @@ class LevelLoadingScene(Scene):
         if not self._music_started:
             self._music.play()
             self._music_started = True
+            self._loader.start()
+
+        self._loader.update()
 
-        time = pygame.time.get_ticks()
+        time = self._clock.ticks()
 
         # Taxi movement
         if self._taxi_y_destination >= self._taxi.rect.y:
-            self._taxi_angle += 5
+            self._taxi_angle += self._taxi_angle_step
             self._taxi_angle %= 360
         elif time > self._taxi_last_updated + self._taxi_update_time:
             self._taxi_last_updated = time
@@ -104,96 +124,37 @@ class LevelLoadingScene(Scene):
             self._spawn_ball()
             self._last_ball_spawn_time = time
 
-        for ball in self._balls:
-            ball['pos'][0] += ball['velocity'][0] * delta_time
-            ball['pos'][1] += ball['velocity'][1] * delta_time
+        self._balls.update(delta_time)
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, interpolation: float = 1.0) -> None:
         # Draw background
         screen.blit(self._surface, (0, 0))
 
         # Draw loading text
         screen.blit(self._loading_text, self._loading_text_rect)
 
+        # Draw loading progress
+        if self._loader.is_ready():
+            screen.blit(self._ready_text, self._ready_text_rect)
+        else:
+            progress_rect = self._progress_rect.copy()
+            progress_rect.width = round(self._progress_rect.width * self._loader.progress())
+            pygame.draw.rect(screen, (255, 255, 0), progress_rect)
+            pygame.draw.rect(screen, (255, 255, 255), self._progress_rect, 1)
+
         # Draw taxi
-        rotated_taxi = pygame.transform.rotate(self._taxi.image, self._taxi_angle)
+        rotated_taxi = RotationCache().rotate(self._taxi.image, self._taxi_angle, self._taxi_angle_step)
         rotated_taxi_rect = rotated_taxi.get_rect(center=self._taxi.rect.center)
         screen.blit(rotated_taxi, rotated_taxi_rect)
 
         # Draw balls
-        for ball in self._balls:
-            pygame.draw.circle(screen, ball['color'], (int(ball['pos'][0]), int(ball['pos'][1])), ball['radius'])
+        self._balls.draw(screen)
 
     def surface(self) -> pygame.Surface:
         return self._surface
 
-    def load_level(self) -> dict :
-        config = configparser.ConfigParser()
-        config.read(FILES['level1'])
-
-        # Charger les données générales
-        surface = pygame.image.load(config['general']['background_image']).convert_alpha()
-        music = pygame.mixer.Sound(config['general']['background_music'])
-
-        # Charger le taxi
-        taxi_x, taxi_y = map(int, config['taxi']['position'].split(','))
-        taxi = Taxi((taxi_x, taxi_y))
-
-        # Charger le portail
-        gate_image = config['gate']['image']
-        gate_x, gate_y = map(int, config['gate']['position'].split(','))
-        gate = Gate(gate_image, (gate_x, gate_y))
-
-        # Charger les settings
-        screen_width = int(config['settings']['screen_width'])
-        screen_height = int(config['settings']['screen_height'])
-
-        # Charger les obstacles
-        obstacles = []
-        for key in config['obstacles']:
-            image, x, y = config['obstacles'][key].split(',')
-            # Résoudre les expressions dynamiques
-            x = eval(x.strip(), {'screen_width': screen_width, 'screen_height': screen_height})
-            y = eval(y.strip(), {'screen_width': screen_width, 'screen_height': screen_height})
-            obstacles.append(Obstacle(image.strip(), (int(x), int(y))))
-
-        # Charger les pompes
-        pumps = []
-        for key in config['pumps']:
-            image, x, y = config['pumps'][key].split(',')
-            pumps.append(Pump(image.strip(), (int(x), int(y))))
-        pump_sprites = pygame.sprite.Group(pumps)
-
-        # Charger les pads
-        pads = []
-        for key in config['pads']:
-            pad_data = config['pads'][key].split(',')
-            id_ = int(key[3:])  # Extraire l'ID à partir du nom (e.g., "pad1" -> 1)
-            image = pad_data[0].strip()
-            x, y = map(int, pad_data[1:3])
-            width, height = map(int, pad_data[3:])
-            pads.append(Pad(id_, image, (x, y), width, height))
-        pad_sprites = pygame.sprite.Group(pads)
-
-        return {
-            'surface': surface,
-            'music': music,
-            'taxi': taxi,
-            'gate': gate,
-            'obstacle_sprites': pygame.sprite.Group(obstacles),
-            'pump_sprites': pump_sprites,
-            'pad_sprites': pad_sprites,
-            'pads' : pads,
-            'obstacles' : obstacles,
-            'pumps' : pumps
-        }
-
     def _spawn_ball(self) -> None:
         """ Fait apparaitre une balle jaune avec une vitesse et direction random"""
-        ball = {
-            'pos': [self._screen_width // 2, self._screen_height // 2], # Au milieu
-            'velocity': [random.uniform(-200, 200), random.uniform(-200, 200)], # Vitesse random sur l'axe x et random sur l'axe y
-            'radius': 2, # largeur de la balle
-            'color': (255, 255, 0) # Couleur de la balle
-        }
-        self._balls.append(ball)
+        speed = LevelLoadingScene._BALL_SPEED
+        self._balls.emit(1, (self._screen_width // 2, self._screen_height // 2),  # Au milieu
+                         (-speed, -speed), (speed, speed), LevelLoadingScene._BALL_LIFETIME)
@@ -1,8 +1,10 @@
 import pygame
 import sys
-import time
 
+from asset_manager import AssetManager
 from astronaut import Astronaut
+from controls import Controls
+from game_clock import GameClock
 from game_settings import GameSettings, FILES
 from gate import Gate
 from hud import HUD
@@ -11,60 +13,66 @@ from pad import Pad
 from pump import Pump
 from scene import Scene
 from scene_manager import SceneManager
+from tracer import traced
 from taxi import Taxi
-import threading
+from text_cache import TextCache
+from text_sprite import TextSprite
 
 
 class LevelScene(Scene):
     """ Un niveau de jeu. """
 
-    def unload(self) -> None:
-        pass
-
     _FADE_OUT_DURATION: int = 500  # ms
 
     _TIME_BETWEEN_ASTRONAUTS: int = 5  # s
 
-    def __init__(self, level: int) -> None:
+    _TEXT_FADE_IN_TIME: float = 0.5  # s
+    _TEXT_STAY_TIME: float = 1.75  # s
+    _TEXT_FADE_OUT_TIME: float = 0.5  # s
+
+    @traced()
+    def __init__(self, level: int, clock: GameClock) -> None:
         """
         Initiliase une instance de niveau de jeu.
         :param level: le numéro de niveau
+        :param clock: l'horloge du jeu
         """
-        super().__init__()
+        super().__init__(clock)
 
         self._level = level
-        self._surface = pygame.image.load(FILES['space01']).convert_alpha()
-        self._music = pygame.mixer.Sound(FILES['music_lvl'])
-        self._music_started = False
-        self._fade_out_start_time = None
-
-        self._settings = GameSettings()
-        self._hud = HUD()
-
-        self._taxi = Taxi((self._settings.SCREEN_WIDTH / 2, self._settings.SCREEN_HEIGHT / 2))
-
-        self._gate = Gate(FILES['gate'], (582, 3))
-
-        self._obstacles = [Obstacle(FILES['south01'], (0, self._settings.SCREEN_HEIGHT - 141)),
-                           Obstacle(FILES['west01'], (0, 0)),
-                           Obstacle(FILES['east01'], (self._settings.SCREEN_WIDTH - 99, 0)),
-                           Obstacle(FILES['north01'], (0, 0)),
-                           Obstacle(FILES['obstacle01'], (840, 150)),
-                           Obstacle(FILES['obstacle02'], (250, 200))]
-        self._obstacle_sprites = pygame.sprite.Group()
-        self._obstacle_sprites.add(self._obstacles)
-
-        self._pumps = [Pump("img/pump.png", (305, 335))]
-        self._pump_sprites = pygame.sprite.Group()
-        self._pump_sprites.add(self._pumps)
-
-        self._pads = [Pad(1, FILES['pad01'], (650, self._settings.SCREEN_HEIGHT - 68), 5, 5),
-                      Pad(2, FILES['pad02'], (510, 205), 90, 15),
-                      Pad(3, FILES['pad03'], (150, 360), 10, 10),
-                      Pad(4, FILES['pad04'], (670, 480), 30, 280),
-                      Pad(5, FILES['pad05'], (1040, 380), 30, 120)]
-        self._pad_sprites = pygame.sprite.Group()
-        self._pad_sprites.add(self._pads)
+        with AssetManager().scope(self.asset_scope()):
+            self._surface = AssetManager().load_image(FILES['space01'])
+            self._music = AssetManager().load_sound(FILES['music_lvl'])
+            self._music_started = False
+            self._fade_out_start_time = None
+
+            self._settings = GameSettings()
+            self._hud = HUD()
+
+            self._taxi = Taxi((self._settings.SCREEN_WIDTH / 2, self._settings.SCREEN_HEIGHT / 2))
+
+            self._gate = Gate(FILES['gate'], (582, 3))
+
+            self._obstacles = [Obstacle(FILES['south01'], (0, self._settings.SCREEN_HEIGHT - 141)),
+                               Obstacle(FILES['west01'], (0, 0)),
+                               Obstacle(FILES['east01'], (self._settings.SCREEN_WIDTH - 99, 0)),
+                               Obstacle(FILES['north01'], (0, 0)),
+                               Obstacle(FILES['obstacle01'], (840, 150)),
+                               Obstacle(FILES['obstacle02'], (250, 200))]
+            self._obstacle_sprites = pygame.sprite.Group()
+            self._obstacle_sprites.add(self._obstacles)
+
+            self._pumps = [Pump("img/pump.png", (305, 335))]
+            self._pump_sprites = pygame.sprite.Group()
+            self._pump_sprites.add(self._pumps)
+
+            self._pads = [Pad(1, FILES['pad01'], (650, self._settings.SCREEN_HEIGHT - 68), 5, 5),
+                          Pad(2, FILES['pad02'], (510, 205), 90, 15),
+                          Pad(3, FILES['pad03'], (150, 360), 10, 10),
+                          Pad(4, FILES['pad04'], (670, 480), 30, 280),
+                          Pad(5, FILES['pad05'], (1040, 380), 30, 120)]
+            self._pad_sprites = pygame.sprite.Group()
+            self._pad_sprites.add(self._pads)
 
         self._reinitialize()
         self._hud.visible = True
@@ -79,18 +87,25 @@ class LevelScene(Scene):
         # Propriétée pour attendre lors du spawn
         self._taxi_spawning = False
         self._taxi_spawning_time = 2000  # millisecondes
-        self._taxi_spawned_time = pygame.time.get_ticks()
+        self._taxi_spawned_time = self._clock.ticks()
 
         # Premier jingle lors de l'apaprition
         self._first_jingle_showed = False
 
         # Propriétées pour le texte
         self._text_opacity = 0
-        self._text_thread = None
+        self._text_start_time = None
         self._showing_text = False
         self._text_showed = False
-        self._lock = threading.Lock()
-        self._font = pygame.font.Font("fonts/boombox2.ttf", 20)
+        self._font = TextCache().get_font("fonts/boombox2.ttf", 20)
+        self._destination_text = TextSprite(self._font, background_color=(50, 50, 50), padding=10)
+
+        self._game_over = False
+
+        # Rendu par zones modifiées (voir render)
+        self._full_redraw = True
+        self._dirty_rects = []  # zones des éléments mobiles dessinées à la trame précédente
+        self._scenery = None    # décor précomposé (voir _update_scenery)
 
     def initialize_with_resources(self, resources: dict) -> None:
         self._surface = resources['surface']
@@ -103,6 +118,7 @@ class LevelScene(Scene):
         self._pads = resources['pads']
         self._pumps = resources['pumps']
         self._obstacles = resources['obstacles']
+        self._scenery = None
 
         self._reinitialize()
         self._hud.visible = True
@@ -115,7 +131,14 @@ class LevelScene(Scene):
                                           [self._pads[0], Pad.UP]]
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        """ Gère les événements PyGame. """
+        """
+        Gère les événements PyGame. Ils sont remis aux commandes, qui les enregistrent avec le pas de simulation
+        suivant : ils ne sont appliqués qu'au début de ce pas (voir update et _apply_event).
+        """
+        Controls().handle_event(event)
+
+    def _apply_event(self, event: pygame.event.Event) -> None:
+        """ Applique un événement reçu depuis le pas de simulation précédent. """
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and self._taxi.is_destroyed():
                 self._taxi.reset()
@@ -126,9 +149,6 @@ class LevelScene(Scene):
         if self._taxi:
             self._taxi.handle_event(event)
 
-    def unload(self):
-        return
-
     def update(self, delta_time: float) -> None:
         """
         Met à jour le niveau de jeu. Cette méthode est appelée à chaque itération de la boucle de jeu.
@@ -137,14 +157,22 @@ class LevelScene(Scene):
 
         if not self._first_jingle_showed:
             self._first_jingle_showed = True
+            Controls().begin(self._level, self._clock, self._fingerprint)
+            self._last_taxied_astronaut_time = self._clock.time()  # le décompte commence avec le niveau
             self.respawn_taxi()
 
+        for event in Controls().next_step():
+            self._apply_event(event)
+
+        if self._showing_text:
+            self._update_text_opacity()
+
         if self._taxi_spawning:
-            if self._taxi_spawned_time + self._taxi_spawning_time < pygame.time.get_ticks():
+            if self._taxi_spawned_time + self._taxi_spawning_time < self._clock.ticks():
                 self._taxi_spawning = False
         else:
             if self._fade_out_start_time:
-                elapsed_time = pygame.time.get_ticks() - self._fade_out_start_time
+                elapsed_time = self._clock.ticks() - self._fade_out_start_time
                 volume = max(0.0, 1.0 - (elapsed_time / LevelScene._FADE_OUT_DURATION))
                 self._music.set_volume(volume)
                 if volume == 0:
@@ -158,7 +186,7 @@ class LevelScene(Scene):
                 self._hud.set_trip_money(self._astronaut.get_trip_money())
 
                 if self._astronaut.is_onboard():
-                    self._start_text_thread()
+                    self._start_destination_text()
                     self._taxi.board_astronaut(self._astronaut)
                     if self._astronaut.target_pad is Pad.UP:
                         if self._gate.is_closed():
@@ -166,18 +194,18 @@ class LevelScene(Scene):
                         elif self._taxi.has_exited():
                             self._taxi.unboard_astronaut()
                             self._taxi = None
-                            self._fade_out_start_time = pygame.time.get_ticks()
+                            self._fade_out_start_time = self._clock.ticks()
                             if SceneManager().scene_exists(f"level{self._level + 1}"):
                                 SceneManager().change_scene(f"level{self._level + 1}_load",
                                                             LevelScene._FADE_OUT_DURATION)
                             else:
-                                self.display_game_over_message()
+                                self._end_game()
                             return
                 elif self._astronaut.has_reached_destination():
                     if self._nb_taxied_astronauts < len(self._astronauts_pad_positions) - 1:
                         self._nb_taxied_astronauts += 1
                         self._astronaut = None
-                        self._last_taxied_astronaut_time = time.time()
+                        self._last_taxied_astronaut_time = self._clock.time()
                         self._text_showed = False
                 elif self._taxi.hit_astronaut(self._astronaut):
                     self._retry_current_astronaut()
@@ -189,10 +217,11 @@ class LevelScene(Scene):
                 elif self._astronaut.is_jumping_on_starting_pad():
                     self._astronaut.wait()
             else:
-                if time.time() - self._last_taxied_astronaut_time >= LevelScene._TIME_BETWEEN_ASTRONAUTS:
+                if self._clock.time() - self._last_taxied_astronaut_time >= LevelScene._TIME_BETWEEN_ASTRONAUTS:
                     self._astronaut = self.astronaut_spawner(self._nb_taxied_astronauts)
 
             self._taxi.update()
+            self._hud.set_fuel(self._taxi.fuel_remaining)
 
             for pad in self._pads:
                 if self._taxi.land_on_pad(pad):
@@ -214,30 +243,108 @@ class LevelScene(Scene):
                     pass  # introduire les effets secondaires de remplissage de réservoir ici
 
             if self._hud.get_lives() == 0:
-                self.display_game_over_message()
+                self._end_game()
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, interpolation: float = 1.0) -> list | None:
         """
         Effectue le rendu du niveau pour l'afficher à l'écran.
+
+        Lorsque GameSettings.DIRTY_RECT_RENDERING est activé, seules les zones occupées par les éléments mobiles
+        (taxi, astronaute, HUD, texte de destination) à la trame précédente sont effacées en y redessinant le décor,
+        puis les éléments mobiles sont redessinés. Sinon (ou après invalidate), tout l'écran est redessiné.
         :param screen: écran (surface sur laquelle effectuer le rendu)
+        :param interpolation: position des éléments mobiles entre les deux derniers pas de simulation
+        :return: la liste des zones modifiées, ou None si tout l'écran a été redessiné
         """
-        screen.blit(self._surface, (0, 0))
-        self._obstacle_sprites.draw(screen)
-        self._gate.draw(screen)
-        self._pump_sprites.draw(screen)
-        self._pad_sprites.draw(screen)
+        changed_rects = self._update_scenery()
+
+        if self._full_redraw or not self._settings.DIRTY_RECT_RENDERING:
+            self._render_scenery(screen)
+            self._dirty_rects = self._render_moving_elements(screen, interpolation)
+            self._full_redraw = False
+            return None
+
+        erased_rects = self._dirty_rects + changed_rects
+        for rect in erased_rects:
+            self._render_scenery(screen, rect)
+
+        self._dirty_rects = self._render_moving_elements(screen, interpolation)
+        return erased_rects + self._dirty_rects
+
+    def invalidate(self) -> None:
+        self._full_redraw = True
+
+    def _fingerprint(self) -> str:
+        """ Décrit l'état du niveau (pour vérifier qu'une partie rejouée aboutit au même état, voir Controls). """
+        state = [self._clock.ticks(), self._hud.get_bank_money(), self._hud.get_lives(), self._nb_taxied_astronauts]
         if self._taxi:
-            self._taxi.draw(screen)
+            state += self._taxi.state()
         if self._astronaut:
-            self._astronaut.draw(screen)
-        self._hud.render(screen)
+            state += [tuple(self._astronaut.rect), self._astronaut.get_trip_money()]
+        return repr(state)
 
-        if self._showing_text:
-            self._render_destination_text(screen)
+    def is_over(self) -> bool:
+        """ Indique si la partie est terminée (plus de vies, ou dernier niveau terminé). """
+        return self._game_over
 
     def surface(self) -> pygame.Surface:
         return self._surface
 
+    def _update_scenery(self) -> list:
+        """
+        Précompose le décor (arrière-plan, obstacles, portail, pompes et plateformes) dans une seule surface. Le décor
+        n'est recomposé que lorsqu'un de ses éléments a changé (attribut dirty, par exemple à l'ouverture du portail).
+        :return: les zones des éléments qui ont changé
+        """
+        sprites = [self._gate, *self._obstacle_sprites, *self._pump_sprites, *self._pad_sprites]
+        changed_rects = [sprite.rect.copy() for sprite in sprites if sprite.dirty]
+        if self._scenery is None or changed_rects:
+            if self._scenery is None:
+                self._scenery = pygame.Surface(self._surface.get_size()).convert()
+            self._draw_scenery(self._scenery)
+            for sprite in sprites:
+                sprite.dirty = 0
+        return changed_rects
+
+    def _render_scenery(self, screen: pygame.Surface, area: pygame.Rect = None) -> None:
+        """
+        Dessine le décor précomposé.
+        :param screen: écran (surface sur laquelle effectuer le rendu)
+        :param area: zone du décor à dessiner (tout le décor par défaut)
+        """
+        if area is None:
+            screen.blit(self._scenery, (0, 0))
+        else:
+            screen.blit(self._scenery, area, area)
+
+    def _draw_scenery(self, surface: pygame.Surface) -> None:
+        """ Dessine chacun des éléments du décor (arrière-plan, obstacles, portail, pompes et plateformes). """
+        surface.blit(self._surface, (0, 0))
+        self._obstacle_sprites.draw(surface)
+        self._gate.draw(surface)
+        self._pump_sprites.draw(surface)
+        self._pad_sprites.draw(surface)
+
+    def _render_moving_elements(self, screen: pygame.Surface, interpolation: float) -> list:
+        """
+        Dessine les éléments mobiles (taxi, astronaute, HUD et texte de destination).
+        :param interpolation: position du taxi et de l'astronaute entre les deux derniers pas de simulation
+        :return: les zones de l'écran modifiées
+        """
+        rects = []
+        if self._taxi:
+            rects += self._taxi.draw(screen, interpolation)
+        if self._astronaut:
+            rects += self._astronaut.draw(screen, interpolation)
+        rects += self._hud.render(screen)
+
+        if self._showing_text:
+            rects.append(self._render_destination_text(screen))
+        return rects
+
+    def asset_scope(self) -> str:
+        return f"level{self._level}"
+
     def _reinitialize(self) -> None:
         """ Initialise (ou réinitialise) le niveau. """
         self._nb_taxied_astronauts = 0
@@ -253,103 +360,71 @@ class LevelScene(Scene):
           #                  Astronaut(self._pads[4], self._pads[2], 20.00),
            #                 Astronaut(self._pads[1], self._pads[3], 20.00),
           #                  Astronaut(self._pads[0], Pad.UP, 20.00)]
-        self._last_taxied_astronaut_time = time.time()
+        self._last_taxied_astronaut_time = self._clock.time()
         self._astronaut = None
 
 
     def astronaut_spawner(self, astronaut_to_spawn) -> Astronaut :
         return Astronaut(self._astronauts_pad_positions[astronaut_to_spawn][0],
                                     self._astronauts_pad_positions[astronaut_to_spawn][1],
-                                    20.00)
+                                    20.00, self._clock)
 
-    def _render_destination_text(self, screen: pygame.Surface) -> None:
+    def _render_destination_text(self, screen: pygame.Surface) -> pygame.Rect:
         """Affche au joueur la destination"""
 
-        # Crée les différentes parties du texte
-        text1 = self._font.render("PAD  ", True, (255, 255, 255))
+        # Le texte n'est reconstruit que si la destination change
         if self._astronaut.target_pad is Pad.UP:
-            text2 = self._font.render(f"UP", True, (255, 255, 0))
+            destination = "UP"
         else:
-            text2 = self._font.render(f"{self._astronaut.target_pad.number}", True, (255, 255, 0))
-
-        text3 = self._font.render(" PLEASE", True, (255, 255, 255))
-
-        total_text_width = text1.get_width() + text2.get_width() + text3.get_width()
-        total_text_height = text1.get_height()
+            destination = f"{self._astronaut.target_pad.number}"
+        self._destination_text.set_text(("PAD  ", (255, 255, 255)), (destination, (255, 255, 0)),
+                                        (" PLEASE", (255, 255, 255)))
 
         # Positionne le texte et fond au centre
         screen_width, screen_height = screen.get_size()
-        background_rect = pygame.Rect(
-            (screen_width - total_text_width - 20) // 2,
-            (screen_height - total_text_height - 20) // 2,
-            total_text_width + 20,
-            total_text_height + 20
-        )
-
-        # Surface sur laquelle placer le texte et fond
-        text_surface = pygame.Surface((background_rect.width, background_rect.height), pygame.SRCALPHA)
-
-        # Dessine le fond sur la surface
-        pygame.draw.rect(text_surface, (50, 50, 50), text_surface.get_rect())
-
-        # Positionne le texte
-        text_y = 10
-        x_offset = 10
-
-        # Dessine le texte
-        text_surface.blit(text1, (x_offset, text_y))
-        x_offset += text1.get_width()
-        text_surface.blit(text2, (x_offset, text_y))
-        x_offset += text2.get_width()
-        text_surface.blit(text3, (x_offset, text_y))
-
-        # Applique l'opacité au texte. _lock car pygame ne gère pas les conflits de Thread
-        with self._lock:
-            text_surface.set_alpha(self._text_opacity)
-
-        # Dessine la surface sur l'écran
-        screen.blit(text_surface, (background_rect.left, background_rect.top))
-
-    def _manage_text_opacity(self):
-        """Gère l'apparition et disparition du texte"""
-
-        #Temp en secondes
-        start_opacity = 0
-        target_opacity = 255
-        fade_in_time = 0.5
-        stay_time = 1.75
-        fade_out_time = 0.5
-        blink_interval = 0.025
-
-        # Apparition
-        opacity_increment = (target_opacity - start_opacity) / (fade_in_time / blink_interval)
-        while self._text_opacity < target_opacity:
-            with self._lock:
-                self._text_opacity = min(self._text_opacity + opacity_increment, target_opacity)
-            time.sleep(blink_interval)
-
-        # Reste
-        time.sleep(stay_time)
-
-        # Bye bye texte
-        opacity_increment = target_opacity / (fade_out_time / blink_interval)
-        while self._text_opacity > 0:
-            with self._lock:
-                self._text_opacity = max(self._text_opacity - opacity_increment, 0)
-            time.sleep(blink_interval)
-
-        # Dis que c'est fait
-        with self._lock:
+        self._destination_text.rect.topleft = ((screen_width - self._destination_text.rect.width) // 2,
+                                               (screen_height - self._destination_text.rect.height) // 2)
+
+        # Applique l'opacité au texte
+        self._destination_text.set_alpha(round(self._text_opacity))
+
+        # Dessine le texte sur l'écran
+        return self._destination_text.draw(screen)
+
+    def _update_text_opacity(self):
+        """Gère l'apparition et disparition du texte, selon le temps du jeu écoulé depuis son apparition"""
+        fade_in_time = LevelScene._TEXT_FADE_IN_TIME
+        stay_time = LevelScene._TEXT_STAY_TIME
+        fade_out_time = LevelScene._TEXT_FADE_OUT_TIME
+        elapsed_time = self._clock.time() - self._text_start_time
+
+        if elapsed_time < fade_in_time:
+            # Apparition
+            self._text_opacity = 255 * elapsed_time / fade_in_time
+        elif elapsed_time < fade_in_time + stay_time:
+            # Reste
+            self._text_opacity = 255
+        elif elapsed_time < fade_in_time + stay_time + fade_out_time:
+            # Bye bye texte
+            self._text_opacity = 255 * (1 - (elapsed_time - fade_in_time - stay_time) / fade_out_time)
+        else:
+            # Dis que c'est fait
+            self._text_opacity = 0
             self._showing_text = False
             self._text_showed = True
 
-    def _start_text_thread(self):
+    def _start_destination_text(self):
         """Affiche le texte de la destination"""
         if not (self._showing_text or self._text_showed):
             self._text_opacity = 0
+            self._text_start_time = self._clock.time()
             self._showing_text = True
-            self._text_thread = threading.Thread(target=self._manage_text_opacity)
-            self._text_thread.start()
+
+    def _end_game(self) -> None:
+        """ Termine la partie (l'écran de fin de partie n'est affiché qu'en mode interactif). """
+        self._game_over = True
+        if self._settings.INTERACTIVE:
+            self.display_game_over_message()
 
     def display_game_over_message(self):
         """Displays the Game Over message."""
@@ -368,8 +443,8 @@ class LevelScene(Scene):
         white = (255, 255, 255)
 
         # Fonts
-        font_large = pygame.font.Font("fonts/boombox2.ttf", 72)
-        font_small = pygame.font.Font("fonts/boombox2.ttf", 24)
+        font_large = TextCache().get_font("fonts/boombox2.ttf", 72)
+        font_small = TextCache().get_font("fonts/boombox2.ttf", 24)
 
         # Text content
         game_over_text = "GAME OVER"
@@ -379,12 +454,12 @@ class LevelScene(Scene):
         screen.fill(black)
 
         # Render "GAME OVER" text
-        game_over_surface = font_large.render(game_over_text, True, red)
+        game_over_surface = TextCache().render(font_large, game_over_text, red)
         game_over_rect = game_over_surface.get_rect(center=(screen_width // 2, screen_height // 2 - 50))
         screen.blit(game_over_surface, game_over_rect)
 
         # Render "Press ESC to Quit" text
-        quit_surface = font_small.render(quit_text, True, white)
+        quit_surface = TextCache().render(font_small, quit_text, white)
         quit_rect = quit_surface.get_rect(center=(screen_width // 2, screen_height - 50))
         screen.blit(quit_surface, quit_rect)
 
@@ -403,7 +478,7 @@ class LevelScene(Scene):
                         sys.exit()
 
     def respawn_taxi(self):
-        self._taxi_spawned_time = pygame.time.get_ticks()
+        self._taxi_spawned_time = self._clock.ticks()
         self._taxi_spawning = True
         pygame.mixer.music.load(FILES["spawn_jingle"])
         pygame.mixer.music.play(loops=0)
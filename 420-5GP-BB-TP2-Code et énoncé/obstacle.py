@@ -1,5 +1,7 @@
 import pygame
 
+from asset_manager import AssetManager
+
 
 class Obstacle(pygame.sprite.Sprite):
     """ Obstacle. """
@@ -7,8 +9,10 @@ class Obstacle(pygame.sprite.Sprite):
     def __init__(self, filename: str, pos: tuple) -> None:
         super(Obstacle, self).__init__()
 
-        self.image = pygame.image.load(filename).convert_alpha()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.image = AssetManager().load_image(filename)
+        self.mask = AssetManager().load_mask(filename)
         self.rect = self.image.get_rect()
         self.rect.x = pos[0]
         self.rect.y = pos[1]
+
+        self.dirty = 0  # 1 lorsque l'image a changé depuis qu'elle a été dessinée dans le décor (voir LevelScene)
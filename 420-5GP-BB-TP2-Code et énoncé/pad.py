@@ -1,43 +1,36 @@
 import pygame
 
+from asset_manager import AssetManager
 from game_settings import GameSettings
 
-STOCKED_IMAGES = {}
-
 class Pad(pygame.sprite.Sprite):
     """ Plateforme. """
 
     UP = None  # Pad.UP est utilisé pour indiquer la sortie du niveau
 
     _TEXT_COLOR = (255, 255, 255)
+    _LABEL_ALPHA = 128
     _HEIGHT = 40
 
-    def __init__(self, number: int, filename: str, pos: tuple, astronaut_start_x: int, astronaut_end_x: int) -> None:
+    _labels = {}  # (numéro, police, taille) -> (texte, étiquette) partagés entre les plateformes
+
+    def __init__(self, number: int, filename: str, pos: tuple, astronaut_start_x: int, astronaut_end_x: int,
+                 surface_bounds: tuple = None) -> None:
         """
         Initialize an instance of the platform.
+        :param surface_bounds: espace d'atterrissage précalculé (voir calculate_surface_bounds), calculé si absent
         """
         super(Pad, self).__init__()
 
         self.number = number
-        self.image = self.load_image(filename)
-        self.mask = pygame.mask.from_surface(self.image)
-
-        font = GameSettings().pad_font
-        self._label_text = font.render(f"  PAD {number}  ", True, Pad._TEXT_COLOR)
-        text_width, text_height = self._label_text.get_size()
-
-        background_height = text_height + 4
-        background_width = text_width + background_height  # + hauteur pour les coins arrondis
-        self._label_background = Pad._build_label(background_width, background_height)
+        # l'image partagée est copiée puisque l'étiquette est dessinée par-dessus
+        self._source_image = AssetManager().load_image(filename)
+        self.image = self._source_image.copy()
+        self.mask = AssetManager().load_mask(filename)
 
-        surface_width, min_x, max_x = self.calculate_surface_bounds()
-
-        # Le milieu est maintenant basé sur l'espace d'atterissage, après on ajoute le min_x pour ignorer le vide à gauche
-        self._label_text_offset = ((min_x + (surface_width - text_width) / 2), 3)
-        self._label_background_offset = ((min_x + (surface_width - background_width) / 2), 2)
-
-        self.image.blit(self._label_background, self._label_background_offset)
-        self.image.blit(self._label_text, self._label_text_offset)
+        self._surface_bounds = surface_bounds or self.calculate_surface_bounds()
+        self._draw_label()
+        self.dirty = 0  # 1 lorsque l'image a changé depuis qu'elle a été dessinée dans le décor (voir LevelScene)
 
         self.rect = self.image.get_rect()
         self.rect.x = pos[0]
@@ -52,16 +45,49 @@ class Pad(pygame.sprite.Sprite):
     def update(self, *args, **kwargs) -> None:
         pass
 
-    # Point M2: image.load() charge une image, la retourne mais laisse l'objet résider dans la RAM
-    # Si je load la même image encore une fois, ça va encore, créer un résidu dans la RAM
+    def set_number(self, number: int) -> None:
+        """
+        Change le numéro de la plateforme et redessine son étiquette.
+        :param number: le nouveau numéro
+        """
+        self.number = number
+        self.image = self._source_image.copy()
+        self._draw_label()
+        self.dirty = 1
+
+    def _draw_label(self) -> None:
+        """ Dessine l'étiquette (numéro de la plateforme) au milieu de l'espace d'atterrissage. """
+        self._label_text, self._label_background = Pad._get_label(self.number, GameSettings().pad_font)
+        text_width = self._label_text.get_width()
+        background_width = self._label_background.get_width()
+
+        surface_width, min_x, max_x = self._surface_bounds
+
+        # Le milieu est maintenant basé sur l'espace d'atterissage, après on ajoute le min_x pour ignorer le vide à gauche
+        self._label_text_offset = ((min_x + (surface_width - text_width) / 2), 3)
+        self._label_background_offset = ((min_x + (surface_width - background_width) / 2), 2)
+
+        self.image.blit(self._label_background, self._label_background_offset)
+        self.image.blit(self._label_text, self._label_text_offset)
+
     @staticmethod
-    def load_image(filename: str) -> pygame.Surface:
+    def _get_label(number: int, font: pygame.font.Font) -> tuple:
         """
-        Charge une image
+        Retourne le texte et l'étiquette d'une plateforme, en les construisant au premier appel.
+        :param number: le numéro de la plateforme
+        :param font: la police du texte
+        :return: un tuple (texte, étiquette) ; les surfaces sont partagées et ne doivent pas être modifiées
         """
-        if filename not in STOCKED_IMAGES:
-            STOCKED_IMAGES[filename] = pygame.image.load(filename).convert_alpha()
-        return STOCKED_IMAGES[filename]
+        key = (number, font, font.get_height())
+        label = Pad._labels.get(key)
+        if label is None:
+            text = font.render(f"  PAD {number}  ", True, Pad._TEXT_COLOR)
+            text_width, text_height = text.get_size()
+
+            background_height = text_height + 4
+            background_width = text_width + background_height  # + hauteur pour les coins arrondis
+            label = Pad._labels[key] = text, Pad._build_label(background_width, background_height)
+        return label
 
     @staticmethod
     def _build_label(width: int, height: int) -> pygame.Surface:
@@ -78,32 +104,34 @@ class Pad(pygame.sprite.Sprite):
         pygame.draw.circle(surface, (0, 0, 0), (width - radius, radius), radius)
         pygame.draw.rect(surface, (0, 0, 0), (radius, 0, width - 2 * radius, height))
 
-        surface.lock()
-        for x in range(surface.get_width()):
-            for y in range(surface.get_height()):
-                r, g, b, a = surface.get_at((x, y))
-                if a != 0:
-                    surface.set_at((x, y), (r, g, b, 128))
-        surface.unlock()
+        # l'alpha des pixels dessinés est ramené à 128 (min) ; les pixels transparents et la couleur sont inchangés
+        surface.fill((255, 255, 255, Pad._LABEL_ALPHA), special_flags=pygame.BLEND_RGBA_MIN)
 
         return surface
 
     def calculate_surface_bounds(self):
         """
-        Calcule l'espace d'atterissage
+        Calcule l'espace d'atterissage de la plateforme (voir compute_surface_bounds).
+        """
+        return Pad.compute_surface_bounds(self.image)
+
+    @staticmethod
+    def compute_surface_bounds(image: pygame.Surface) -> tuple:
+        """
+        Calcule l'espace d'atterissage d'une image de plateforme
         Returns:
         effective_width (int): La largeur de l'espace d'atterissage. On l'a en calculant la distance entre min_x et max_x
         min_x (int): La coordonnée x du premier pixel non transparent
         max_x (int): La coordonnée x du dernier pixel non transparent
         """
-        surface_height = self.image.get_height()
-        surface_width = self.image.get_width()
+        surface_height = image.get_height()
+        surface_width = image.get_width()
 
         # On mesure la longueur du 5% supérieur. (top c'est pour avoir au moins un pixel)
         top_region_height = max(1, int(surface_height * 0.05))
 
         # On coupe et garde le 5% supérieur
-        top_region = self.image.subsurface((0, 0, surface_width, top_region_height))
+        top_region = image.subsurface((0, 0, surface_width, top_region_height))
 
         # Crée un mask de la partie haut car on peut pas voir les pixels blancs dans les subsurfaces
         mask = pygame.mask.from_surface(top_region)
@@ -0,0 +1,95 @@
+import random
+
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """
+    Système de particules.
+
+    Les particules sont conservées dans des tableaux NumPy (un tableau par attribut) de capacité fixe : aucune
+    allocation n'a lieu après la construction. L'intégration et l'élimination des particules (durée de vie écoulée
+    ou sortie de la zone) sont vectorisées et toutes les particules sont dessinées d'un seul appel à blits().
+    Le système peut servir à d'autres effets (échappement des réacteurs, débris d'un écrasement, etc.).
+    """
+
+    def __init__(self, capacity: int, bounds: pygame.Rect, sprite: pygame.Surface,
+                 acceleration: tuple = (0.0, 0.0)) -> None:
+        """
+        Initialise un système de particules.
+        :param capacity: nombre maximal de particules vivantes (les émissions au-delà sont ignorées)
+        :param bounds: zone hors de laquelle les particules sont éliminées
+        :param sprite: image d'une particule (centrée sur la position de la particule)
+        :param acceleration: accélération (x, y) commune à toutes les particules, en pixels/s² (la gravité des
+                             débris par exemple)
+        """
+        self._bounds = bounds
+        self._sprite = sprite
+        self._sprite_offset = np.array(sprite.get_size()) // 2
+        self._acceleration = np.array(acceleration, dtype=np.float32)
+        self._rng = np.random.default_rng(random.getrandbits(64))  # reproductible après random.seed (voir Controls)
+
+        self._positions = np.zeros((capacity, 2), dtype=np.float32)
+        self._velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self._ages = np.zeros(capacity, dtype=np.float32)
+        self._lifetimes = np.zeros(capacity, dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        """ Retourne le nombre de particules vivantes. """
+        return int(np.count_nonzero(self._alive))
+
+    @staticmethod
+    def dot_sprite(radius: int, color: tuple) -> pygame.Surface:
+        """
+        Construit l'image d'une particule ronde.
+        :param radius: rayon en pixels
+        :param color: couleur
+        :return: une image de 2 * radius pixels de côté
+        """
+        sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        return sprite
+
+    def emit(self, count: int, position: tuple, velocity_min: tuple, velocity_max: tuple,
+             lifetime: float = np.inf) -> None:
+        """
+        Émet des particules à une position, avec des vitesses aléatoires (distribution uniforme).
+        :param count: nombre de particules
+        :param position: position (x, y) d'émission
+        :param velocity_min: vitesse minimale (x, y) en pixels/s
+        :param velocity_max: vitesse maximale (x, y) en pixels/s
+        :param lifetime: durée de vie en secondes (infinie par défaut : la particule vit tant qu'elle est dans la zone)
+        """
+        slots = np.flatnonzero(~self._alive)[:count]
+        self._positions[slots] = position
+        self._velocities[slots] = self._rng.uniform(velocity_min, velocity_max, (len(slots), 2))
+        self._ages[slots] = 0.0
+        self._lifetimes[slots] = lifetime
+        self._alive[slots] = True
+
+    def update(self, delta_time: float) -> None:
+        """
+        Déplace les particules et élimine celles dont la durée de vie est écoulée ou qui ont quitté la zone.
+        :param delta_time: temps écoulé (en secondes)
+        """
+        alive = self._alive
+        self._velocities[alive] += self._acceleration * delta_time
+        self._positions[alive] += self._velocities[alive] * delta_time
+        self._ages[alive] += delta_time
+
+        x, y = self._positions[:, 0], self._positions[:, 1]
+        inside = ((x >= self._bounds.left) & (x < self._bounds.right) &
+                  (y >= self._bounds.top) & (y < self._bounds.bottom))
+        self._alive &= inside & (self._ages < self._lifetimes)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """ Dessine toutes les particules vivantes (un seul appel à blits()). """
+        positions = (self._positions[self._alive].astype(np.int32) - self._sprite_offset).tolist()
+        sprite = self._sprite
+        surface.blits([(sprite, position) for position in positions], doreturn=False)
+
+    def clear(self) -> None:
+        """ Élimine toutes les particules. """
+        self._alive[:] = False
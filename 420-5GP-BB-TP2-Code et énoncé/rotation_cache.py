@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class RotationCache:
+    """
+    Singleton pour les images pivotées.
+
+    L'angle est arrondi au pas demandé (par exemple 5 degrés) : une image qui tourne sur elle-même n'a donc qu'un
+    nombre fini de rotations, calculées au premier usage puis conservées dans un cache LRU (les moins récemment
+    utilisées sont évincées en premier).
+    """
+
+    _CAPACITY = 1024  # nombre maximal d'images pivotées conservées
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(RotationCache, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, '_initialized'):
+            self._surfaces = OrderedDict()  # (image, pas, indice de l'angle, lissage) -> image pivotée
+            self.hits = 0
+            self.misses = 0
+
+            self._initialized = True
+
+    def rotate(self, image: pygame.Surface, angle: float, step: float = 1.0, smooth: bool = False) -> pygame.Surface:
+        """
+        Retourne une image pivotée (calculée seulement si elle est absente du cache).
+        :param image: l'image d'origine (qui ne doit plus être modifiée par la suite)
+        :param angle: angle en degrés, dans le sens antihoraire (comme pygame.transform.rotate)
+        :param step: pas (en degrés) auquel l'angle est arrondi
+        :param smooth: si True, la rotation est lissée (pygame.transform.rotozoom)
+        :return: l'image pivotée, partagée : la copier avant de la modifier
+        """
+        bucket = round(angle / step) % round(360 / step)
+        key = (image, step, bucket, smooth)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if smooth:
+            surface = pygame.transform.rotozoom(image, bucket * step, 1.0)
+        else:
+            surface = pygame.transform.rotate(image, bucket * step)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > RotationCache._CAPACITY:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """ Vide le cache et remet les compteurs à zéro. """
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,10 +1,21 @@
 import pygame
 from abc import ABC, abstractmethod
+from typing import Hashable
+
+from asset_manager import AssetManager
+from game_clock import GameClock
 
 
 class Scene(ABC):
     """ Classe abstraite de base pour les scènes. """
 
+    def __init__(self, clock: GameClock) -> None:
+        """
+        Initialise la scène.
+        :param clock: l'horloge du jeu (voir SceneManager.clock), que lisent toutes les minuteries de la scène
+        """
+        self._clock = clock
+
     @abstractmethod
     def handle_event(self, event: pygame.event.Event) -> None:
         pass
@@ -14,13 +25,27 @@ class Scene(ABC):
         pass
 
     @abstractmethod
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, interpolation: float = 1.0) -> list | None:
+        """
+        Effectue le rendu de la scène.
+        :param screen: écran (surface sur laquelle effectuer le rendu)
+        :param interpolation: position de l'affichage entre les deux derniers pas de simulation (voir FixedTimestep)
+        :return: la liste des zones modifiées de l'écran, ou None si tout l'écran doit être mis à jour
+        """
         pass
 
     @abstractmethod
     def surface(self) -> pygame.Surface:
         pass
 
-    @abstractmethod
+    def invalidate(self) -> None:
+        """ Demande que la prochaine trame soit entièrement redessinée (sans effet par défaut). """
+        pass
+
+    def asset_scope(self) -> Hashable:
+        """ Portée sous laquelle sont comptabilisées les ressources chargées par la scène. """
+        return self
+
     def unload(self) -> None:
-        pass
\ No newline at end of file
+        """ Libère les ressources chargées par la scène. """
+        AssetManager().release(self.asset_scope())
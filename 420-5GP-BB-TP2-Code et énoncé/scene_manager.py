@@ -1,7 +1,10 @@
 import pygame
+from typing import Callable
 
-from fade import Fade
+from asset_manager import AssetManager
+from game_clock import GameClock
 from scene import Scene
+from transition import Transition
 
 
 class SceneManager:
@@ -17,56 +20,113 @@ class SceneManager:
     def __init__(self) -> None:
         if not hasattr(self, '_initialized'):
             self._scenes = {}
+            self._factories = {}  # scènes pas encore construites (construites au premier usage)
             self._current_scene = None
             self._next_scene = None
 
-            self._fade = None
+            self._transition = None
             self._transitioning = False
 
+            self.clock = GameClock()  # temps du jeu, remis aux scènes ; n'avance qu'avec la simulation
+
             self._initialized = True
 
     def scene_exists(self, name) -> bool:
-        return name in self._scenes
-
-    def add_scene(self, name: str, scene: Scene) -> None:
-        self._scenes[name] = scene
+        return name in self._scenes or name in self._factories
+
+    def add_scene(self, name: str, scene: Scene | Callable[[], Scene]) -> None:
+        """
+        Ajoute une scène.
+        :param name: nom de la scène
+        :param scene: la scène, ou une fonction qui la construit lors de son premier usage (set_scene, change_scene)
+        """
+        if isinstance(scene, Scene):
+            self._scenes[name] = scene
+            self._factories.pop(name, None)
+        else:
+            self._factories[name] = scene
+            self._scenes.pop(name, None)
+
+    def prewarm(self, *names: str) -> None:
+        """
+        Construit à l'avance des scènes ajoutées sous forme de fonction.
+        :param names: noms des scènes à construire
+        """
+        for name in names:
+            self._get_scene(name)
 
     def set_scene(self, name: str) -> None:
-        self._current_scene = self._scenes.get(name, self._current_scene)
-
-    def change_scene(self, name: str, fade_duration: int = 0, resources: dict = None) -> None:
-        self._next_scene = self._scenes.get(name, self._current_scene)
+        self._current_scene = self._get_scene(name) or self._current_scene
+        self.invalidate()
+
+    def change_scene(self, name: str, fade_duration: int = 0, resources: dict = None,
+                     mode: str = Transition.CROSSFADE) -> None:
+        """
+        Change de scène graduellement.
+        :param name: nom de la scène suivante
+        :param fade_duration: durée de la transition en millisecondes (0 = instantané)
+        :param resources: ressources préchargées à remettre à la scène suivante (voir LevelLoader)
+        :param mode: mode de transition (voir Transition)
+        """
+        self._next_scene = self._get_scene(name) or self._current_scene
         if self._next_scene and resources:
             from level_scene import LevelScene
             if isinstance(self._next_scene, LevelScene):
                 self._next_scene.initialize_with_resources(resources)
-        self._fade = Fade(self._current_scene, self._next_scene)
-        self._fade.start(fade_duration)
+        self._transition = Transition(self._current_scene, self._next_scene, self.clock, fade_duration, mode)
         self._transitioning = True
 
     def update(self, fixed_time_step : float) -> None:
+        self.clock.advance(fixed_time_step)
 
-        if self._current_scene:
-            self._current_scene.update(fixed_time_step)
+        # durant une transition, la scène sortante est figée (voir Transition) : elle n'est plus mise à jour
+        if self._current_scene and not self._transitioning:
+            with AssetManager().scope(self._current_scene.asset_scope()):
+                self._current_scene.update(fixed_time_step)
 
         if self._next_scene:
-            self._next_scene.update(fixed_time_step)
+            with AssetManager().scope(self._next_scene.asset_scope()):
+                self._next_scene.update(fixed_time_step)
 
         if self._transitioning:
-            self._fade.update()
-            if not self._fade.is_fading():
+            if self._transition.is_done():
 
                 if self._current_scene:
                     self._current_scene.unload()
                 self._current_scene, self._next_scene = self._next_scene, None
+                self._transition = None
                 self._transitioning = False
+                self.invalidate()
+
+    def render(self, screen: pygame.Surface, interpolation: float = 1.0) -> list | None:
+        """
+        Effectue le rendu de la scène courante (ou de la transition vers la scène suivante).
+        :param screen: écran (surface sur laquelle effectuer le rendu)
+        :param interpolation: position de l'affichage entre les deux derniers pas de simulation (voir FixedTimestep)
+        :return: la liste des zones modifiées de l'écran (pygame.display.update), ou None si tout l'écran doit être
+                 mis à jour (pygame.display.flip)
+        """
+        if self._transitioning:
+            self._transition.render(screen, interpolation)
+            return None
 
-    def render(self, screen: pygame.Surface) -> None:
         if self._current_scene:
-            self._current_scene.render(screen)
-        if self._next_scene:
-            self._next_scene.render(screen)
+            return self._current_scene.render(screen, interpolation)
+        return None
+
+    def invalidate(self) -> None:
+        """ Demande que la prochaine trame de la scène courante soit entièrement redessinée. """
+        if self._current_scene:
+            self._current_scene.invalidate()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if self._current_scene:
-            self._current_scene.handle_event(event)
+            with AssetManager().scope(self._current_scene.asset_scope()):
+                self._current_scene.handle_event(event)
+
+    def _get_scene(self, name: str) -> Scene | None:
+        """ Retourne la scène demandée en la construisant au besoin (None si elle n'existe pas). """
+        factory = self._factories.pop(name, None)
+        if factory:
+            self._scenes[name] = factory()
+        return self._scenes.get(name)
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+
+import pygame
+
+
+class SoundCache:
+    """
+    Singleton pour le cache persistant des sons décodés (PCM).
+
+    Le décodage d'un fichier (MP3 en particulier) ne se fait qu'une seule fois par installation : les échantillons
+    décodés sont écrits sur disque dans un fichier dont le nom dépend du contenu du fichier source et du format du
+    mixer. Les chargements suivants projettent ce fichier en mémoire (mmap) et le remettent directement au mixer.
+    """
+
+    _DIRECTORY = ".cache/pcm"
+    _INDEX_FILENAME = "index.json"  # chemin source -> (date de modification, taille, empreinte du contenu)
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(SoundCache, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, '_initialized'):
+            self._lock = threading.Lock()
+            self._index = self._read_index()
+
+            self._initialized = True
+
+    def load(self, filename: str) -> pygame.mixer.Sound:
+        """
+        Charge un son à partir du cache (ou le décode et l'ajoute au cache).
+        :param filename: chemin du fichier son
+        :return: le son
+        """
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            return pygame.mixer.Sound(filename)
+
+        frequency, size, channels = mixer_format
+        cache_filename = os.path.join(SoundCache._DIRECTORY,
+                                      f"{self._digest(filename)}-{frequency}-{size}-{channels}.pcm")
+
+        if os.path.exists(cache_filename):
+            with open(cache_filename, "rb") as file:
+                if os.fstat(file.fileno()).st_size > 0:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as samples:
+                        return pygame.mixer.Sound(buffer=samples)
+
+        sound = pygame.mixer.Sound(filename)
+        self._write(cache_filename, sound.get_raw())
+        return sound
+
+    def _digest(self, filename: str) -> str:
+        """
+        Retourne l'empreinte du contenu d'un fichier. L'empreinte n'est recalculée que si la date de modification
+        ou la taille du fichier a changé.
+        """
+        stat = os.stat(filename)
+        with self._lock:
+            entry = self._index.get(filename)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        with open(filename, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+
+        with self._lock:
+            self._index[filename] = (stat.st_mtime_ns, stat.st_size, digest)
+            self._write(os.path.join(SoundCache._DIRECTORY, SoundCache._INDEX_FILENAME),
+                        json.dumps(self._index).encode("utf-8"))
+        return digest
+
+    @staticmethod
+    def _read_index() -> dict:
+        try:
+            with open(os.path.join(SoundCache._DIRECTORY, SoundCache._INDEX_FILENAME), "rb") as file:
+                return json.loads(file.read())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write(filename: str, data: bytes) -> None:
+        """ Écrit un fichier du cache de façon atomique. Un cache impossible à écrire est simplement ignoré. """
+        try:
+            os.makedirs(SoundCache._DIRECTORY, exist_ok=True)
+            temporary_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary_filename, "wb") as file:
+                file.write(data)
+            os.replace(temporary_filename, filename)
+        except OSError:
+            pass
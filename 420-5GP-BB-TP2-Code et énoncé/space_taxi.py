@@ -14,11 +14,13 @@
   Eric Drouin
   Novembre 2024
 """
+import argparse
 import os
 from math import trunc
 from threading import Thread
 
 import game_settings
+from asset_manager import AssetManager
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 import pygame
@@ -30,43 +32,47 @@ from level_scene import LevelScene
 from scene_manager import SceneManager
 from splash_scene import SplashScene
 from blank_scene import BlankScene
+from controls import Controls
+from display_backend import create_display
+from fixed_timestep import FixedTimestep
+from frame_profiler import FrameProfiler
+from game_clock import GameClock
+from tracer import Tracer
 
 
 
 def main() -> None:
     """ Programme principal. """
-    pygame.init()
-    pygame.mixer.init()
-    pygame.joystick.init()
+    tracer = Tracer()
+    with tracer.span("pygame.init"):
+        pygame.init()
+        pygame.mixer.init()
+        pygame.joystick.init()
 
-    pygame_icon = pygame.image.load(game_settings.FILES["icone"])
+    pygame_icon = AssetManager().load_image(game_settings.FILES["icone"], AssetManager.RAW)
     pygame.display.set_icon(pygame_icon)
 
     settings = GameSettings()
-    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-    pygame.display.set_caption("Tribute to Space Taxi!")
+    with tracer.span("pygame.display.set_mode"):
+        display = create_display((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), "Tribute to Space Taxi!", pygame_icon)
+    screen = display.screen
     clock = pygame.time.Clock()
+    profiler = FrameProfiler()
 
-    show_fps = False
+    # la simulation avance par pas fixes, indépendamment de la cadence d'affichage
+    timestep = FixedTimestep(1 / settings.SIMULATION_RATE, settings.MAX_SIMULATION_STEPS)
 
-    if show_fps:
-        fps_font = pygame.font.Font(None, 36)
-
-    fixed_time_step = 1/settings.FPS
-
-
-    scene_manager = SceneManager()
-    scene_manager.add_scene("blank", BlankScene())
-    scene_manager.add_scene("splash", SplashScene())
-    scene_manager.add_scene("level1_load", LevelLoadingScene(1))
-    scene_manager.add_scene("level1", LevelScene(1))
-    scene_manager.add_scene("level2_load", LevelLoadingScene(2))
-
-    scene_manager.set_scene("blank")
+    with tracer.span("scenes"):
+        scene_manager = SceneManager()
+        add_scenes(scene_manager)
+        scene_manager.set_scene("blank")
+    first_frame = True
+    clock.tick()  # le temps de démarrage n'est pas simulé
 
     try:
         while True:
-            clock.tick(settings.FPS)
+            elapsed_time = clock.tick(settings.FPS) / 1000
+            profiler.begin_frame()
 
             for event in pygame.event.get():
                 if event.type == pygame.JOYDEVICEADDED:
@@ -81,25 +87,74 @@ def main() -> None:
                     if event.type == pygame.JOYBUTTONDOWN:
                         if event.button == 8:
                             quit_game()
-                if event.type == pygame.QUIT:
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                     quit_game()
+                if event.type == pygame.KEYDOWN and event.key == FrameProfiler.HOTKEY:
+                    profiler.toggle()
+                    scene_manager.invalidate()  # efface l'encadré du profileur
+                if event.type == pygame.KEYDOWN:
+                    handle_clock_hotkey(event.key, scene_manager.clock, timestep.step)
                 scene_manager.handle_event(event)
+            profiler.mark("events")
 
-            scene_manager.update(fixed_time_step)
+            for _ in range(timestep.advance(scene_manager.clock.frame_time(elapsed_time))):
+                scene_manager.update(timestep.step)
+            profiler.mark("update")
 
-            scene_manager.render(screen)
+            dirty_rects = scene_manager.render(screen, timestep.interpolation)
+            profiler.mark("render")
 
-            if show_fps:
-                fps = clock.get_fps()
-                fps_text = fps_font.render(f"FPS: {int(fps)}", True, (255, 255, 255))
-                screen.blit(fps_text, (10, 10))
+            overlay_rect = profiler.render(screen)
+            if overlay_rect and dirty_rects is not None:
+                dirty_rects.append(overlay_rect)
 
-            pygame.display.flip()
+            display.present(dirty_rects)
+            profiler.mark("present")
+            profiler.end_frame()
+
+            if first_frame:
+                tracer.instant("first frame")
+                first_frame = False
 
     except KeyboardInterrupt:
         quit_game()
 
 
+def handle_clock_hotkey(key: int, clock: GameClock, step: float) -> None:
+    """
+    Change le mode de l'horloge du jeu : F5 fige ou relance le jeu, F6 le fige puis avance d'un pas de simulation,
+    F7 active ou désactive le ralenti (quart de la vitesse).
+    :param key: la touche enfoncée
+    :param clock: l'horloge du jeu
+    :param step: durée (en secondes) d'un pas de simulation
+    """
+    if key == pygame.K_F5:
+        clock.set_mode(GameClock.REAL_TIME if clock.mode in (GameClock.PAUSED, GameClock.STEPPED) else GameClock.PAUSED)
+    elif key == pygame.K_F6:
+        if clock.mode != GameClock.STEPPED:
+            clock.set_mode(GameClock.STEPPED)
+        clock.step(step)
+    elif key == pygame.K_F7:
+        clock.set_mode(GameClock.REAL_TIME if clock.mode == GameClock.SCALED else GameClock.SCALED, 0.25)
+
+
+def add_scenes(scene_manager: SceneManager, lazy: bool = True) -> None:
+    """
+    Ajoute les scènes du jeu.
+    :param scene_manager: le gestionnaire de scènes
+    :param lazy: si True, chaque scène n'est construite que lors de son premier usage
+    """
+    clock = scene_manager.clock
+    scenes = {"blank": lambda: BlankScene(clock),
+              "splash": lambda: SplashScene(clock),
+              "level1_load": lambda: LevelLoadingScene(1, clock),
+              "level1": lambda: LevelScene(1, clock),
+              "level2_load": lambda: LevelLoadingScene(2, clock)}
+
+    for name, factory in scenes.items():
+        scene_manager.add_scene(name, factory if lazy else factory())
+
+
 def quit_game() -> None:
     """ Quitte le programme. """
     pygame.mixer.music.stop()
@@ -184,7 +239,38 @@ def display_error_message(file:str):
         sys.exit()
 
 
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Tribute to Space Taxi!")
+    parser.add_argument("--headless", metavar="SCRIPT",
+                        help="simule un niveau sans affichage, aussi vite que possible, avec les touches du script "
+                             "(voir headless.py), puis affiche le bilan de la partie")
+    parser.add_argument("--level", type=int, default=1, help="niveau à simuler (avec --headless)")
+    parser.add_argument("--max-time", type=float, default=300.0,
+                        help="durée maximale en secondes de temps du jeu (avec --headless)")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre les commandes du niveau joué dans un journal (voir input_log.py)")
+    parser.add_argument("--replay", metavar="FICHIER",
+                        help="rejoue sans affichage une partie enregistrée avec --record et vérifie qu'elle aboutit "
+                             "au même état")
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
+    arguments = parse_arguments()
+    if arguments.headless:
+        import headless  # impose les pilotes SDL « dummy » : à importer seulement dans ce mode
+        headless.print_report(headless.run(headless.load_script(arguments.headless), arguments.level,
+                                           arguments.max_time))
+        sys.exit(0)
+    if arguments.replay:
+        import headless
+        from input_log import InputLog
+        report = headless.replay(InputLog.load(arguments.replay))
+        headless.print_report(report)
+        sys.exit(0 if report['identical'] else 1)
+    if arguments.record:
+        Controls().record(arguments.record)
+
     try:
         main()
     except FileNotFoundError as e:
@@ -1,8 +1,13 @@
 import pygame
 
+from asset_manager import AssetManager
+from game_clock import GameClock
 from scene import Scene
 from scene_manager import SceneManager
+from tracer import traced
 from game_settings import FILES, GameSettings
+from text_cache import TextCache
+from text_sprite import TextSprite
 
 
 class SplashScene(Scene):
@@ -10,27 +15,34 @@ class SplashScene(Scene):
 
     _FADE_OUT_DURATION: int = 1500  # ms
 
-    def __init__(self) -> None:
-        super().__init__()
+    @traced()
+    def __init__(self, clock: GameClock) -> None:
+        super().__init__(clock)
         self._settings = GameSettings()
-        self._surface = pygame.image.load(FILES['splash']).convert_alpha()
-        self._music = pygame.mixer.Sound(FILES['music_splash'])
+        with AssetManager().scope(self.asset_scope()):
+            self._surface = AssetManager().load_image(FILES['splash'])
+            self._music = AssetManager().load_sound(FILES['music_splash'])
         self._music.play(loops=-1, fade_ms=1000)
         self._fade_out_start_time = None
 
         # Bottom text properties
-        self._font = pygame.font.Font("fonts/boombox2.ttf", 20)
+        self._font = TextCache().get_font("fonts/boombox2.ttf", 20)
         self._blink_interval = 50
         self._opacity_change = 25
         self._max_opacity = 255
         self._min_opacity = 10
-        self._last_blink_time = pygame.time.get_ticks()
+        self._last_blink_time = self._clock.ticks()
         self._text_opacity = self._max_opacity
         self._fading_out = False
         self._show_text = False
 
-    def unload(self):
-        return
+        self._text = TextSprite(self._font, outline_color=(0, 0, 139), outline_thickness=4)
+        self._text.set_text(("PRESS ", (255, 255, 255)), ("SPACE", (255, 255, 0)), (" OR ", (255, 255, 255)),
+                            ("RETURN", (255, 255, 0)), (" TO PLAY", (255, 255, 255)))
+        # Centré horizontalement, 75 pixels au-dessus du bas de l'écran (la marge contient le contour)
+        text_width = self._text.rect.width - 2 * self._text.margin
+        self._text.rect.topleft = ((self._settings.SCREEN_WIDTH - text_width) // 2 - self._text.margin,
+                                   self._settings.SCREEN_HEIGHT - 75 - self._text.margin)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if self._settings.JOYSTICK:
@@ -43,17 +55,17 @@ class SplashScene(Scene):
                 self.start_level()
 
     def start_level(self) -> None:
-        self._fade_out_start_time = pygame.time.get_ticks()
+        self._fade_out_start_time = self._clock.ticks()
         SceneManager().change_scene("level1_load", SplashScene._FADE_OUT_DURATION)
 
     def update(self, delta_time: float) -> None:
         if self._fade_out_start_time:
-            elapsed_time = pygame.time.get_ticks() - self._fade_out_start_time
+            elapsed_time = self._clock.ticks() - self._fade_out_start_time
             volume = max(0.0, 1.0 - (elapsed_time / SplashScene._FADE_OUT_DURATION))
             if volume == 0:
                 self._fade_out_start_time = None
 
-        current_time = pygame.time.get_ticks()
+        current_time = self._clock.ticks()
         if self._show_text:
             if current_time - self._last_blink_time >= self._blink_interval:
                 if self._fading_out:
@@ -70,7 +82,7 @@ class SplashScene(Scene):
         else:
             self._show_text = self._last_blink_time + 3500 < current_time
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface, interpolation: float = 1.0) -> None:
         # Draw the splash image first
         screen.blit(self._surface, (0, 0))
 
@@ -81,57 +93,6 @@ class SplashScene(Scene):
         return self._surface
 
     def _render_text(self, screen: pygame.Surface) -> None:
-
-        # Surface sur laquelle afficher le texte
-        text_surface = pygame.Surface((screen.get_width(), 50), pygame.SRCALPHA)
-
-        # Crée les texte
-        text1 = self._font.render("PRESS ", True, (255, 255, 255))
-        text2 = self._font.render("SPACE", True, (255, 255, 0))
-        text3 = self._font.render(" OR ", True, (255, 255, 255))
-        text4 = self._font.render("RETURN", True, (255, 255, 0))
-        text5 = self._font.render(" TO PLAY", True, (255, 255, 255))
-
-        text1_outline = self._font.render("PRESS ", True, (0, 0, 139))
-        text2_outline = self._font.render("SPACE", True, (0, 0, 139))
-        text3_outline = self._font.render(" OR ", True, (0, 0, 139))
-        text4_outline = self._font.render("RETURN", True, (0, 0, 139))
-        text5_outline = self._font.render(" TO PLAY", True, (0, 0, 139))
-
-        # Position du texte
-        text_y = 25
-        x_offset = (screen.get_width() - (
-            text1.get_width() + text2.get_width() + text3.get_width() + text4.get_width() + text5.get_width())) // 2
-
-        def draw_outline(init_x_offset, init_y_offset, text_outline):
-            outline_offset = 4
-            text_surface.blit(text_outline, (init_x_offset + outline_offset, init_y_offset))
-            text_surface.blit(text_outline, (init_x_offset - outline_offset, init_y_offset))
-            text_surface.blit(text_outline, (init_x_offset, init_y_offset + outline_offset))
-            text_surface.blit(text_outline, (init_x_offset, init_y_offset - outline_offset))
-            text_surface.blit(text_outline, (init_x_offset + outline_offset, init_y_offset + outline_offset))
-            text_surface.blit(text_outline, (init_x_offset - outline_offset, init_y_offset - outline_offset))
-            text_surface.blit(text_outline, (init_x_offset + outline_offset, init_y_offset + outline_offset))
-            text_surface.blit(text_outline, (init_x_offset - outline_offset, init_y_offset + outline_offset))
-
-        # Ajoute le texte à la surface
-        draw_outline(x_offset, text_y, text1_outline)
-        text_surface.blit(text1, (x_offset, text_y))
-        x_offset += text1.get_width()
-        draw_outline(x_offset, text_y, text2_outline)
-        text_surface.blit(text2, (x_offset, text_y))
-        x_offset += text2.get_width()
-        draw_outline(x_offset, text_y, text3_outline)
-        text_surface.blit(text3, (x_offset, text_y))
-        x_offset += text3.get_width()
-        draw_outline(x_offset, text_y, text4_outline)
-        text_surface.blit(text4, (x_offset, text_y))
-        x_offset += text4.get_width()
-        draw_outline(x_offset, text_y, text5_outline)
-        text_surface.blit(text5, (x_offset, text_y))
-
-        # Applique l'opacité à la surface
-        text_surface.set_alpha(self._text_opacity)
-
-        # Blit the text surface onto the screen
-        screen.blit(text_surface, (0, screen.get_height() - 100))
+        # Applique l'opacité au texte
+        self._text.set_alpha(self._text_opacity)
+        self._text.draw(screen)
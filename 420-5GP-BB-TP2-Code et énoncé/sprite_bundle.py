@@ -0,0 +1,173 @@
+"""
+  Paquet de sprites précompilé.
+
+  Le paquet regroupe dans un seul fichier binaire les trames déjà découpées des feuilles de sprites (pixels au format
+  de l'affichage) ainsi que leurs masques de collision (rectangles de pixels opaques). À l'exécution, le
+  fichier est projeté en mémoire (mmap) et les trames sont enveloppées avec pygame.image.frombuffer : aucun décodage
+  PNG ni balayage des pixels pour construire les masques.
+
+  Pour (re)construire le paquet :  python sprite_bundle.py
+"""
+import mmap
+import os
+import struct
+import sys
+
+import pygame
+
+from game_settings import FILES
+
+_MAGIC = b"STXB"
+_VERSION = 1
+_PIXEL_FORMAT = "BGRA"  # même disposition que Surface.convert_alpha() sur un affichage 32 bits
+
+_HEADER = struct.Struct("<4sH4sI")     # magique, version, format des pixels, nombre de trames
+_FRAME = struct.Struct("<HHIII")       # largeur, hauteur, position des pixels, position des rectangles, nb rectangles
+_RECT = struct.Struct("<HHHH")         # x, y, largeur, hauteur
+
+
+class SpriteBundle:
+    """ Lecteur d'un paquet de sprites projeté en mémoire. """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Ouvre un paquet de sprites.
+        :param filename: chemin du paquet
+        """
+        with open(filename, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, pixel_format, nb_frames = _HEADER.unpack_from(self._view, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{filename} n'est pas un paquet de sprites valide")
+        self._pixel_format = pixel_format.decode("ascii")
+
+        self._index = {}
+        offset = _HEADER.size
+        for _ in range(nb_frames):
+            (name_length,) = struct.unpack_from("<H", self._view, offset)
+            offset += 2
+            name = bytes(self._view[offset:offset + name_length]).decode("utf-8")
+            offset += name_length
+            self._index[name] = _FRAME.unpack_from(self._view, offset)
+            offset += _FRAME.size
+
+        self._filled_masks = {}  # taille -> masque plein (réutilisé pour construire les masques)
+
+    @staticmethod
+    def is_fresh(filename: str, sources: tuple) -> bool:
+        """
+        Vérifie si un paquet existe et s'il est plus récent que les fichiers à partir desquels il a été construit.
+        :param filename: chemin du paquet
+        :param sources: chemins des feuilles de sprites
+        :return: True si le paquet peut être utilisé, False sinon
+        """
+        if not os.path.exists(filename):
+            return False
+        bundle_time = os.path.getmtime(filename)
+        return all(os.path.getmtime(source) <= bundle_time for source in sources)
+
+    def frame(self, name: str) -> tuple:
+        """
+        Retourne une trame du paquet.
+        :param name: nom de la trame
+        :return: un tuple (image, masque)
+        """
+        width, height, pixels_offset, rects_offset, nb_rects = self._index[name]
+        pixels = self._view[pixels_offset:pixels_offset + width * height * 4]
+        surface = pygame.image.frombuffer(pixels, (width, height), self._pixel_format)
+
+        mask = pygame.Mask((width, height))
+        rects = self._view[rects_offset:rects_offset + nb_rects * _RECT.size]
+        for x, y, rect_width, rect_height in _RECT.iter_unpack(rects):
+            size = (rect_width, rect_height)
+            filled = self._filled_masks.get(size)
+            if filled is None:
+                filled = self._filled_masks[size] = pygame.Mask(size, fill=True)
+            mask.draw(filled, (x, y))
+
+        return surface, mask
+
+
+def _mask_rects(mask: pygame.Mask) -> list:
+    """
+    Décompose un masque en rectangles (x, y, largeur, hauteur) de pixels pleins. Les segments horizontaux identiques
+    de lignes consécutives sont fusionnés afin de réduire le nombre de rectangles à dessiner au chargement.
+    """
+    rects = []
+    open_rects = {}  # (x, largeur) -> y de départ
+    width, height = mask.get_size()
+    for y in range(height + 1):
+        runs = set()
+        x = 0
+        while y < height and x < width:
+            if mask.get_at((x, y)):
+                start = x
+                while x < width and mask.get_at((x, y)):
+                    x += 1
+                runs.add((start, x - start))
+            else:
+                x += 1
+
+        for run in list(open_rects):
+            if run not in runs:
+                start_y = open_rects.pop(run)
+                rects.append((run[0], start_y, run[1], y - start_y))
+        for run in runs:
+            open_rects.setdefault(run, y)
+    return rects
+
+
+def write_bundle(filename: str, frames: dict) -> None:
+    """
+    Écrit un paquet de sprites.
+    :param filename: chemin du paquet
+    :param frames: dictionnaire nom -> image (pygame.Surface) ; le masque est construit à partir de l'image
+    """
+    table = bytearray()
+    data = bytearray()
+    entries = []
+    for name, surface in frames.items():
+        pixels = pygame.image.tobytes(surface, _PIXEL_FORMAT)
+        rects = _mask_rects(pygame.mask.from_surface(surface))
+        entries.append((name, surface.get_size(), pixels, rects))
+
+    header_size = _HEADER.size + sum(2 + len(name.encode("utf-8")) + _FRAME.size for name, *_ in entries)
+    for name, (width, height), pixels, rects in entries:
+        pixels_offset = header_size + len(data)
+        data += pixels
+        rects_offset = header_size + len(data)
+        for rect in rects:
+            data += _RECT.pack(*rect)
+
+        encoded_name = name.encode("utf-8")
+        table += struct.pack("<H", len(encoded_name)) + encoded_name
+        table += _FRAME.pack(width, height, pixels_offset, rects_offset, len(rects))
+
+    with open(filename, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, _PIXEL_FORMAT.encode("ascii"), len(entries)))
+        file.write(table)
+        file.write(data)
+
+
+def main() -> None:
+    """ Construit le paquet de sprites du jeu à partir des feuilles de sprites. """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    from astronaut import Astronaut
+    from taxi import Taxi
+
+    frames = {}
+    frames.update(Taxi._build_bundle_frames())
+    frames.update(Astronaut._build_bundle_frames())
+    write_bundle(FILES['sprite_bundle'], frames)
+
+    print(f"{FILES['sprite_bundle']} : {len(frames)} trames, {os.path.getsize(FILES['sprite_bundle'])} octets")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
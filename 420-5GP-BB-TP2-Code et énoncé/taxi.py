@@ -1,7 +1,10 @@
 from enum import Enum, auto
+from types import MappingProxyType
 
 import pygame
 
+from asset_manager import AssetManager
+from controls import Controls
 from game_settings import FILES
 from astronaut import Astronaut, AstronautState
 from hud import HUD
@@ -9,6 +12,8 @@ from obstacle import Obstacle
 from pad import Pad
 from pump import Pump
 from game_settings import FILES, GameSettings
+from sprite_bundle import SpriteBundle
+from tracer import traced
 
 
 class ImgSelector(Enum):
@@ -60,6 +65,20 @@ class Taxi(pygame.sprite.Sprite):
     _FRICTION_MUL = 0.9995  # la vitesse horizontale est multipliée par la friction
     _GRAVITY_ADD = 0.005  # la gravité est ajoutée à la vitesse verticale
 
+    # colonnes de la feuille de sprites superposées pour construire l'image de chaque état
+    _SHEET_COLUMNS = {ImgSelector.IDLE: (0,),
+                      ImgSelector.BOTTOM_REACTOR: (0, 1),
+                      ImgSelector.TOP_REACTOR: (0, 2),
+                      ImgSelector.REAR_REACTOR: (0, 3),
+                      ImgSelector.BOTTOM_AND_REAR_REACTORS: (0, 1, 3),
+                      ImgSelector.TOP_AND_REAR_REACTORS: (0, 2, 3),
+                      ImgSelector.GEAR_OUT: (0, 4),
+                      ImgSelector.GEAR_SHOCKS: (5,),
+                      ImgSelector.GEAR_OUT_AND_BOTTOM_REACTOR: (0, 1, 4),
+                      ImgSelector.DESTROYED: (0,)}  # renversé verticalement
+
+    _atlas = None  # images et masques partagés par tous les taxis (construits une seule fois par processus)
+
     def __init__(self, pos: tuple) -> None:
         """
         Initialise une instance de taxi.
@@ -73,16 +92,17 @@ class Taxi(pygame.sprite.Sprite):
 
         self._hud = HUD()
 
-        self._reactor_sound = pygame.mixer.Sound(FILES['reactor_sound'])
-        self._reactor_sound.set_volume(0)
-        self._reactor_sound.play(-1)
+        # le son est partagé entre les taxis : le volume est ajusté sur le canal propre à ce taxi
+        self._reactor_sound = AssetManager().load_sound(FILES['reactor_sound'])
+        self._reactor_channel = self._reactor_sound.play(-1)
+        self._set_reactor_volume(0)
 
-        self._crash_sound = pygame.mixer.Sound(FILES['crash_sound'])
-        self._SOFT_LANDING_SOUND = pygame.mixer.Sound(FILES['soft_landing_sound'])
-        self._ROUGH_LANDING_SOUND = pygame.mixer.Sound(FILES['rough_landing_sound'])
-        self._HIT_ASTRONAUT = pygame.mixer.Sound(FILES['gary_hey_sound'])
+        self._crash_sound = AssetManager().load_sound(FILES['crash_sound'])
+        self._SOFT_LANDING_SOUND = AssetManager().load_sound(FILES['soft_landing_sound'])
+        self._ROUGH_LANDING_SOUND = AssetManager().load_sound(FILES['rough_landing_sound'])
+        self._HIT_ASTRONAUT = AssetManager().load_sound(FILES['gary_hey_sound'])
 
-        self._surfaces, self._masks, self._maskReactor = Taxi._load_and_build_surfaces()
+        self._surfaces, self._masks, self._maskReactor = Taxi._get_atlas()
         self.fuel_remaining = 1.0
 
         self._reinitialize()
@@ -129,16 +149,14 @@ class Taxi(pygame.sprite.Sprite):
 
         return False
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """ Dessine le taxi sur la surface fournie comme argument. """
-
-        fuel_percentage = int(self.fuel_remaining * 100)  # Convert to percentage
-        font = pygame.font.Font(None, 36)
-        text = font.render(f"Fuel: {fuel_percentage}%", True, (0,0,0))
-        text_rect = text.get_rect(center=(1280 // 2, 720 - 50))
-        surface.blit(text, text_rect)
-
-        surface.blit(self.image, self.rect)
+    def draw(self, surface: pygame.Surface, interpolation: float = 1.0) -> list:
+        """
+        Dessine le taxi sur la surface fournie comme argument.
+        :param interpolation: position entre le pas de simulation précédent (0.0) et le dernier (1.0)
+        :return: les zones de la surface modifiées
+        """
+        pos = self._previous_pos_vector2.lerp(self._pos_vector2, interpolation)
+        return [surface.blit(self.image, (round(pos.x), round(pos.y)))]
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """ Gère les événements du taxi. """
@@ -148,7 +166,7 @@ class Taxi(pygame.sprite.Sprite):
             if event.key == pygame.K_SPACE:
                 self.activate_gear()
 
-        if self.settings.JOYSTICK:
+        if Controls().has_joystick():
             if event.type == pygame.JOYBUTTONDOWN:
                 if event.button == 1:
                     self.activate_gear()
@@ -163,6 +181,11 @@ class Taxi(pygame.sprite.Sprite):
 
             self.select_image(False)
 
+    def state(self) -> list:
+        """ Retourne l'état physique du taxi : position, vitesse, accélération, indicateurs et carburant. """
+        return [tuple(self._pos_vector2), tuple(self._velocity_vector2), tuple(self._acceleration_vector2),
+                self._flags, self.fuel_remaining]
+
     def has_exited(self) -> bool:
         """
         Vérifie si le taxi a quitté le niveau (par la sortie).
@@ -224,7 +247,6 @@ class Taxi(pygame.sprite.Sprite):
 
         if pygame.sprite.collide_mask(self, pad):
             if abs(self._velocity_vector2.y) > Taxi._MAX_VELOCITY_SMOOTH_LANDING:
-                print(f"Vitesse verticale : {self._velocity_vector2.y}")
                 self._ROUGH_LANDING_SOUND.play()
                 Taxi._FLAG_SHOCK = True
                 self._flags = Taxi._FLAG_SHOCK
@@ -272,7 +294,6 @@ class Taxi(pygame.sprite.Sprite):
 
         if not self.rect.colliderect(pump.rect):
             return False
-        print("refueling")
         if self.fuel_remaining<1.0:
             self.fuel_remaining+=0.1
             if self.fuel_remaining >= 1:
@@ -301,6 +322,8 @@ class Taxi(pygame.sprite.Sprite):
         :param kwargs: inutilisé
         """
 
+        self._previous_pos_vector2 = self._pos_vector2.copy()
+
         # ÉTAPE 1 - gérer les touches présentement enfoncées
         self._handle_keys()
 
@@ -319,15 +342,20 @@ class Taxi(pygame.sprite.Sprite):
         # ÉTAPE 3 - fait entendre les réacteurs ou pas
         reactor_flags = Taxi._FLAG_TOP_REACTOR | Taxi._FLAG_REAR_REACTOR | Taxi._FLAG_BOTTOM_REACTOR
         if self._flags & reactor_flags:
-            self._reactor_sound.set_volume(Taxi._REACTOR_SOUND_VOLUME)
+            self._set_reactor_volume(Taxi._REACTOR_SOUND_VOLUME)
         else:
-            self._reactor_sound.set_volume(0)
+            self._set_reactor_volume(0)
 
 
         # ÉTAPE 4 - sélectionner la bonne image en fonction de l'état du taxi
         self.select_image(False)
         self.drain_fuel()
 
+    def _set_reactor_volume(self, volume: float) -> None:
+        """ Ajuste le volume des réacteurs de ce taxi seulement. """
+        if self._reactor_channel:
+            self._reactor_channel.set_volume(volume)
+
     # draine l'escence du taxi quand il utilise ses reacteurs
     def drain_fuel(self) -> None:
         if self.fuel_remaining < 0 and  self._flags  != Taxi._FLAG_DESTROYED :
@@ -336,18 +364,13 @@ class Taxi(pygame.sprite.Sprite):
             self._flags = self._FLAG_DESTROYED
             self._crash_sound.play()
             self._velocity_vector2 = pygame.math.Vector2(0.0, 0.0)
-            print("no fuel")
             self._acceleration_vector2 = pygame.math.Vector2(0.0, Taxi._CRASH_ACCELERATION)
         else:
             if self._flags == Taxi._FLAG_BOTTOM_REACTOR:
-                print("bottom")
                 self.fuel_remaining-= self._BOTTOM_REACTOR_POWER
             if self._flags == Taxi._FLAG_TOP_REACTOR:
-                print("top")
-
                 self.fuel_remaining-= self._TOP_REACTOR_POWER
             if self._flags == Taxi._FLAG_REAR_REACTOR:
-                print("rear")
                 self.fuel_remaining-= self._REAR_REACTOR_POWER
         # print(self.fuel_remaining)
 
@@ -356,11 +379,12 @@ class Taxi(pygame.sprite.Sprite):
         if self._flags & Taxi._FLAG_DESTROYED == Taxi._FLAG_DESTROYED:
             return
 
-        keys = pygame.key.get_pressed()
+        controls = Controls()
+        keys = controls.get_pressed()
 
         gear_out = self._flags & Taxi._FLAG_GEAR_OUT == Taxi._FLAG_GEAR_OUT
 
-        if not self.settings.JOYSTICK :
+        if not controls.has_joystick():
             if not gear_out:
                 if keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]:
                     self._flags |= Taxi._FLAG_REAR_REACTOR
@@ -404,13 +428,13 @@ class Taxi(pygame.sprite.Sprite):
                 self._acceleration_vector2.y = 0.0
         else:
             if not gear_out:
-                if self.settings.JOYSTICK[0].get_axis(3) < -0.1 or self.settings.JOYSTICK[0].get_axis(3) > 0.1:
+                if controls.get_axis(3) < -0.1 or controls.get_axis(3) > 0.1:
                     self._flags |= Taxi._FLAG_REAR_REACTOR
-                    if self.settings.JOYSTICK[0].get_axis(3) < -0.1:
+                    if controls.get_axis(3) < -0.1:
                         self._flags |= Taxi._FLAG_LEFT
                         self._acceleration_vector2.x = max(self._acceleration_vector2.x - Taxi._REAR_REACTOR_POWER,
                                                            -Taxi._MAX_ACCELERATION_X)
-                    elif self.settings.JOYSTICK[0].get_axis(3) > 0.1:
+                    elif controls.get_axis(3) > 0.1:
                         self._flags &= ~Taxi._FLAG_LEFT
                         self._acceleration_vector2.x = min(self._acceleration_vector2.x + Taxi._REAR_REACTOR_POWER,
                                                            Taxi._MAX_ACCELERATION_X)
@@ -418,13 +442,13 @@ class Taxi(pygame.sprite.Sprite):
                     self._flags &= ~Taxi._FLAG_REAR_REACTOR
                     self._acceleration_vector2.x = 0.0
 
-                if self.settings.JOYSTICK[0].get_axis(4):
+                if controls.get_axis(4):
                     self._flags &= ~Taxi._FLAG_BOTTOM_REACTOR
                     self._flags |= Taxi._FLAG_TOP_REACTOR
                     self._acceleration_vector2.y = min(self._acceleration_vector2.y + Taxi._TOP_REACTOR_POWER,
                                                        Taxi._MAX_ACCELERATION_Y_DOWN)
 
-            if self.settings.JOYSTICK[0].get_axis(4) < -0.1:
+            if controls.get_axis(4) < -0.1:
                 self._flags &= ~Taxi._FLAG_TOP_REACTOR
                 self._flags |= Taxi._FLAG_BOTTOM_REACTOR
                 self._acceleration_vector2.y = max(self._acceleration_vector2.y - Taxi._BOTTOM_REACTOR_POWER,
@@ -440,7 +464,7 @@ class Taxi(pygame.sprite.Sprite):
                     self._taking_off = True
                     self._pad_landed_on = None
 
-            if 0.1 > self.settings.JOYSTICK[0].get_axis(4) > -0.1:
+            if 0.1 > controls.get_axis(4) > -0.1:
                 self._flags &= ~(Taxi._FLAG_TOP_REACTOR | Taxi._FLAG_BOTTOM_REACTOR)
                 self._acceleration_vector2.y = 0.0
 
@@ -456,6 +480,7 @@ class Taxi(pygame.sprite.Sprite):
         self.rect.y = self._initial_pos[1] - self.rect.height / 2
 
         self._pos_vector2 = pygame.math.Vector2(float(self.rect.x), float(self.rect.y))
+        self._previous_pos_vector2 = self._pos_vector2.copy()  # position au pas de simulation précédent
         self._velocity_vector2 = pygame.math.Vector2(0.0, 0.0)
         self._acceleration_vector2 = pygame.math.Vector2(0.0, 0.0)
 
@@ -550,141 +575,110 @@ class Taxi(pygame.sprite.Sprite):
             self.mask = self._maskReactor[ImgSelector.IDLE][facing]
 
     @staticmethod
+    def _get_atlas() -> tuple:
+        """
+        Retourne les images et les masques partagés par tous les taxis, en les construisant au premier appel.
+        Les dictionnaires retournés sont en lecture seule et les images ne doivent pas être modifiées.
+        :return: un tuple (images, masques de la carrosserie, masques incluant les réacteurs)
+        """
+        if Taxi._atlas is None:
+            # l'atlas vit aussi longtemps que le programme : il n'appartient à aucune scène
+            with AssetManager().scope(AssetManager.GLOBAL_SCOPE):
+                surfaces, masks, masks_reactor = Taxi._load_and_build_surfaces()
+            masks, masks_reactor = Taxi._deduplicate_masks(masks, masks_reactor)
+            Taxi._atlas = tuple(MappingProxyType(dictionary) for dictionary in (surfaces, masks, masks_reactor))
+        return Taxi._atlas
+
+    @staticmethod
+    def _deduplicate_masks(*dictionaries: dict) -> tuple:
+        """
+        Remplace les masques identiques (même taille, mêmes pixels) par une seule instance.
+        :param dictionaries: dictionnaires de paires de masques (vers la droite, vers la gauche)
+        :return: les dictionnaires, dans le même ordre, où les masques identiques sont partagés
+        """
+        unique_masks = []
+
+        def unique(mask: pygame.Mask) -> pygame.Mask:
+            count = mask.count()
+            for other in unique_masks:
+                if (other is mask or other.get_size() == mask.get_size() and other.count() == count
+                        and other.overlap_area(mask, (0, 0)) == count):
+                    return other
+            unique_masks.append(mask)
+            return mask
+
+        return tuple({selector: tuple(unique(mask) for mask in pair) for selector, pair in dictionary.items()}
+                     for dictionary in dictionaries)
+
+    @staticmethod
+    @traced()
     def _load_and_build_surfaces() -> tuple:
         """
-        Charge et découpe la feuille de sprites (sprite sheet) pour le taxi.
-        Construit les images et les masques pour chaque état.
-        :return: un tuple contenant deux dictionnaires (avec les états comme clés):
+        Charge les images du taxi (à partir du paquet de sprites s'il est à jour, sinon à partir de la feuille de
+        sprites) et construit les masques pour chaque état.
+        :return: un tuple contenant trois dictionnaires (avec les états comme clés):
                      - un dictionnaire d'images (pygame.Surface)
-                     - un dictionnaire de masques (pygame.Mask)
+                     - un dictionnaire de masques de la carrosserie (pygame.Mask)
+                     - un dictionnaire de masques incluant les réacteurs (pygame.Mask)
         """
         surfaces = {}
-        masks = {}
         masksReactor = {}
-        sprite_sheet = pygame.image.load(Taxi._TAXIS_FILENAME).convert_alpha()
+        if SpriteBundle.is_fresh(FILES['sprite_bundle'], (Taxi._TAXIS_FILENAME,)):
+            bundle = AssetManager().load_bundle(FILES['sprite_bundle'])
+            for selector in ImgSelector:
+                (surface, mask), (flipped, flipped_mask) = (bundle.frame(f"taxi/{selector.name}/{facing}")
+                                                            for facing in (0, Taxi._FLAG_LEFT))
+                surfaces[selector] = surface, flipped
+                masksReactor[selector] = mask, flipped_mask
+        else:
+            for selector, (surface, flipped) in Taxi._build_surfaces().items():
+                surfaces[selector] = surface, flipped
+                masksReactor[selector] = pygame.mask.from_surface(surface), pygame.mask.from_surface(flipped)
+
+        # seule la carrosserie compte pour les collisions, sauf lorsque les réacteurs sont vérifiés
+        masks = dict(masksReactor)
+        for selector in (ImgSelector.BOTTOM_REACTOR, ImgSelector.TOP_REACTOR, ImgSelector.REAR_REACTOR,
+                         ImgSelector.BOTTOM_AND_REAR_REACTORS, ImgSelector.TOP_AND_REAR_REACTORS):
+            masks[selector] = masks[ImgSelector.IDLE]
+        masks[ImgSelector.GEAR_OUT_AND_BOTTOM_REACTOR] = masks[ImgSelector.GEAR_OUT]
+
+        return surfaces, masks, masksReactor
+
+    @staticmethod
+    def _build_surfaces() -> dict:
+        """
+        Charge et découpe la feuille de sprites (sprite sheet) pour le taxi.
+        :return: un dictionnaire (avec les états comme clés) de paires d'images (vers la droite, vers la gauche)
+        """
+        surfaces = {}
+        sprite_sheet = AssetManager().load_image(Taxi._TAXIS_FILENAME)
         sheet_width = sprite_sheet.get_width()
         sheet_height = sprite_sheet.get_height()
 
-        # taxi normal - aucun réacteur - aucun train d'atterrissage
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.IDLE] = surface, flipped
-        masks[ImgSelector.IDLE] = pygame.mask.from_surface(surface), pygame.mask.from_surface(flipped)
-        masksReactor[ImgSelector.IDLE] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(flipped )
-
-
-        # taxi avec réacteur du dessous
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.BOTTOM_REACTOR] = surface, flipped
-        masks[ImgSelector.BOTTOM_REACTOR] = masks[ImgSelector.IDLE]
-        masksReactor[ImgSelector.BOTTOM_REACTOR] = pygame.mask.from_surface(surface), pygame.mask.from_surface(flipped)
-
-        # taxi avec réacteur du dessus
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = 2 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.TOP_REACTOR] = surface, flipped
-        masks[ImgSelector.TOP_REACTOR] = masks[ImgSelector.IDLE]
-        masksReactor[ImgSelector.TOP_REACTOR] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(flipped )
-
-        # taxi avec réacteur arrière
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = 3 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.REAR_REACTOR] = surface, flipped
-        masks[ImgSelector.REAR_REACTOR] = masks[ImgSelector.IDLE]
-        masksReactor[ImgSelector.REAR_REACTOR] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(
-            flipped )
-
-        # taxi avec réacteurs du dessous et arrière
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = 3 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.BOTTOM_AND_REAR_REACTORS] = surface, flipped
-        masks[ImgSelector.BOTTOM_AND_REAR_REACTORS] = masks[ImgSelector.IDLE]
-        masksReactor[ImgSelector.BOTTOM_AND_REAR_REACTORS] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(
-            flipped )
-
-        # taxi avec réacteurs du dessus et arrière
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = 2 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = 3 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.TOP_AND_REAR_REACTORS] = surface, flipped
-        masks[ImgSelector.TOP_AND_REAR_REACTORS] = masks[ImgSelector.IDLE]
-        masksReactor[ImgSelector.TOP_AND_REAR_REACTORS] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(
-            flipped )
-
-        # taxi avec train d'atterrissage
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = 4 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.GEAR_OUT] = surface, flipped
-        masks[ImgSelector.GEAR_OUT] = pygame.mask.from_surface(surface), pygame.mask.from_surface(flipped)
-        masksReactor[ImgSelector.GEAR_OUT] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(
-            flipped )
-
-        # taxi avec train d'atterrissage comprimé
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        source_rect.x = 5 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.GEAR_SHOCKS] = surface, flipped
-        masks[ImgSelector.GEAR_SHOCKS] = pygame.mask.from_surface(surface), pygame.mask.from_surface(flipped)
-        masksReactor[ImgSelector.GEAR_SHOCKS] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(
-            flipped )
-
-        # taxi avec réacteur du dessous et train d'atterrissage
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        source_rect.x = 4 * source_rect.width
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.GEAR_OUT_AND_BOTTOM_REACTOR] = surface, flipped
-        masks[ImgSelector.GEAR_OUT_AND_BOTTOM_REACTOR] = masks[ImgSelector.GEAR_OUT]
-        masksReactor[ImgSelector.GEAR_OUT_AND_BOTTOM_REACTOR] = pygame.mask.from_surface( surface ), pygame.mask.from_surface(
-            flipped )
-
-        # taxi détruit
-        surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
-        source_rect = surface.get_rect()
-        surface.blit(sprite_sheet, (0, 0), source_rect)
-        surface = pygame.transform.flip(surface, False, True)
-        flipped = pygame.transform.flip(surface, True, False)
-        surfaces[ImgSelector.DESTROYED] = surface, flipped
-        masks[ImgSelector.DESTROYED] = pygame.mask.from_surface(surface), pygame.mask.from_surface(flipped)
-        masksReactor[ImgSelector.DESTROYED] = pygame.mask.from_surface(surface ), pygame.mask.from_surface(flipped )
+        for selector, columns in Taxi._SHEET_COLUMNS.items():
+            surface = pygame.Surface((sheet_width / Taxi._NB_TAXI_IMAGES, sheet_height), flags=pygame.SRCALPHA)
+            source_rect = surface.get_rect()
+            for column in columns:
+                source_rect.x = column * source_rect.width
+                surface.blit(sprite_sheet, (0, 0), source_rect)
+            if selector == ImgSelector.DESTROYED:
+                surface = pygame.transform.flip(surface, False, True)
+            flipped = pygame.transform.flip(surface, True, False)
+            surfaces[selector] = surface, flipped
 
-        return surfaces, masks, masksReactor
+        return surfaces
+
+    @staticmethod
+    def _build_bundle_frames() -> dict:
+        """
+        Construit les trames du taxi à inclure dans le paquet de sprites (voir sprite_bundle.py).
+        :return: un dictionnaire nom de trame -> image
+        """
+        frames = {}
+        for selector, (surface, flipped) in Taxi._build_surfaces().items():
+            frames[f"taxi/{selector.name}/0"] = surface
+            frames[f"taxi/{selector.name}/{Taxi._FLAG_LEFT}"] = flipped
+        return frames
 
     @property
     def FLAG_LEFT(self):
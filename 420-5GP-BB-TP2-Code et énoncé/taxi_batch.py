@@ -0,0 +1,172 @@
+"""
+  Physique de plusieurs taxis simulés ensemble.
+
+  Un TaxiBatch fait avancer N taxis d'un pas de simulation à la fois, avec les mêmes règles que Taxi.update,
+  Taxi._handle_keys, Taxi.activate_gear et Taxi.drain_fuel (mêmes constantes, mêmes opérations dans le même ordre :
+  les résultats sont identiques au bit près). L'état des taxis est conservé dans des tableaux NumPy (un tableau par
+  attribut) et les commandes sont les mots de bits de Controls, un par taxi. Sert à évaluer en lot des milliers de
+  stratégies de pilotage ou de parties fantômes, là où un objet Taxi par taxi serait beaucoup trop lent.
+
+  Les collisions (plateformes, obstacles, pompes), les sons et les images ne sont pas simulés : ils restent propres
+  à Taxi. Les tableaux sont publics pour que l'appelant puisse les lire ou y appliquer ses propres règles
+  (atterrissage, plein d'essence, etc.).
+"""
+import numpy as np
+
+from controls import Controls
+from taxi import Taxi
+
+
+class TaxiBatch:
+    """ État et physique d'un lot de taxis. """
+
+    _AXIS_THRESHOLD = 0.1
+
+    def __init__(self, count: int, position: tuple = (0.0, 0.0)) -> None:
+        """
+        Initialise un lot de taxis immobiles (comme Taxi._reinitialize).
+        :param count: nombre de taxis
+        :param position: position (x, y) du coin supérieur gauche de chaque taxi
+        """
+        self.positions = np.tile(np.array(position, dtype=np.float64), (count, 1))
+        self.velocities = np.zeros((count, 2))
+        self.accelerations = np.zeros((count, 2))
+        self.flags = np.zeros(count, dtype=np.int64)
+        self.fuel = np.ones(count)
+        self.rects = np.rint(self.positions).astype(np.int64)  # coin supérieur gauche de Taxi.rect
+        self.landed = np.zeros(count, dtype=bool)               # Taxi.pad_landed_on n'est pas None
+        self.taking_off = np.zeros(count, dtype=bool)
+        self.last_land_y = np.zeros(count, dtype=np.int64)      # Taxi.rect.y lors du dernier atterrissage
+
+    def __len__(self) -> int:
+        """ Retourne le nombre de taxis. """
+        return len(self.flags)
+
+    @staticmethod
+    def from_taxis(taxis: list) -> 'TaxiBatch':
+        """
+        Construit un lot à partir de l'état de taxis existants.
+        :param taxis: les taxis
+        :return: le lot
+        """
+        batch = TaxiBatch(len(taxis))
+        for index, taxi in enumerate(taxis):
+            position, velocity, acceleration, flags, fuel = taxi.state()
+            batch.positions[index] = position
+            batch.velocities[index] = velocity
+            batch.accelerations[index] = acceleration
+            batch.flags[index] = flags
+            batch.fuel[index] = fuel
+            batch.rects[index] = taxi.rect.topleft
+            batch.landed[index] = taxi.pad_landed_on is not None
+            batch.taking_off[index] = taxi._taking_off
+            batch.last_land_y[index] = getattr(taxi, '_last_pos_y_land', 0)
+        return batch
+
+    def step(self, words) -> None:
+        """
+        Fait avancer tous les taxis d'un pas de simulation.
+        :param words: l'état des commandes de chaque taxi durant ce pas (mots de bits de Controls) : un tableau de
+                      N entiers, ou un seul entier pour tous les taxis
+        """
+        words = np.broadcast_to(np.asarray(words, dtype=np.int64), self.flags.shape)
+        joystick = words & Controls.JOYSTICK_BIT != 0
+
+        # pressions reçues depuis le pas précédent (Taxi.handle_event)
+        presses = (words >> Controls.SPACE_SHIFT & 3) + np.where(joystick, words >> Controls.BUTTON_SHIFT & 3, 0)
+        for press in range(int(presses.max(initial=0))):
+            self._activate_gear(presses > press)
+
+        self._handle_keys(words, joystick)
+
+        # nouvelle position (Taxi.update, étape 2)
+        velocities, accelerations = self.velocities, self.accelerations
+        velocities[:, 0] += accelerations[:, 0]
+        velocities[:, 0] *= Taxi._FRICTION_MUL
+        velocities[:, 1] += accelerations[:, 1]
+        np.add(velocities[:, 1], Taxi._GRAVITY_ADD, out=velocities[:, 1], where=~self.landed)
+        self.positions += velocities
+        self.rects = np.rint(self.positions).astype(np.int64)  # round() de Python arrondit aussi au pair
+
+        self._drain_fuel()
+
+    def _activate_gear(self, mask: np.ndarray) -> None:
+        """ Sort ou rentre le train d'atterrissage des taxis choisis qui ne sont pas posés (Taxi.activate_gear). """
+        mask = mask & ~self.landed
+        gear_in = self.flags & Taxi._FLAG_GEAR_OUT == 0
+        self.flags[mask & gear_in] &= ~(Taxi._FLAG_TOP_REACTOR | Taxi._FLAG_REAR_REACTOR)
+        self.flags[mask] ^= Taxi._FLAG_GEAR_OUT
+
+    def _axis(self, words: np.ndarray, joystick: np.ndarray, index: int) -> np.ndarray:
+        """ Position d'un axe de la manette (Controls.get_axis), 0.0 sans manette. """
+        position = (words >> (Controls.AXIS_SHIFT + 8 * index) & 0xFF) - Controls.AXIS_RESOLUTION
+        return np.where(joystick, position / Controls.AXIS_RESOLUTION, 0.0)
+
+    def _handle_keys(self, words: np.ndarray, joystick: np.ndarray) -> None:
+        """ Change l'état des taxis en fonction des commandes (Taxi._handle_keys, clavier et manette). """
+        flags = self.flags
+        accelerations_x, accelerations_y = self.accelerations[:, 0], self.accelerations[:, 1]
+        active = flags & Taxi._FLAG_DESTROYED == 0
+        gear_out = flags & Taxi._FLAG_GEAR_OUT != 0
+
+        # les deux branches de Taxi._handle_keys ramenées aux mêmes conditions
+        left, right, up, down = (words >> bit & 1 != 0 for bit in range(len(Controls.KEYS)))
+        horizontal_axis = self._axis(words, joystick, 0)
+        vertical_axis = self._axis(words, joystick, 1)
+        threshold = TaxiBatch._AXIS_THRESHOLD
+        horizontal = np.where(joystick, (horizontal_axis < -threshold) | (horizontal_axis > threshold), left | right)
+        to_left = np.where(joystick, horizontal_axis < -threshold, left)
+        to_right = np.where(joystick, horizontal_axis > threshold, right & ~left)
+        thrust_down = np.where(joystick, vertical_axis != 0, down)
+        thrust_up = np.where(joystick, vertical_axis < -threshold, up)
+        no_vertical = np.where(joystick, (vertical_axis < threshold) & (vertical_axis > -threshold), ~(up | down))
+
+        steering = active & ~gear_out
+        flags[steering & horizontal] |= Taxi._FLAG_REAR_REACTOR
+
+        mask = steering & to_left
+        flags[mask] |= Taxi._FLAG_LEFT
+        accelerations_x[mask] = np.maximum(accelerations_x[mask] - Taxi._REAR_REACTOR_POWER, -Taxi._MAX_ACCELERATION_X)
+
+        mask = steering & to_right
+        flags[mask] &= ~Taxi._FLAG_LEFT
+        accelerations_x[mask] = np.minimum(accelerations_x[mask] + Taxi._REAR_REACTOR_POWER, Taxi._MAX_ACCELERATION_X)
+
+        mask = steering & ~horizontal
+        flags[mask] &= ~Taxi._FLAG_REAR_REACTOR
+        accelerations_x[mask] = 0.0
+
+        mask = steering & thrust_down
+        flags[mask] = flags[mask] & ~Taxi._FLAG_BOTTOM_REACTOR | Taxi._FLAG_TOP_REACTOR
+        accelerations_y[mask] = np.minimum(accelerations_y[mask] + Taxi._TOP_REACTOR_POWER,
+                                           Taxi._MAX_ACCELERATION_Y_DOWN)
+
+        mask = active & thrust_up
+        flags[mask] = flags[mask] & ~Taxi._FLAG_TOP_REACTOR | Taxi._FLAG_BOTTOM_REACTOR
+        accelerations_y[mask] = np.maximum(accelerations_y[mask] - Taxi._BOTTOM_REACTOR_POWER,
+                                           -Taxi._MAX_ACCELERATION_Y_UP)
+
+        took_off = mask & self.taking_off & (self.last_land_y - 5 > self.rects[:, 1])
+        self._activate_gear(took_off & gear_out)
+        self.taking_off[took_off] = False
+
+        leaving = mask & self.landed
+        self.taking_off[leaving] = True
+        self.landed[leaving] = False
+
+        mask = active & no_vertical
+        flags[mask] &= ~(Taxi._FLAG_TOP_REACTOR | Taxi._FLAG_BOTTOM_REACTOR)
+        accelerations_y[mask] = 0.0
+
+    def _drain_fuel(self) -> None:
+        """ Consomme le carburant des réacteurs ; un taxi à court de carburant est détruit (Taxi.drain_fuel). """
+        flags = self.flags
+        crashed = (self.fuel < 0) & (flags != Taxi._FLAG_DESTROYED)
+        flags[crashed] = Taxi._FLAG_DESTROYED
+        self.velocities[crashed] = 0.0
+        self.accelerations[crashed] = (0.0, Taxi._CRASH_ACCELERATION)
+
+        for flag, power in ((Taxi._FLAG_BOTTOM_REACTOR, Taxi._BOTTOM_REACTOR_POWER),
+                            (Taxi._FLAG_TOP_REACTOR, Taxi._TOP_REACTOR_POWER),
+                            (Taxi._FLAG_REAR_REACTOR, Taxi._REAR_REACTOR_POWER)):
+            self.fuel[~crashed & (flags == flag)] -= power
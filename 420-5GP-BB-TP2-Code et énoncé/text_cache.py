@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+import pygame
+
+from tracer import Tracer
+
+
+class TextCache:
+    """
+    Singleton pour les polices et les textes rendus.
+
+    Chaque police n'est construite qu'une seule fois par (fichier, taille). Les textes rendus sont conservés dans un
+    cache LRU (les moins récemment utilisés sont évincés en premier) afin que les textes affichés à chaque trame ne
+    soient rasterisés qu'une seule fois.
+    """
+
+    _CAPACITY = 256  # nombre maximal de textes rendus conservés
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(TextCache, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, '_initialized'):
+            self._fonts = {}              # (fichier, taille) -> police
+            self._surfaces = OrderedDict()  # (police, texte, couleur, anticrénelage) -> surface
+            self.hits = 0
+            self.misses = 0
+
+            self._initialized = True
+
+    def get_font(self, filename: str or None, size: int) -> pygame.font.Font:
+        """
+        Retourne une police (construite au premier appel).
+        :param filename: chemin du fichier de police (None pour la police par défaut de pygame)
+        :param size: taille de la police
+        :return: la police
+        """
+        key = (filename, size)
+        font = self._fonts.get(key)
+        if font is None:
+            with Tracer().span(f"load font {filename} {size}", "assets"):
+                font = self._fonts[key] = pygame.font.Font(filename, size)
+        return font
+
+    def render(self, font: pygame.font.Font, text: str, color: tuple, antialias: bool = True) -> pygame.Surface:
+        """
+        Retourne le rendu d'un texte (rasterisé seulement s'il est absent du cache).
+        :param font: la police (voir get_font)
+        :param text: le texte
+        :param color: la couleur du texte
+        :param antialias: si True, le texte est anticrénelé
+        :return: la surface du texte, partagée : la copier avant de la modifier
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        if len(self._surfaces) > TextCache._CAPACITY:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """ Vide le cache des textes rendus et remet les compteurs à zéro (les polices sont conservées). """
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
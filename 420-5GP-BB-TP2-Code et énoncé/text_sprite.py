@@ -0,0 +1,102 @@
+import pygame
+
+from text_cache import TextCache
+
+
+class TextSprite(pygame.sprite.Sprite):
+    """
+    Texte conservé d'une trame à l'autre.
+
+    Le texte est composé de segments (texte, couleur) placés côte à côte, avec un contour et un fond optionnels.
+    L'image n'est reconstruite que lorsque les segments changent (set_text) ; un fondu ne change que l'opacité de
+    l'image (set_alpha). Le contour est obtenu par dilatation du masque du texte (voir outline).
+    """
+
+    def __init__(self, font: pygame.font.Font, outline_color: tuple = None, outline_thickness: int = 0,
+                 background_color: tuple = None, padding: int = 0, **anchor) -> None:
+        """
+        Initialise un texte.
+        :param font: la police (voir TextCache.get_font)
+        :param outline_color: couleur du contour (aucun contour si None)
+        :param outline_thickness: épaisseur (en pixels) du contour
+        :param background_color: couleur du fond (fond transparent si None)
+        :param padding: marge (en pixels) entre le fond et le texte
+        :param anchor: position de l'image, comme pour Surface.get_rect (par exemple center=(640, 670))
+        """
+        super(TextSprite, self).__init__()
+
+        self._font = font
+        self._outline_color = outline_color
+        self._outline_thickness = outline_thickness if outline_color else 0
+        self._background_color = background_color
+        self._padding = padding
+        self._anchor = anchor
+
+        self._segments = None
+        self._alpha = 255
+        self.image = pygame.Surface((0, 0), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(**anchor)
+
+    @property
+    def margin(self) -> int:
+        """ Espace (en pixels) entre le bord de l'image et le texte (marge du fond et contour). """
+        return self._padding + self._outline_thickness
+
+    def set_text(self, *segments: tuple) -> None:
+        """
+        Change le texte. L'image n'est reconstruite que si les segments ont changé.
+        :param segments: paires (texte, couleur), affichées de gauche à droite
+        """
+        if segments == self._segments:
+            return
+        self._segments = segments
+
+        # les segments sont d'abord assemblés en une seule ligne de texte
+        texts = [TextCache().render(self._font, text, color) for text, color in segments]
+        run = pygame.Surface((sum(text.get_width() for text in texts),
+                              max((text.get_height() for text in texts), default=0)), pygame.SRCALPHA)
+        x = 0
+        for text in texts:
+            run.blit(text, (x, 0))
+            x += text.get_width()
+
+        margin = self.margin
+        self.image = pygame.Surface((run.get_width() + 2 * margin, run.get_height() + 2 * margin), pygame.SRCALPHA)
+        if self._background_color:
+            self.image.fill(self._background_color)
+        if self._outline_color:
+            self.image.blit(outline(run, self._outline_color, self._outline_thickness), (self._padding, self._padding))
+        self.image.blit(run, (margin, margin))
+
+        self.image.set_alpha(self._alpha)
+        self.rect = self.image.get_rect(**self._anchor)
+
+    def set_alpha(self, alpha: int) -> None:
+        """
+        Change l'opacité du texte (sans reconstruire l'image).
+        :param alpha: opacité, de 0 (transparent) à 255 (opaque)
+        """
+        if alpha != self._alpha:
+            self._alpha = alpha
+            self.image.set_alpha(alpha)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """
+        Dessine le texte.
+        :return: la zone de la surface modifiée
+        """
+        return surface.blit(self.image, self.rect)
+
+
+def outline(surface: pygame.Surface, color: tuple, thickness: int) -> pygame.Surface:
+    """
+    Construit le contour d'une image (par exemple, un texte) par dilatation de son masque.
+    :param surface: l'image (avec transparence)
+    :param color: couleur du contour
+    :param thickness: épaisseur (en pixels) du contour
+    :return: une surface plus grande de 2 * thickness pixels dans chaque dimension ; l'image y est centrée
+    """
+    # la convolution par un carré plein de côté 2 * thickness + 1 étend chaque pixel dans toutes les directions
+    kernel = pygame.Mask((2 * thickness + 1, 2 * thickness + 1), fill=True)
+    dilated = pygame.mask.from_surface(surface, 1).convolve(kernel)
+    return dilated.to_surface(setcolor=color, unsetcolor=(0, 0, 0, 0))
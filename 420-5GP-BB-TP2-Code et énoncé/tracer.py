@@ -0,0 +1,122 @@
+"""
+  Traceur de la chronologie du démarrage.
+
+  Les étapes à mesurer sont délimitées par des intervalles (Tracer().span(...) ou le décorateur @traced). Lorsque la
+  variable d'environnement SPACE_TAXI_TRACE contient un nom de fichier, les intervalles sont enregistrés puis écrits
+  à la fin du programme au format Trace Event de Chrome (à ouvrir dans chrome://tracing ou ui.perfetto.dev).
+  Autrement, le traceur est inactif et ne coûte presque rien.
+
+  Exemple :  SPACE_TAXI_TRACE=startup.json python space_taxi.py
+"""
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable
+
+ENVIRONMENT_VARIABLE = "SPACE_TAXI_TRACE"
+
+
+class Tracer:
+    """ Singleton pour l'enregistrement des intervalles de temps. """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(Tracer, cls).__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, '_initialized'):
+            self._filename = os.environ.get(ENVIRONMENT_VARIABLE) or None
+            self._origin = time.perf_counter_ns()
+            self._events = []
+            self._threads = {}  # identifiant de thread -> nom
+            self._lock = threading.Lock()
+            self._disabled_span = contextlib.nullcontext()
+
+            if self._filename:
+                atexit.register(self.save)
+
+            self._initialized = True
+
+    def is_enabled(self) -> bool:
+        return self._filename is not None
+
+    def span(self, name: str, category: str = "startup") -> contextlib.AbstractContextManager:
+        """
+        Délimite un intervalle de temps.
+        :param name: nom de l'intervalle (affiché dans la chronologie)
+        :param category: catégorie de l'intervalle
+        :return: un gestionnaire de contexte
+        """
+        if self._filename is None:
+            return self._disabled_span
+        return self._record(name, category)
+
+    def instant(self, name: str, category: str = "startup") -> None:
+        """
+        Marque un instant dans la chronologie (par exemple, l'affichage de la première trame).
+        :param name: nom de l'instant
+        :param category: catégorie de l'instant
+        """
+        if self._filename is None:
+            return
+        thread = threading.current_thread()
+        self._add({'name': name, 'cat': category, 'ph': 'i', 's': 'g', 'tid': thread.ident,
+                   'ts': (time.perf_counter_ns() - self._origin) / 1000}, thread)
+
+    def save(self) -> None:
+        """ Écrit les intervalles enregistrés dans le fichier de trace (sans effet si le traceur est inactif). """
+        if self._filename is None:
+            return
+
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+
+        pid = os.getpid()
+        metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                    for tid, name in threads.items()]
+        trace = {'traceEvents': metadata + [dict(event, pid=pid) for event in events],
+                 'displayTimeUnit': 'ms'}
+        with open(self._filename, "w") as file:
+            json.dump(trace, file)
+
+    @contextlib.contextmanager
+    def _record(self, name: str, category: str):
+        thread = threading.current_thread()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            # événement complet (ph « X ») : début et durée en microsecondes
+            self._add({'name': name, 'cat': category, 'ph': 'X', 'tid': thread.ident,
+                       'ts': (start - self._origin) / 1000, 'dur': (end - start) / 1000}, thread)
+
+    def _add(self, event: dict, thread: threading.Thread) -> None:
+        with self._lock:
+            self._events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+
+def traced(name: str = None, category: str = "startup") -> Callable:
+    """
+    Décorateur qui enregistre chaque appel de la fonction décorée comme un intervalle.
+    :param name: nom de l'intervalle (par défaut, le nom qualifié de la fonction)
+    :param category: catégorie de l'intervalle
+    """
+    def decorator(function: Callable) -> Callable:
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with Tracer().span(span_name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,93 @@
+import pygame
+
+from game_clock import GameClock
+from scene import Scene
+
+
+class Transition:
+    """
+    Transition graduelle entre deux scènes.
+
+    La scène sortante est rendue une seule fois dans un instantané (snapshot) figé ; à chaque trame, seule la scène
+    entrante est rendue, puis l'instantané y est mélangé selon le mode de transition.
+    """
+
+    CROSSFADE = "crossfade"            # fondu enchaîné
+    FADE_THROUGH_BLACK = "black"       # fondu au noir de la scène sortante, puis de la scène entrante
+    WIPE = "wipe"                      # balayage de gauche à droite
+
+    def __init__(self, source: Scene | None, target: Scene, clock: GameClock, duration: int = 0,
+                 mode: str = CROSSFADE) -> None:
+        """
+        Initialise une transition.
+        :param source: la scène sortante (None s'il n'y en a pas)
+        :param target: la scène entrante
+        :param clock: l'horloge du jeu
+        :param duration: durée en millisecondes de temps du jeu (0 = instantané)
+        :param mode: CROSSFADE, FADE_THROUGH_BLACK ou WIPE
+        """
+        if mode not in (Transition.CROSSFADE, Transition.FADE_THROUGH_BLACK, Transition.WIPE):
+            raise ValueError(f"Mode de transition inconnu : {mode!r}")
+
+        self._source = source
+        self._target = target
+        self._duration = duration
+        self._mode = mode
+
+        self._snapshot = None
+        self._clock = clock
+        self._start_time = clock.ticks()
+
+    def progress(self) -> float:
+        """
+        Retourne l'avancement de la transition.
+        :return: fraction entre 0.0 (début) et 1.0 (terminée)
+        """
+        if self._duration <= 0:
+            return 1.0
+        return min(1.0, (self._clock.ticks() - self._start_time) / self._duration)
+
+    def is_done(self) -> bool:
+        return self.progress() >= 1.0
+
+    def render(self, screen: pygame.Surface, interpolation: float = 1.0) -> None:
+        """
+        Effectue le rendu de la transition (tout l'écran est redessiné).
+        :param screen: écran (surface sur laquelle effectuer le rendu)
+        :param interpolation: position de l'affichage de la scène entrante entre ses deux derniers pas de simulation
+        """
+        if self._source is None:
+            self._render_target(screen, interpolation)
+            return
+
+        if self._snapshot is None:
+            self._snapshot = pygame.Surface(screen.get_size()).convert()
+            self._source.invalidate()
+            self._source.render(self._snapshot)
+
+        progress = self.progress()
+        if self._mode == Transition.CROSSFADE:
+            self._render_target(screen, interpolation)
+            self._snapshot.set_alpha(round(255 * (1.0 - progress)))
+            screen.blit(self._snapshot, (0, 0))
+
+        elif self._mode == Transition.FADE_THROUGH_BLACK:
+            # première moitié : la scène sortante s'assombrit ; seconde moitié : la scène entrante s'éclaircit
+            if progress < 0.5:
+                screen.blit(self._snapshot, (0, 0))
+                brightness = round(255 * (1.0 - 2 * progress))
+            else:
+                self._render_target(screen, interpolation)
+                brightness = round(255 * (2 * progress - 1.0))
+            if brightness < 255:
+                screen.fill((brightness, brightness, brightness), special_flags=pygame.BLEND_MULT)
+
+        else:
+            self._render_target(screen, interpolation)
+            x = round(screen.get_width() * progress)
+            screen.blit(self._snapshot, (x, 0), pygame.Rect(x, 0, screen.get_width() - x, screen.get_height()))
+
+    def _render_target(self, screen: pygame.Surface, interpolation: float) -> None:
+        # l'instantané recouvre l'écran à chaque trame : la scène entrante doit tout redessiner
+        self._target.invalidate()
+        self._target.render(screen, interpolation)